@@ -1,6 +1,10 @@
 import streamlit as st
 from streamlit.components.v1 import html
-from services.api_service import get_api_service, handle_api_error, show_backend_config, test_backend_connection
+from services.api_service import get_api_service, handle_api_error, show_as_of, show_backend_config, show_stale_notice, test_backend_connection
+from services.aggregates import EMPTY_AGGREGATES
+from services.data_cache import jobs_by_id
+from services.ingestion import Verdict, parse_application_date
+from services.sync_worker import get_snapshot, get_sync_worker
 
 # --- Global Configuration and Session State Management ---
 st.set_page_config(layout="wide", page_title="AI Resume Relevance Checker", page_icon="🤖")
@@ -21,20 +25,14 @@ if "show_application_feedback" not in st.session_state:
     st.session_state.show_application_feedback = False
 if "selected_job" not in st.session_state:
     st.session_state.selected_job = None
+if "selected_job_id" not in st.session_state:
+    st.session_state.selected_job_id = None
 if "backend_url" not in st.session_state:
     st.session_state.backend_url = "https://innomaticshackathonbackend-production.up.railway.app"  # Default backend URL
 if "use_backend" not in st.session_state:
     st.session_state.use_backend = True  # Toggle between backend and mock data
 if "jobs_data" not in st.session_state:
-    st.session_state.jobs_data = {}  # Initialize jobs data
-
-# Clear any cached API service with old URL
-if hasattr(st, '_legacy_caching') or hasattr(st.cache_data, 'clear'):
-    try:
-        from services.api_service import get_api_service
-        get_api_service.clear()  # Clear cached API service
-    except:
-        pass  # Ignore if cache clearing fails
+    st.session_state.jobs_data = {}  # Initialize jobs data (keyed by job_key)
 
 # Auto-sync from backend if enabled and not already synced
 if "backend_synced" not in st.session_state:
@@ -43,27 +41,12 @@ if "backend_synced" not in st.session_state:
 if st.session_state.use_backend and not st.session_state.backend_synced:
     # Try to sync jobs from backend on first load
     try:
-        api_service = get_api_service()
-        result = api_service.get_jobs()
+        result = get_snapshot().normalized_jobs
         if not handle_api_error(result, "Initial backend sync failed", show_error=False):
             # Clear mock data and load backend data
             st.session_state.jobs_data = {}
-            if isinstance(result, list) and len(result) > 0:
-                backend_jobs = {}
-                for job in result:
-                    job_title = job.get("job_title", "Unknown Job")
-                    backend_jobs[job_title] = {
-                        "title": job_title,
-                        "department": job.get("department", "Engineering"),
-                        "description": job.get("description", ""),
-                        "requirements": job.get("requirements", "").split('\n') if isinstance(job.get("requirements"), str) else [],
-                        "applicants": 0,
-                        "avg_score": 0,
-                        "id": job.get("id"),
-                        "posted_date": job.get("posted_date"),
-                        "is_active": job.get("is_active", True)
-                    }
-                st.session_state.jobs_data = backend_jobs
+            if len(result) > 0:
+                st.session_state.jobs_data = jobs_by_id(result)
                 st.session_state.backend_synced = True
     except Exception as e:
         # If backend sync fails, keep using mock data
@@ -79,47 +62,13 @@ def sync_jobs_from_backend():
         return
     
     try:
-        api_service = get_api_service()
-        result = api_service.get_jobs()
+        # Jobs are synced and normalized in the background and shared by every session
+        result = get_snapshot().normalized_jobs
         
         if not handle_api_error(result, "Failed to fetch jobs from backend"):
-            # Backend returns a list of jobs directly
-            if isinstance(result, list):
-                backend_jobs = {}
-                for job in result:
-                    # Convert backend format to frontend format
-                    job_title = job.get("job_title", "Unknown Job")
-                    backend_jobs[job_title] = {
-                        "title": job_title,
-                        "department": job.get("department", "Engineering"),
-                        "description": job.get("description", ""),
-                        "requirements": job.get("requirements", "").split('\n') if isinstance(job.get("requirements"), str) else [],
-                        "applicants": 0,  # Backend doesn't provide this yet
-                        "avg_score": 0,   # Backend doesn't provide this yet
-                        "id": job.get("id"),
-                        "posted_date": job.get("posted_date"),
-                        "is_active": job.get("is_active", True)
-                    }
-                st.session_state.jobs_data.update(backend_jobs)
-                print(f"Synced {len(backend_jobs)} jobs from backend")
-            elif "jobs" in result:
-                # Handle if backend wraps jobs in an object
-                backend_jobs = {}
-                for job in result["jobs"]:
-                    job_title = job.get("job_title", "Unknown Job")
-                    backend_jobs[job_title] = {
-                        "title": job_title,
-                        "department": job.get("department", "Engineering"),
-                        "description": job.get("description", ""),
-                        "requirements": job.get("requirements", "").split('\n') if isinstance(job.get("requirements"), str) else [],
-                        "applicants": 0,
-                        "avg_score": 0,
-                        "id": job.get("id"),
-                        "posted_date": job.get("posted_date"),
-                        "is_active": job.get("is_active", True)
-                    }
-                st.session_state.jobs_data.update(backend_jobs)
-                print(f"Synced {len(backend_jobs)} jobs from backend")
+            backend_jobs = jobs_by_id(result)
+            st.session_state.jobs_data.update(backend_jobs)
+            print(f"Synced {len(backend_jobs)} jobs from backend")
     except Exception as e:
         st.error(f" Backend sync error: {str(e)}")
 
@@ -137,22 +86,19 @@ def create_job_on_backend(job_data):
         if handle_api_error(result, "Failed to create job on backend"):
             return False
         
+        get_sync_worker().add_job(result)
         st.success("Job created successfully on backend!")
         return True
     except Exception as e:
         st.error(f" Backend error: {str(e)}")
         return False
 
-def submit_application_to_backend(job_title, resume_file, candidate_data=None):
+def submit_application_to_backend(job_title, job_id, resume_file, candidate_data=None):
     """Submit job application to backend"""
     if not st.session_state.use_backend:
         return {"score": 75, "status": "success"}  # Mock response
     
     try:
-        # Get job ID from jobs data
-        job_data = st.session_state.jobs_data.get(job_title, {})
-        job_id = job_data.get("id")
-        
         if not job_id:
             st.error(f" Job ID not found for '{job_title}'. Please refresh jobs from backend.")
             return None
@@ -163,6 +109,7 @@ def submit_application_to_backend(job_title, resume_file, candidate_data=None):
         if handle_api_error(result, "Failed to submit application to backend"):
             return None
         
+        get_sync_worker().add_application(job_id, result, getattr(resume_file, 'name', None))
         return result
     except Exception as e:
         st.error(f" Backend error: {str(e)}")
@@ -292,9 +239,12 @@ def get_tag_html(score, verdict=None):
             return '<span>Low Fit</span>'
     
     # Fallback to score-based calculation
-    if score >= 80: return '<span>High Fit</span>'
-    if score >= 60: return '<span>Medium Fit</span>'
-    return '<span>Low Fit</span>'
+    return f'<span>{get_fit_label(score)}</span>'
+
+def get_fit_label(score):
+    if score >= 80: return 'High Fit'
+    if score >= 60: return 'Medium Fit'
+    return 'Low Fit'
 
 def render_score_circle(score, color=None):
     st.metric(label="Relevance Score", value=f"{score}%")
@@ -449,12 +399,12 @@ def view_details_modal(candidate_data):
                 
             with col3b:
                 if candidate_data.get('application_date'):
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(candidate_data['application_date'].replace('Z', '+00:00'))
+                    # Records carry the date parsed at ingestion; session dicts are parsed here
+                    dt = getattr(candidate_data, 'applied_at', None) or parse_application_date(candidate_data['application_date'])
+                    if dt is not None:
                         formatted_date = dt.strftime('%B %d, %Y at %I:%M %p')
                         st.write(f"**Applied:** {formatted_date}")
-                    except:
+                    else:
                         st.write(f"**Applied:** {candidate_data['application_date']}")
                 
                 st.write(f"**Relevance Score:** {candidate_data.get('score', 0)}/100")
@@ -498,8 +448,7 @@ def view_details_modal(candidate_data):
             st.subheader("Score Comparison")
             
             # Get the job data for comparison
-            job_data = JOBS_DATA.get(candidate_data.get('job_role', 'Unknown'), {})
-            avg_score = job_data.get('avg_score', 0)
+            _, avg_score = get_job_stats(candidate_data.get('job_role', 'Unknown'), {'id': candidate_data.get('job_id')})
             candidate_score = candidate_data.get('score', 0)
             
             # Candidate score bar
@@ -538,8 +487,7 @@ def view_details_modal(candidate_data):
         st.subheader("Score Comparison")
         
         # Get the job data for comparison
-        job_data = JOBS_DATA.get(candidate_data['job_role'], {})
-        avg_score = job_data.get('avg_score', 0)
+        _, avg_score = get_job_stats(candidate_data['job_role'], {'id': candidate_data.get('job_id')})
         
         # Candidate score bar
         st.write(f"**Candidate Score**")
@@ -559,6 +507,21 @@ def view_details_modal(candidate_data):
         elif st.session_state.role == "candidate":
             st.info("This candidate scores exactly at the average.")
 
+def job_key(job_title, job_data):
+    """Key of a job in st.session_state.jobs_data: its backend id, or its title if it was only created locally"""
+    return job_data.get('id') or job_title
+
+def get_job_stats(job_title, job_data):
+    """Applicant count and average score for a job from the snapshot's aggregate table, falling back to job_data"""
+    try:
+        aggregate = get_snapshot().aggregates.find(job_data.get('id'), job_title)
+    except Exception as e:
+        print(f"Could not read job aggregates: {str(e)}")
+        aggregate = None
+    if aggregate is None:
+        return job_data.get('applicants', 0), job_data.get('avg_score', 0)
+    return aggregate.applicants, aggregate.avg_score
+
 @st.dialog("Job Details")
 def job_details_modal(job_title, job_data):
     # Back button
@@ -594,7 +557,7 @@ def job_details_modal(job_title, job_data):
         uploaded_file = st.file_uploader(
             "Choose a file",
             type=['txt', 'pdf', 'docx'],
-            key=f"resume_upload_{job_title}",
+            key=f"resume_upload_{job_key(job_title, job_data)}",
             label_visibility="collapsed"
         )
         
@@ -606,20 +569,20 @@ def job_details_modal(job_title, job_data):
         st.markdown("<br>", unsafe_allow_html=True)
         
         # Enhanced Get Feedback button
-        if st.button(" Get Feedback", type="primary", use_container_width=True, key=f"get_feedback_{job_title}"):
+        if st.button(" Get Feedback", type="primary", use_container_width=True, key=f"get_feedback_{job_key(job_title, job_data)}"):
             if uploaded_file:
                 # Prepare candidate data
                 candidate_data = {
-                    'name': f"Candidate {st.session_state.jobs_data[job_title]['applicants'] + 1}",
+                    'name': f"Candidate {job_data.get('applicants', 0) + 1}",
                     'job_role': job_title,
                 }
                 
                 # Submit application to backend if enabled
-                backend_result = submit_application_to_backend(job_title, uploaded_file, candidate_data)
+                backend_result = submit_application_to_backend(job_title, job_data.get('id'), uploaded_file, candidate_data)
                 
                 # Update the applicant count in session state
-                if job_title in st.session_state.jobs_data:
-                    st.session_state.jobs_data[job_title]['applicants'] += 1
+                if job_key(job_title, job_data) in st.session_state.jobs_data:
+                    st.session_state.jobs_data[job_key(job_title, job_data)]['applicants'] += 1
                     
                     # Create a new candidate record for tracking
                     score = backend_result.get('relevance_score', 75) if backend_result else 75
@@ -665,8 +628,9 @@ def job_details_modal(job_title, job_data):
         
         # Enhanced statistics section
         st.subheader("Application Stats")
-        st.write(f"Total Applications: {job_data['applicants']}")
-        st.write(f"Average Score: {job_data['avg_score']}")
+        applicants, avg_score = get_job_stats(job_title, job_data)
+        st.write(f"Total Applications: {applicants}")
+        st.write(f"Average Score: {avg_score}")
 
 @st.dialog("Create New Job Posting")
 def create_job_posting_modal():
@@ -853,8 +817,8 @@ def create_job_posting_modal():
                     'avg_score': 0
                 }
                 
-                # Add the new job to session state jobs_data (local storage)
-                st.session_state.jobs_data[job_title] = job_data
+                # Add the new job to session state jobs_data (local storage; no backend id yet)
+                st.session_state.jobs_data[job_key(job_title, job_data)] = job_data
                 
                 # Try to create job on backend if enabled
                 backend_success = create_job_on_backend(job_data)
@@ -921,13 +885,12 @@ def application_feedback_modal(app_data):
                             st.write(f"**Resume File:** {app_data['resume_filename']}")
                     with col2b:
                         if app_data.get('application_date'):
-                            from datetime import datetime
-                            try:
-                                # Parse the datetime string and format it nicely
-                                dt = datetime.fromisoformat(app_data['application_date'].replace('Z', '+00:00'))
+                            # Parse the datetime string and format it nicely
+                            dt = parse_application_date(app_data['application_date'])
+                            if dt is not None:
                                 formatted_date = dt.strftime('%B %d, %Y at %I:%M %p')
                                 st.write(f"**Applied:** {formatted_date}")
-                            except:
+                            else:
                                 st.write(f"**Applied:** {app_data['application_date']}")
         
         with tab2:
@@ -1047,17 +1010,27 @@ def render_header(title, subtitle, avatar_url=None):
 
 
 # --- PAGES ---
-def recruiter_dashboard_page():
+DASHBOARD_METRICS_REFRESH_SECONDS = 15  # Auto-refresh tick for the dashboard metric cards
+
+@st.fragment(run_every=DASHBOARD_METRICS_REFRESH_SECONDS)
+def dashboard_metrics_cards():
+    """Metric cards rendered from the current snapshot; the sync worker refreshes metrics in the background"""
     try:
-        render_header("Dashboard", "Recruiter View", "https://i.pravatar.cc/40?u=recruiter")
-        
-        st.subheader(" Dashboard Overview")
-        
-        # Get metrics from backend
-        api_service = get_api_service()
-        backend_metrics = api_service.get_metrics()
-        
-        if "error" in backend_metrics:
+        snapshot = get_snapshot()
+        backend_metrics = snapshot.get("metrics")
+        show_stale_notice(backend_metrics)
+        
+        if "error" in backend_metrics and len(snapshot.columns):
+            # Aggregate the synced applications instead while metrics are unavailable
+            st.info("Metrics endpoint unavailable - showing figures computed from synced applications.")
+            columns = snapshot.columns
+            metrics_data = {
+                "Total Candidates": len(columns),
+                "Open Positions": len([job for job in snapshot.store.get_jobs() if job.get("is_active", True)]),
+                "High-Fit Candidates": columns.verdict_counts()[Verdict.HIGH],
+                "Avg. Score": int(columns.mean_score())
+            }
+        elif "error" in backend_metrics:
             st.error(f"Could not load dashboard metrics: {backend_metrics.get('error', 'Unknown error')}")
             st.info("Displaying demo data while backend is unavailable.")
             
@@ -1076,10 +1049,10 @@ def recruiter_dashboard_page():
                 "High-Fit Candidates": backend_metrics.get("high_fit_candidates", 0),
                 "Avg. Score": int(backend_metrics.get("avg_score", 0))
             }
+            show_as_of("Metrics", snapshot.synced_at.get("metrics"))
     except Exception as e:
         st.error(f"Error loading dashboard: {str(e)}")
         # Always provide fallback content
-        st.subheader(" Dashboard Overview")
         st.info("Using demo data due to loading error.")
         metrics_data = {
             "Total Candidates": 10,
@@ -1094,43 +1067,54 @@ def recruiter_dashboard_page():
     with col3: st.metric("High-Fit Candidates", metrics_data["High-Fit Candidates"])
     with col4: st.metric("Avg. Score", metrics_data["Avg. Score"])
 
+def recruiter_dashboard_page():
+    page_data = {}
+    render_header("Dashboard", "Recruiter View", "https://i.pravatar.cc/40?u=recruiter")
+    
+    st.subheader(" Dashboard Overview")
+    dashboard_metrics_cards()
+    
+    aggregates = EMPTY_AGGREGATES
+    try:
+        # Read recent candidates and jobs from the current shared snapshot
+        snapshot = get_snapshot()
+        aggregates = snapshot.aggregates
+        page_data = snapshot.page_data(include=("candidates", "jobs"))
+        show_stale_notice(*page_data.values())
+    except Exception as e:
+        st.error(f"Error loading dashboard: {str(e)}")
+
     col1, col2 = st.columns([2, 1])
     with col1:
         st.subheader("Recent Candidates")
         
-        # Get recent candidates from backend
-        backend_candidates = api_service.get_candidates(limit=5)
+        # Recent candidates were fetched alongside the metrics
+        backend_candidates = page_data.get("candidates", {"error": "Candidates not loaded"})
+        candidates = []
         if "error" in backend_candidates:
             st.write("No candidates data available")
         else:
             candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
             for i, app in enumerate(candidates[:5]):
-                # Use candidate name from backend API response - check multiple possible fields
-                candidate_name = (app.get('candidate_name') or 
-                                 app.get('applicant_name') or 
-                                 app.get('name') or 
-                                 f"Candidate {app.get('id', 'Unknown')}")
-                job_title = app.get('job_role', 'Unknown Position')
-                score = app.get('score', 0)
-                
-                st.markdown(f"**{candidate_name}** - {job_title} ({score}%) - {get_tag_html(score)}", unsafe_allow_html=True)
+                st.markdown(f"**{app.name}** - {app.job_role} ({app.score}%) - {get_tag_html(app.score)}", unsafe_allow_html=True)
                 
                 
     with col2:
         st.subheader("Active Job Postings")
         
-        # Get jobs from backend
-        backend_jobs = api_service.get_jobs()
+        # Jobs were fetched alongside the metrics
+        backend_jobs = page_data.get("jobs", {"error": "Jobs not loaded"})
         if "error" in backend_jobs:
             st.write("No jobs data available")
         else:
             jobs = backend_jobs if isinstance(backend_jobs, list) else backend_jobs.get("jobs", [])
             for i, job in enumerate(jobs):
                 job_title = job.get('job_title', 'Unknown Job')
-                applications_count = len([app for app in candidates if app.get('job_id') == job.get('id')])
+                applications_count = aggregates.for_job(job.get('id')).applicants
                 
                 if st.button(f"{job_title} ({applications_count} applicants)", key=f"dash_job_{i}", use_container_width=True):
                     st.session_state.selected_job = job_title
+                    st.session_state.selected_job_id = job.get('id')
                     st.session_state.page = "job_applicants"
                     st.rerun()
                 
@@ -1146,33 +1130,29 @@ def recruiter_job_postings_page():
     st.subheader("Active Job Postings")
     
     # Get backend data for real-time applicant counts and scores
-    api_service = get_api_service()
-    backend_jobs = api_service.get_jobs()
-    backend_candidates = api_service.get_candidates()
+    snapshot = get_snapshot()
+    page_data = snapshot.page_data(include=("jobs", "candidates"))
+    backend_jobs = page_data["jobs"]
+    backend_candidates = page_data["candidates"]
+    show_stale_notice(backend_jobs, backend_candidates)
     
     # Combine session data with backend data for complete job information
     cols = st.columns(2)
     
     if "error" not in backend_jobs:
-        # Use backend jobs data
+        # Use backend jobs data, with applicant stats from the snapshot's per-job aggregates
         jobs = backend_jobs if isinstance(backend_jobs, list) else backend_jobs.get("jobs", [])
-        candidates = []
-        if "error" not in backend_candidates:
-            candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
+        aggregates = snapshot.aggregates
         
         for i, job in enumerate(jobs):
             with cols[i % 2]:
                 job_title = job.get('job_title', 'Unknown Job')
                 job_department = job.get('department', 'Unknown Department')
                 
-                # Calculate real applicant count and average score from backend data
-                job_applicants = [c for c in candidates if c.get('job_id') == job.get('id')]
-                applicant_count = len(job_applicants)
-                
-                if job_applicants:
-                    avg_score = round(sum(c.get('score', 0) for c in job_applicants) / len(job_applicants))
-                else:
-                    avg_score = 0
+                # Real applicant count and average score from backend data
+                aggregate = aggregates.for_job(job.get('id'))
+                applicant_count = aggregate.applicants
+                avg_score = aggregate.avg_score
                 
                 st.subheader(job_title)
                 st.write(f"Department: {job_department}")
@@ -1181,115 +1161,219 @@ def recruiter_job_postings_page():
                 
                 if st.button(f"View {job_title} Applicants", key=f"job_card_click_{i}", use_container_width=True, type="primary"):
                     st.session_state.selected_job = job_title
+                    st.session_state.selected_job_id = job.get('id')
                     st.session_state.page = "job_applicants"
                     st.rerun()
                 
                 # Use job data from session state for job details modal if available, otherwise use backend data
-                job_details_data = st.session_state.jobs_data.get(job_title, {
+                job_details_data = st.session_state.jobs_data.get(job.get('id'), {
+                    'title': job_title,
                     'department': job_department,
                     'description': job.get('description', 'No description available'),
                     'requirements': job.get('requirements', []),
                     'applicants': applicant_count,
-                    'avg_score': avg_score
+                    'avg_score': avg_score,
+                    'id': job.get('id')
                 })
                 
                 if st.button(f"View Job Details", key=f"job_details_{i}", type="secondary", use_container_width=True):
                     job_details_modal(job_title, job_details_data)
     else:
         # Fallback to session state data if backend is unavailable
-        for i, (job_title, data) in enumerate(st.session_state.jobs_data.items()):
+        for i, data in enumerate(st.session_state.jobs_data.values()):
             with cols[i % 2]:
+                job_title = data['title']
+                applicants, avg_score = get_job_stats(job_title, data)
                 st.subheader(job_title)
                 st.write(f"Department: {data['department']}")
-                st.write(f"Applicants: {data['applicants']}")
-                st.write(f"Avg. Score: {data['avg_score']}")
+                st.write(f"Applicants: {applicants}")
+                st.write(f"Avg. Score: {avg_score}")
                 
                 if st.button(f"View {job_title} Applicants", key=f"job_card_click_{i}", use_container_width=True, type="primary"):
                     st.session_state.selected_job = job_title
+                    st.session_state.selected_job_id = data.get('id')
                     st.session_state.page = "job_applicants"
                     st.rerun()
                 
                 if st.button(f"View Job Details", key=f"job_details_{i}", type="secondary", use_container_width=True):
                     job_details_modal(job_title, data)
 
+# === PAGINATION ===
+
+PAGE_SIZE_OPTIONS = [10, 25, 50, 100]
+
+def page_window(key, total=None, default_page_size=25, reset_on=None):
+    """
+    Current (skip, limit) window of a paginated list
+    
+    Page number and page size live in session state under f"{key}_page" and
+    f"{key}_page_size". The page goes back to 1 when reset_on (e.g. the
+    active filters) changes and is clamped to the last page when total is known.
+    """
+    page_key, size_key, reset_key = f"{key}_page", f"{key}_page_size", f"{key}_page_reset_on"
+    if page_key not in st.session_state or st.session_state.get(reset_key) != reset_on:
+        st.session_state[page_key] = 1
+        st.session_state[reset_key] = reset_on
+    if size_key not in st.session_state:
+        st.session_state[size_key] = default_page_size
+    
+    page_size = st.session_state[size_key]
+    if total is not None:
+        last_page = max(1, -(-total // page_size))
+        st.session_state[page_key] = min(st.session_state[page_key], last_page)
+    return (st.session_state[page_key] - 1) * page_size, page_size
+
+def _turn_page(key, step):
+    st.session_state[f"{key}_page"] = max(1, st.session_state[f"{key}_page"] + step)
+
+def _set_page_size(key):
+    st.session_state[f"{key}_page_size"] = st.session_state[f"{key}_page_size_input"]
+    st.session_state[f"{key}_page"] = 1
+
+def pagination_controls(key, shown, total=None, has_more=False):
+    """
+    Previous/next buttons, position and page size selector below a list windowed by page_window
+    
+    Args:
+        key (str): The key passed to page_window
+        shown (int): Number of items on the current page
+        total (int): Items in the whole list, or None when only the backend knows (has_more enables Next)
+        has_more (bool): Whether a next page exists when total is None
+    """
+    page, page_size = st.session_state[f"{key}_page"], st.session_state[f"{key}_page_size"]
+    first = (page - 1) * page_size + 1
+    if total is not None:
+        last_page = max(1, -(-total // page_size))
+        has_more = page < last_page
+        position = f"Page {page} of {last_page} · {first}-{first + shown - 1} of {total}" if shown else f"Page {page} of {last_page}"
+    else:
+        position = f"Page {page} · {first}-{first + shown - 1}" if shown else f"Page {page}"
+    
+    col1, col2, col3, col4 = st.columns([1, 3, 1, 2])
+    col1.button("◀ Prev", key=f"{key}_prev", disabled=page <= 1, on_click=_turn_page, args=(key, -1))
+    col2.caption(position)
+    col3.button("Next ▶", key=f"{key}_next", disabled=not has_more, on_click=_turn_page, args=(key, 1))
+    col4.selectbox("Rows per page", PAGE_SIZE_OPTIONS, index=PAGE_SIZE_OPTIONS.index(page_size),
+                   key=f"{key}_page_size_input", on_change=_set_page_size, args=(key,),
+                   label_visibility="collapsed", format_func=lambda size: f"{size} per page")
+
+def paginated_candidate_grid(candidates, key, reset_on=None):
+    """Render one page of candidates with candidate_grid, followed by the pagination controls"""
+    skip, limit = page_window(key, total=len(candidates), reset_on=reset_on)
+    window = candidates[skip:skip + limit]
+    # A keyed selection outlives its rows, so each filter set and page gets its own grid
+    candidate_grid(window, key=f"{key}_{hash(reset_on)}_{skip}", opened_key=f"{key}_opened")
+    pagination_controls(key, len(window), total=len(candidates))
+
+def candidate_grid(candidates, key, opened_key=None):
+    """
+    Render candidates as one sortable, selectable grid; selecting a row opens view_details_modal
+    
+    Args:
+        candidates: ApplicationRecords to list
+        key (str): Widget key, unique per list of candidates (e.g. per filter set and page)
+        opened_key (str): Session key remembering the candidate whose details were opened
+            (defaults to f"{key}_opened"); share one across the pages of a list
+    """
+    st.caption("Select a row to view candidate details.")
+    event = st.dataframe(
+        {
+            "Candidate": [cand.name for cand in candidates],
+            "Job Role": [cand.job_role for cand in candidates],
+            "Score": [cand.score for cand in candidates],
+            "Verdict": [get_fit_label(cand.score) for cand in candidates],
+        },
+        key=key,
+        on_select="rerun",
+        selection_mode="single-row",
+        hide_index=True,
+        width="stretch",
+        column_config={"Score": st.column_config.ProgressColumn("Score", min_value=0, max_value=100, format="%d")}
+    )
+    
+    # The selection survives reruns - open the modal only when a different candidate gets selected
+    rows = [row for row in event.selection.rows if row < len(candidates)]
+    selected_id = candidates[rows[0]].id if rows else None
+    opened_key = opened_key or f"{key}_opened"
+    if selected_id is not None and st.session_state.get(opened_key) != selected_id:
+        st.session_state[opened_key] = selected_id
+        view_details_modal(candidates[rows[0]])
+    elif selected_id is None:
+        st.session_state[opened_key] = None
+
 def recruiter_candidates_page():
     render_header("Candidates", "Recruiter View", "https://i.pravatar.cc/40?u=recruiter")
     
     # Get candidates from backend
-    api_service = get_api_service()
-    backend_candidates = api_service.get_candidates()
+    backend_candidates = get_snapshot().get("candidates")
     
     if "error" in backend_candidates:
-        st.error(f"Could not load candidates: {backend_candidates.get('error', 'Unknown error')}")
+        # The full set is not synced - page through the backend instead; filtering needs every candidate
+        st.warning(f"Could not sync all candidates ({backend_candidates.get('error', 'Unknown error')}). "
+                   "Showing them page by page from the backend; search and filters return once the sync succeeds.")
+        st.subheader("All Candidates")
+        candidate_window_view()
         return
     
-    # Process candidates data
+    # Candidates arrive as ingested ApplicationRecords (name, verdict and date already normalized)
     candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
     
-    processed_candidates = []
-    for app in candidates:
-        backend_verdict = app.get('verdict', 'Medium')
-        if 'High' in backend_verdict:
-            verdict = 'High'
-        elif 'Medium' in backend_verdict:
-            verdict = 'Medium'
-        elif 'Low' in backend_verdict:
-            verdict = 'Low'
-        else:
-            verdict = 'Medium'
-        
-        # Use candidate name from backend API response - check multiple possible fields
-        candidate_name = (app.get('candidate_name') or 
-                         app.get('applicant_name') or 
-                         app.get('name') or 
-                         f"Candidate {app.get('id', 'Unknown')}")
-        
-        candidate = {
-            'id': app.get('id'),
-            'name': candidate_name,
-            'job_role': app.get('job_role', 'Unknown Position'),
-            'job_id': app.get('job_id'),
-            'score': app.get('score', 0),
-            'verdict': verdict,
-            'missing_skills': app.get('missing_skills', []),
-            'feedback': app.get('feedback', ''),
-            'resume_file': app.get('resume_filename', 'resume.pdf'),
-            'application_date': app.get('application_date'),
-            'application_id': app.get('id')
-        }
-        processed_candidates.append(candidate)
-    
     st.subheader("All Candidates")
     
-    col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
-    
-    search_term = col1.text_input("Search by name...", label_visibility="collapsed")
-    
     if st.session_state.use_backend:
         if "candidates_synced" not in st.session_state:
             st.session_state.candidates_synced = False
         
         st.session_state.candidates_synced = True
     
-    job_role_filter = col2.selectbox("Job Role", ["All Job Roles"] + list(set([c['job_role'] for c in processed_candidates])))
-    verdict_filter = col3.selectbox("Verdict", ["All Verdicts", "High", "Medium", "Low"])
-    
-    filtered_candidates = processed_candidates.copy()
-    
-    if search_term and search_term.strip():
-        filtered_candidates = [cand for cand in filtered_candidates 
-                             if search_term.lower().strip() in cand['name'].lower()]
+    job_roles = list(set([c.job_role for c in candidates]))
+    candidate_filters_view(get_snapshot(), job_roles)
+
+@st.fragment
+def candidate_window_view():
+    """Candidates grid fetched one skip/limit window at a time, for when the full set is not synced"""
+    skip, limit = page_window("candidates_grid")
+    window = get_sync_worker().candidate_window(skip, limit)
+    
+    if "error" in window:
+        st.error(f"Could not load candidates: {window.get('error', 'Unknown error')}")
+        return
     
-    if job_role_filter and job_role_filter != "All Job Roles":
-        filtered_candidates = [cand for cand in filtered_candidates 
-                             if cand['job_role'] == job_role_filter]
+    show_stale_notice(window)
+    candidate_grid(window["candidates"], key=f"candidates_grid_{skip}", opened_key="candidates_grid_opened")
+    pagination_controls("candidates_grid", len(window["candidates"]), window["total"], window["has_more"])
+
+# Sort options of the candidates page, mapped to QueryCache sort keys
+CANDIDATE_SORTS = {"Best match": None, "Score": "score", "Name": "name", "Newest": "newest"}
+
+@st.fragment
+def candidate_filters_view(snapshot, job_roles):
+    """
+    Filter controls and result grid of the candidates page
+    
+    Typing a search or changing a filter reruns only this fragment, querying
+    the snapshot loaded by the last full run instead of rerunning app.py.
+    Results come from the sync worker's query cache, so reruns with the same
+    filters (e.g. selecting a row) do not filter again.
+    """
+    col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
     
-    if verdict_filter and verdict_filter != "All Verdicts":
-        filtered_candidates = [cand for cand in filtered_candidates 
-                             if cand['verdict'] == verdict_filter]
+    search_term = col1.text_input("Search by name, resume or skill...", label_visibility="collapsed")
+    job_role_filter = col2.selectbox("Job Role", ["All Job Roles"] + job_roles)
+    verdict_filter = col3.selectbox("Verdict", ["All Verdicts", "High", "Medium", "Low"])
+    sort_by = col4.selectbox("Sort by", list(CANDIDATE_SORTS))
+    
+    # Search matches are ranked by the snapshot's prefix/typo-tolerant search index
+    filters = dict(
+        search=search_term,
+        role=job_role_filter if job_role_filter != "All Job Roles" else None,
+        verdict=verdict_filter if verdict_filter != "All Verdicts" else None,
+        sort=CANDIDATE_SORTS[sort_by]
+    )
+    filtered_candidates = get_sync_worker().queries.candidates(snapshot, **filters)
     active_filters = []
     if search_term and search_term.strip():
-        active_filters.append(f"Name: '{search_term}'")
+        active_filters.append(f"Search: '{search_term}'")
     if job_role_filter and job_role_filter != "All Job Roles":
         active_filters.append(f"Role: {job_role_filter}")
     if verdict_filter and verdict_filter != "All Verdicts":
@@ -1301,36 +1385,8 @@ def recruiter_candidates_page():
         st.write(f"**Showing all {len(filtered_candidates)} candidates**")
     
     if filtered_candidates:
-        header_col1, header_col2, header_col3, header_col4, header_col5 = st.columns([2, 2, 1, 2, 1])
-        header_col1.markdown("**Candidate**")
-        header_col2.markdown("**Job Role**")
-        header_col3.markdown("**Score**")
-        header_col4.markdown("**Verdict**")
-        header_col5.markdown("**Action**")
-        
-        st.markdown("---")
-        
-        for i, cand in enumerate(filtered_candidates):
-            row_col1, row_col2, row_col3, row_col4, row_col5 = st.columns([2, 2, 1, 2, 1])
-            
-            with row_col1:
-                st.write(f"**{cand['name']}**")
-            
-            with row_col2:
-                st.write(cand['job_role'])
-            
-            with row_col3:
-                st.write(cand["score"])
-            
-            with row_col4:
-                st.markdown(get_tag_html(cand['score']), unsafe_allow_html=True)
-            
-            with row_col5:
-                if st.button("View Details", key=f"view_details_table_{i}", type="secondary"):
-                    view_details_modal(cand)
-            
-            if i < len(filtered_candidates) - 1:
-                st.markdown("---")
+        # Only the current page is sent to the browser; new filters start again from page 1
+        paginated_candidate_grid(filtered_candidates, key="candidates_grid", reset_on=tuple(filters.values()))
     elif st.session_state.role == "candidate":
         st.info("No candidates match the current filter criteria. Try adjusting your search terms.")
     
@@ -1339,9 +1395,11 @@ def recruiter_reports_page():
     render_header("Reports", "Recruiter View", "https://i.pravatar.cc/40?u=recruiter")
     
     # Get metrics and candidates from backend
-    api_service = get_api_service()
-    backend_metrics = api_service.get_metrics()
-    backend_candidates = api_service.get_candidates()
+    snapshot = get_snapshot()
+    page_data = snapshot.page_data(include=("metrics", "candidates"))
+    backend_metrics = page_data["metrics"]
+    backend_candidates = page_data["candidates"]
+    show_stale_notice(backend_metrics, backend_candidates)
     
     if "error" in backend_metrics:
         st.error(f"Could not load metrics: {backend_metrics.get('error', 'Unknown error')}")
@@ -1356,41 +1414,8 @@ def recruiter_reports_page():
     avg_score = round(backend_metrics.get("avg_score", 0))
     high_fit_candidates = backend_metrics.get("high_fit_candidates", 0)
     
-    # Process candidates data for detailed analytics
-    candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
-    
-    processed_candidates = []
-    for app in candidates:
-        backend_verdict = app.get('verdict', 'Medium')
-        if 'High' in backend_verdict:
-            verdict = 'High'
-        elif 'Medium' in backend_verdict:
-            verdict = 'Medium'
-        elif 'Low' in backend_verdict:
-            verdict = 'Low'
-        else:
-            verdict = 'Medium'
-        
-        # Use candidate name from backend API response - check multiple possible fields
-        candidate_name = (app.get('candidate_name') or 
-                         app.get('applicant_name') or 
-                         app.get('name') or 
-                         f"Candidate {app.get('id', 'Unknown')}")
-        
-        candidate = {
-            'id': app.get('id'),
-            'name': candidate_name,
-            'job_role': app.get('job_role', 'Unknown Position'),
-            'job_id': app.get('job_id'),
-            'score': app.get('score', 0),
-            'verdict': verdict,
-            'missing_skills': app.get('missing_skills', []),
-            'feedback': app.get('feedback', ''),
-            'resume_file': app.get('resume_filename', 'resume.pdf'),
-            'application_date': app.get('application_date'),
-            'application_id': app.get('id')
-        }
-        processed_candidates.append(candidate)
+    # Columnar applications: every count and mean below is one vectorized group-by
+    columns = snapshot.columns
     
     # Summary Metrics
     st.subheader("Summary Metrics")
@@ -1401,9 +1426,10 @@ def recruiter_reports_page():
     
     st.subheader("Candidate Verdict Distribution")
     
-    high_count = len([c for c in processed_candidates if c['verdict'] == 'High'])
-    medium_count = len([c for c in processed_candidates if c['verdict'] == 'Medium'])
-    low_count = len([c for c in processed_candidates if c['verdict'] == 'Low'])
+    verdict_counts = columns.verdict_counts()
+    high_count = verdict_counts[Verdict.HIGH]
+    medium_count = verdict_counts[Verdict.MEDIUM]
+    low_count = verdict_counts[Verdict.LOW]
     
     st.write(f"High Fit: {high_count}")
     st.progress(high_count / total_candidates if total_candidates > 0 else 0)
@@ -1414,44 +1440,42 @@ def recruiter_reports_page():
     st.write(f"Low Fit: {low_count}")
     st.progress(low_count / total_candidates if total_candidates > 0 else 0)
     
-    st.subheader("Average Score by Job")
+    st.subheader("Score Distribution")
     
-    job_scores = {}
-    for job_title in st.session_state.jobs_data.keys():
-        candidates_for_job = [c for c in processed_candidates if c['job_role'] == job_title]
-        if candidates_for_job:
-            avg = round(sum(c['score'] for c in candidates_for_job) / len(candidates_for_job))
-            job_scores[job_title] = avg
+    histogram, edges = columns.score_histogram()
+    st.bar_chart({"Candidates": {f"{int(low)}-{int(high)}": int(count)
+                                 for low, high, count in zip(edges[:-1], edges[1:], histogram)}})
     
-    for job_title, score in job_scores.items():
-        st.write(f"**{job_title}**")
-        st.progress(score / 100.0)
+    # One row per job posting from the snapshot's per-job aggregates; postings sharing a title
+    # are told apart by their id
+    store = snapshot.store
+    job_stats = []
+    for job_id, job in store.jobs.items():
+        job_title = job.get('job_title', 'Unknown Job')
+        if len(store.job_ids_by_title.get(job_title, ())) > 1:
+            job_title = f"{job_title} (#{job_id})"
+        job_stats.append((job_title, snapshot.aggregates.for_job(job_id)))
+    
+    st.subheader("Average Score by Job")
+    
+    for job_title, aggregate in job_stats:
+        if aggregate.applicants:
+            st.write(f"**{job_title}**")
+            st.progress(aggregate.avg_score / 100.0)
     
     st.subheader("Performance by Job")
     
     st.write("This table provides detailed performance metrics for each job posting.")
     
     job_data_list = []
-    for i, job_title in enumerate(st.session_state.jobs_data.keys()):
-        candidates_for_job = [c for c in processed_candidates if c['job_role'] == job_title]
-        applicant_count = len(candidates_for_job)
-        
-        if candidates_for_job:
-            avg_score = round(sum(c['score'] for c in candidates_for_job) / len(candidates_for_job))
-            high_fit = len([c for c in candidates_for_job if c['verdict'] == 'High'])
-            medium_fit = len([c for c in candidates_for_job if c['verdict'] == 'Medium'])
-            low_fit = len([c for c in candidates_for_job if c['verdict'] == 'Low'])
-        else:
-            avg_score = 0
-            high_fit = medium_fit = low_fit = 0
-        
+    for job_title, aggregate in job_stats:
         job_data_list.append({
             "Job Title": job_title,
-            "Applicants": applicant_count,
-            "Avg. Score": avg_score,
-            "High Fit": high_fit,
-            "Medium Fit": medium_fit,
-            "Low Fit": low_fit
+            "Applicants": aggregate.applicants,
+            "Avg. Score": aggregate.avg_score,
+            "High Fit": aggregate.high_fit,
+            "Medium Fit": aggregate.medium_fit,
+            "Low Fit": aggregate.low_fit
         })
     
     st.table(job_data_list)
@@ -1520,33 +1544,13 @@ def candidate_dashboard_page():
     if st.session_state.get('use_backend', False) and len(session_applications) == 0:
         # Only try backend if no session applications (fallback scenario)
         try:
-            api_service = get_api_service()
-            backend_candidates = api_service.get_candidates()
+            backend_candidates = get_snapshot().get("candidates")
             
             if not backend_candidates.get('error'):
                 candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
                 # Transform backend data to match expected format
                 # Note: In a real app, you'd filter by user_id to show only user's applications
-                for candidate in candidates[-3:]:  # Show only last 3 as examples
-                    # Extract job title properly
-                    job_title = "Unknown Position"
-                    if candidate.get('job') and isinstance(candidate['job'], dict):
-                        job_title = candidate['job'].get('job_title', 'Unknown Position')
-                    elif candidate.get('job_title'):
-                        job_title = candidate['job_title']
-                    
-                    backend_app = {
-                        'name': f"Sample Application {candidate.get('id', 'Unknown')}",
-                        'job_role': job_title,
-                        'score': candidate.get('relevance_score', 0),
-                        'verdict': candidate.get('verdict', 'Medium'),
-                        'missing_skills': candidate.get('missing_skills', []),
-                        'feedback': candidate.get('feedback', 'Application processed successfully.'),
-                        'resume_file': candidate.get('resume_filename', 'resume.pdf'),
-                        'application_date': candidate.get('application_date', ''),
-                        'application_id': candidate.get('id')
-                    }
-                    backend_applications.append(backend_app)
+                backend_applications = candidates[-3:]  # Show only last 3 as examples
         except Exception as e:
             st.info("Could not load applications from backend.")
     
@@ -1564,8 +1568,10 @@ def candidate_dashboard_page():
         else:
             st.info(f" Showing {len(backend_applications)} sample applications from backend (for demo purposes)")
         
-        # Display applications in a nice format
-        for i, app in enumerate(all_applications):
+        # Display one page of applications in a nice format
+        skip, limit = page_window("my_applications", total=len(all_applications), default_page_size=10)
+        page_applications = all_applications[skip:skip + limit]
+        for i, app in enumerate(page_applications, start=skip):
             with st.container():
                 col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
                 
@@ -1575,12 +1581,11 @@ def candidate_dashboard_page():
                     st.caption(f"Resume: {resume_file}")
                     # Show application date if available
                     if app.get('application_date'):
-                        try:
-                            from datetime import datetime
-                            dt = datetime.fromisoformat(app['application_date'].replace('Z', '+00:00'))
+                        dt = getattr(app, 'applied_at', None) or parse_application_date(app['application_date'])
+                        if dt is not None:
                             formatted_date = dt.strftime('%b %d, %Y')
                             st.caption(f"Applied: {formatted_date}")
-                        except:
+                        else:
                             st.caption(f"Applied: {app['application_date'][:10]}")
                     elif app.get('application_id'):
                         st.caption(f"ID: {app['application_id']}")
@@ -1624,6 +1629,9 @@ def candidate_dashboard_page():
                 
                 st.divider()
         
+        if len(all_applications) > PAGE_SIZE_OPTIONS[0]:
+            pagination_controls("my_applications", len(page_applications), total=len(all_applications))
+        
         # Add summary stats
         if len(all_applications) > 1:
             avg_score = sum(app.get('score', 0) for app in all_applications) / len(all_applications)
@@ -1645,13 +1653,15 @@ def candidate_job_postings_page():
     
     cols = st.columns(2)
     
-    for i, (job_title, data) in enumerate(st.session_state.jobs_data.items()):
+    for i, data in enumerate(st.session_state.jobs_data.values()):
+        job_title = data['title']
         with cols[i % 2]:
             st.subheader(job_title)
             st.write(f"Department: {data['department']}")
             st.write(f"Description: {data['description'][:120]}...")
-            st.write(f"Applicants: {data['applicants']}")
-            st.write(f"Avg. Score: {data['avg_score']}")
+            applicants, avg_score = get_job_stats(job_title, data)
+            st.write(f"Applicants: {applicants}")
+            st.write(f"Avg. Score: {avg_score}")
             
             if st.button(f"View Details  Quick Apply", key=f"candidate_job_action_{i}", type="primary", use_container_width=True):
                 job_details_modal(job_title, data)
@@ -1669,6 +1679,7 @@ def job_applicants_page():
         if st.button(" Back to All Jobs", key="back_to_jobs"):
             st.session_state.page = "job_postings"
             st.session_state.selected_job = None
+            st.session_state.selected_job_id = None
             st.rerun()
     
     with col2:
@@ -1676,81 +1687,26 @@ def job_applicants_page():
     
     st.markdown("---")
     
-    api_service = get_api_service()
-    backend_candidates = api_service.get_candidates()
+    snapshot = get_snapshot()
+    backend_candidates = snapshot.get("candidates")
     
     if "error" in backend_candidates:
         st.error(f"Error loading candidates: {backend_candidates['error']}")
         return
     
-    candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
-    job_candidates = [cand for cand in candidates if cand.get('job_role') == job_title]
+    # Look applicants up by job id; fall back to every job posted under the title
+    queries = get_sync_worker().queries
+    job_id = st.session_state.get("selected_job_id")
+    if job_id is not None and snapshot.store.get_job(job_id) is not None:
+        job_candidates = queries.candidates(snapshot, job_id=job_id)
+    else:
+        job_candidates = queries.candidates(snapshot, role=job_title)
     
     if not job_candidates:
         st.info(f"No applicants found for {job_title}")
         return
     
-    header_col1, header_col2, header_col3, header_col4, header_col5 = st.columns([2, 2, 1, 2, 1])
-    header_col1.markdown("**Candidate**")
-    header_col2.markdown("**Job Role**")
-    header_col3.markdown("**Score**")
-    header_col4.markdown("**Verdict**")
-    header_col5.markdown("**Action**")
-    
-    st.markdown("---")
-    
-    for i, cand in enumerate(job_candidates):
-        row_col1, row_col2, row_col3, row_col4, row_col5 = st.columns([2, 2, 1, 2, 1])
-        
-        # Use candidate name from backend API response - check multiple possible fields
-        candidate_name = (cand.get('candidate_name') or 
-                         cand.get('applicant_name') or 
-                         cand.get('name') or 
-                         f"Candidate {cand.get('id', 'Unknown')}")
-        
-        job_role = cand.get('job_role', 'Unknown Position')
-        score = cand.get('score', 0)
-        verdict = cand.get('verdict', 'Medium')
-        
-        if 'High' in verdict:
-            verdict = 'High'
-        elif 'Medium' in verdict:
-            verdict = 'Medium'
-        elif 'Low' in verdict:
-            verdict = 'Low'
-        else:
-            verdict = 'Medium'
-        
-        with row_col1:
-            st.write(f"**{candidate_name}**")
-        
-        with row_col2:
-            st.write(job_role)
-        
-        with row_col3:
-            st.write(score)
-        
-        with row_col4:
-            st.markdown(get_tag_html(score), unsafe_allow_html=True)
-        
-        with row_col5:
-            if st.button("View Details", key=f"applicant_details_{i}", type="secondary"):
-                candidate_obj = {
-                    'id': cand.get('id'),
-                    'name': candidate_name,
-                    'job_role': job_role,
-                    'score': score,
-                    'verdict': verdict,
-                    'missing_skills': cand.get('missing_skills', []),
-                    'feedback': cand.get('feedback', ''),
-                    'resume_file': cand.get('resume_filename', 'resume.pdf'),
-                    'application_date': cand.get('application_date'),
-                    'application_id': cand.get('id')
-                }
-                view_details_modal(candidate_obj)
-        
-        if i < len(job_candidates) - 1:
-            st.markdown("---")
+    paginated_candidate_grid(job_candidates, key="job_applicants_grid", reset_on=(job_id, job_title))
 
 
 # --- Main App Logic ---
@@ -2,13 +2,11 @@ import streamlit as st
 import pandas as pd
 from components.shared_components import render_sidebar, render_header, render_metric_card, get_metric_svg, render_score_circle, get_tag_html
 from components.recruiter_modals import analyze_resume_modal, view_details_modal
-from backend_api_service import BackendAPIService
+from services.api_service import get_api_service
+from services.ingestion import Verdict
 
 st.set_page_config(layout="wide", page_title="Recruiter Dashboard")
 
-def get_api_service():
-    return BackendAPIService()
-
 def recruiter_dashboard_page():
     if 'selected_candidate' not in st.session_state:
         st.session_state.selected_candidate = None
@@ -37,38 +35,20 @@ def recruiter_dashboard_page():
             st.markdown('</main></div>', unsafe_allow_html=True)
             return
         
-        # Process candidates data
-        candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
+        # Candidates arrive as ingested ApplicationRecords (name, verdict and job role already resolved)
+        processed_candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
         jobs = backend_jobs if isinstance(backend_jobs, list) else backend_jobs.get("jobs", [])
         
-        # Transform candidates to consistent format
-        processed_candidates = []
-        for app in candidates:
-            # Extract candidate name from resume filename
-            resume_filename = app.get('resume_filename', '')
-            if resume_filename:
-                candidate_name = resume_filename.replace('_resume.pdf', '').replace('_', ' ').replace('.pdf', '').title()
-                if not candidate_name or candidate_name == '.Pdf':
-                    candidate_name = f"Candidate {app.get('id', 'Unknown')}"
-            else:
-                candidate_name = f"Candidate {app.get('id', 'Unknown')}"
-            
-            job_role = app.get('job', {}).get('job_title', 'Unknown Position')
-            
-            processed_candidates.append({
-                'name': candidate_name,
-                'job_role': job_role,
-                'score': app.get('relevance_score', 0),
-                'verdict': app.get('verdict', 'Medium'),
-                'id': app.get('id')
-            })
+        applicants_by_job = {}
+        for cand in processed_candidates:
+            applicants_by_job.setdefault(cand.job_id, []).append(cand)
         
         # Transform jobs to consistent format
         processed_jobs = []
         for job in jobs:
             # Count applicants for this job
-            job_applicants = [c for c in candidates if c.get('job', {}).get('job_title') == job.get('job_title', '')]
-            avg_score = sum(c.get('relevance_score', 0) for c in job_applicants) / len(job_applicants) if job_applicants else 0
+            job_applicants = applicants_by_job.get(job.get('id'), [])
+            avg_score = sum(c.score for c in job_applicants) / len(job_applicants) if job_applicants else 0
             
             processed_jobs.append({
                 'title': job.get('job_title', 'Unknown Position'),
@@ -81,8 +61,8 @@ def recruiter_dashboard_page():
         metrics_data = {
             "Total Candidates": len(processed_candidates),
             "Open Positions": len(processed_jobs),
-            "High-Fit Candidates": len([c for c in processed_candidates if c['verdict'] == 'High']),
-            "Avg. Score": int(sum(c['score'] for c in processed_candidates) / len(processed_candidates)) if processed_candidates else 0
+            "High-Fit Candidates": len([c for c in processed_candidates if c.verdict == Verdict.HIGH]),
+            "Avg. Score": int(sum(c.score for c in processed_candidates) / len(processed_candidates)) if processed_candidates else 0
         }
         
         # Summary Cards
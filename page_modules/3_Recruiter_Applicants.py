@@ -56,26 +56,8 @@ def recruiter_applicants_page():
     # Process candidates data
     candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
     
-    # Filter candidates for this job
-    filtered_candidates = []
-    for app in candidates:
-        if app.get('job', {}).get('job_title') == job_title:
-            # Extract candidate name from resume filename
-            resume_filename = app.get('resume_filename', '')
-            if resume_filename:
-                candidate_name = resume_filename.replace('_resume.pdf', '').replace('_', ' ').replace('.pdf', '').title()
-                if not candidate_name or candidate_name == '.Pdf':
-                    candidate_name = f"Candidate {app.get('id', 'Unknown')}"
-            else:
-                candidate_name = f"Candidate {app.get('id', 'Unknown')}"
-            
-            filtered_candidates.append({
-                'name': candidate_name,
-                'job_role': app.get('job', {}).get('job_title', 'Unknown Position'),
-                'score': app.get('relevance_score', 0),
-                'verdict': app.get('verdict', 'Medium'),
-                'id': app.get('id')
-            })
+    # Filter candidates for this job (records already carry the resolved name and job role)
+    filtered_candidates = [app for app in candidates if app['job_role'] == job_title]
     
     if not filtered_candidates:
         st.info(f"No applicants found for {job_title}")
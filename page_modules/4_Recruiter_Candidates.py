@@ -47,29 +47,9 @@ def recruiter_candidates_page():
     # Process candidates data
     candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
     
-    # Transform to consistent format
-    processed_candidates = []
-    job_roles = set()
-    for app in candidates:
-        # Extract candidate name from resume filename
-        resume_filename = app.get('resume_filename', '')
-        if resume_filename:
-            candidate_name = resume_filename.replace('_resume.pdf', '').replace('_', ' ').replace('.pdf', '').title()
-            if not candidate_name or candidate_name == '.Pdf':
-                candidate_name = f"Candidate {app.get('id', 'Unknown')}"
-        else:
-            candidate_name = f"Candidate {app.get('id', 'Unknown')}"
-        
-        job_role = app.get('job', {}).get('job_title', 'Unknown Position')
-        job_roles.add(job_role)
-        
-        processed_candidates.append({
-            'name': candidate_name,
-            'job_role': job_role,
-            'score': app.get('relevance_score', 0),
-            'verdict': app.get('verdict', 'Medium'),
-            'id': app.get('id')
-        })
+    # Records already carry the resolved name, job role and normalized verdict
+    processed_candidates = candidates
+    job_roles = set(app['job_role'] for app in candidates)
     
     st.markdown('<div class="table-container" style="margin-top: 24px;">', unsafe_allow_html=True)
     st.markdown('<h2 style="font-size:1.25rem; font-weight:700; color:#1E293B; margin-bottom:16px;">All Candidates</h2>', unsafe_allow_html=True)
@@ -80,7 +60,7 @@ def recruiter_candidates_page():
     verdict_filter = col3.selectbox("Verdict", ["All Verdicts", "High", "Medium", "Low"])
     
     # Apply filters
-    filtered_candidates = processed_candidates.copy()
+    filtered_candidates = list(processed_candidates)
     
     if search_term and search_term.strip():
         filtered_candidates = [c for c in filtered_candidates if search_term.lower() in c['name'].lower()]
@@ -1,9 +1,22 @@
 # File: pages/5_Recruiter_Reports.py
 import streamlit as st
-from backend_api_service import BackendAPIService
+import sys
+import os
 
-def get_api_service():
-    return BackendAPIService()
+# Add the parent directory to the path to import from the main app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from services.api_service import get_api_service
+except ImportError:
+    # Fallback if running standalone
+    def get_api_service():
+        class MockAPIService:
+            def get_jobs(self):
+                return {"error": "API service not available in standalone mode"}
+            def get_candidates(self):
+                return {"error": "API service not available in standalone mode"}
+        return MockAPIService()
 
 # Placeholder for the render_header function, which would be in your main app.
 def render_header(title, subtitle, analyze_button, avatar_url):
@@ -23,31 +36,8 @@ def recruiter_reports_page():
         st.error("Could not load reports data. Please check your backend connection.")
         return
     
-    # Process candidates data
-    candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
-    jobs = backend_jobs if isinstance(backend_jobs, list) else backend_jobs.get("jobs", [])
-    
-    # Transform candidates to consistent format
-    processed_candidates = []
-    for app in candidates:
-        # Extract candidate name from resume filename
-        resume_filename = app.get('resume_filename', '')
-        if resume_filename:
-            candidate_name = resume_filename.replace('_resume.pdf', '').replace('_', ' ').replace('.pdf', '').title()
-            if not candidate_name or candidate_name == '.Pdf':
-                candidate_name = f"Candidate {app.get('id', 'Unknown')}"
-        else:
-            candidate_name = f"Candidate {app.get('id', 'Unknown')}"
-        
-        job_role = app.get('job', {}).get('job_title', 'Unknown Position')
-        
-        processed_candidates.append({
-            'name': candidate_name,
-            'job_role': job_role,
-            'score': app.get('relevance_score', 0),
-            'verdict': app.get('verdict', 'Medium'),
-            'id': app.get('id')
-        })
+    # Records already carry the resolved name, job role and normalized verdict
+    processed_candidates = backend_candidates if isinstance(backend_candidates, list) else backend_candidates.get("candidates", [])
     
     # Calculate metrics
     total_candidates = len(processed_candidates)
@@ -0,0 +1,72 @@
+from typing import Dict, NamedTuple, Optional
+
+from services.candidate_store import EMPTY_STORE, CandidateStore
+from services.columnar import EMPTY_COLUMNS, ApplicationColumns
+
+
+class JobAggregate(NamedTuple):
+    """Applicant statistics of one job (or of every job sharing a title)"""
+
+    applicants: int = 0
+    avg_score: int = 0
+    high_fit: int = 0
+    medium_fit: int = 0
+    low_fit: int = 0
+    score_sum: float = 0.0
+
+    def merge(self, other: 'JobAggregate') -> 'JobAggregate':
+        applicants = self.applicants + other.applicants
+        score_sum = self.score_sum + other.score_sum
+        return JobAggregate(applicants, round(score_sum / applicants) if applicants else 0,
+                            self.high_fit + other.high_fit, self.medium_fit + other.medium_fit,
+                            self.low_fit + other.low_fit, score_sum)
+
+
+EMPTY_AGGREGATE = JobAggregate()
+
+
+class JobAggregates:
+    """
+    Per-job aggregate table of one data snapshot
+
+    Applicant count, average score and High/Medium/Low counts for every job,
+    computed in one pass over the columnar applications and keyed by job id
+    and by title. The sync worker builds it once per snapshot version (only
+    when jobs or candidates changed) so every page and modal reads the same
+    numbers.
+    """
+
+    def __init__(self, store: CandidateStore, columns: ApplicationColumns):
+        counts = columns.job_counts().tolist()
+        score_sums = columns.job_score_sums().tolist()
+        verdict_counts = columns.job_verdict_counts().tolist()
+
+        self.by_job_id: Dict[object, JobAggregate] = {}
+        for position, job_id in enumerate(columns.job_ids):
+            applicants, score_sum = counts[position], score_sums[position]
+            high_fit, medium_fit, low_fit = verdict_counts[position]
+            self.by_job_id[job_id] = JobAggregate(applicants, round(score_sum / applicants) if applicants else 0,
+                                                  high_fit, medium_fit, low_fit, score_sum)
+
+        self.by_title: Dict[str, JobAggregate] = {}
+        for title, job_ids in store.job_ids_by_title.items():
+            aggregate = EMPTY_AGGREGATE
+            for job_id in job_ids:
+                aggregate = aggregate.merge(self.by_job_id.get(job_id, EMPTY_AGGREGATE))
+            self.by_title[title] = aggregate
+
+    def for_job(self, job_id) -> JobAggregate:
+        return self.by_job_id.get(job_id, EMPTY_AGGREGATE)
+
+    def for_title(self, title: str) -> JobAggregate:
+        """Aggregate over every job posted under a title"""
+        return self.by_title.get(title, EMPTY_AGGREGATE)
+
+    def find(self, job_id=None, title: str = None) -> Optional[JobAggregate]:
+        """Look a job up by id, then by title; None if the snapshot does not know it"""
+        if job_id is not None and job_id in self.by_job_id:
+            return self.by_job_id[job_id]
+        return self.by_title.get(title)
+
+
+EMPTY_AGGREGATES = JobAggregates(EMPTY_STORE, EMPTY_COLUMNS)
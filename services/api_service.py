@@ -1,28 +1,276 @@
 import requests
 import streamlit as st
 import json
-from typing import Dict, List, Optional
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from services.hedging import HedgePolicy, send_hedged
+from services.ingestion import ingest_application
+from services.json_stream import iter_json_array
+from services.response_cache import DEFAULT_CACHE_MAX_ENTRIES, ResponseCache
+from services.resilience import (CircuitOpenError, RetryPolicy, get_circuit_breaker, is_stale, mark_stale,
+                                 retry_budget)
+from services.single_flight import request_group
+from services.transfer_stats import SUPPORTED_ENCODINGS, transfer_stats
+
+DEFAULT_BACKEND_URL = "https://innomaticshackathonbackend-production.up.railway.app"
+
+# Connection pool sizing for the pooled keep-alive session
+DEFAULT_POOL_CONNECTIONS = 4   # Number of per-host pools to keep
+DEFAULT_POOL_MAXSIZE = 10      # Max keep-alive connections per host
+
+# Pagination defaults for the streaming iterators
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_PAGE_WORKERS = 4       # Pages fetched concurrently
+STREAM_CHUNK_SIZE = 64 * 1024  # Bytes read from the socket per streaming step
+
+
+class BackendAPIError(Exception):
+    """Raised by the streaming helpers when the backend returns an error"""
+
+
+class BackendUnavailableError(BackendAPIError):
+    """Raised when the backend answers with a 5xx status"""
+
 
 class BackendAPIService:
     """Service class to handle all backend API communications"""
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE, cache_ttls: Optional[Dict[str, float]] = None,
+                 cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES, retry_policy: Optional[RetryPolicy] = None,
+                 hedge_policy: Optional[HedgePolicy] = None):
         """
         Initialize the API service with the backend URL
         
         Args:
             base_url (str): The base URL of your backend API (e.g., "http://192.168.1.100:8000")
+            pool_connections (int): Number of per-host connection pools to cache
+            pool_maxsize (int): Maximum keep-alive connections kept per host
+            cache_ttls (Dict): Seconds each endpoint prefix is served from cache (defaults to DEFAULT_CACHE_TTLS)
+            cache_max_entries (int): Maximum number of cached GET responses
+            retry_policy (RetryPolicy): Retry rules for transient failures (defaults to RetryPolicy())
+            hedge_policy (HedgePolicy): Enables hedged GETs when given (off by default)
         """
         self.base_url = base_url.rstrip('/')  # Remove trailing slash
         self.headers = {
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.session = self._create_session()
+        self.response_cache = ResponseCache(cache_ttls, cache_max_entries)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hedge_policy = hedge_policy
+    
+    # === CONNECTION LIFECYCLE ===
+    
+    def _create_session(self) -> requests.Session:
+        """Create a pooled keep-alive session for this backend that negotiates compressed responses"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': SUPPORTED_ENCODINGS
+        })
+        return session
+    
+    def close(self):
+        """Close all pooled connections held by this service"""
+        if self.session is not None:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def get_connection_stats(self) -> Dict:
+        """
+        Get connection reuse statistics for the pooled session
+        
+        Returns:
+            Dict: requests sent, connections opened and connections reused per host
+        """
+        stats = {"requests": 0, "connections_opened": 0, "connections_reused": 0, "hosts": {}}
+        seen_adapters = set()
+        for adapter in self.session.adapters.values():
+            if id(adapter) in seen_adapters or not hasattr(adapter, 'poolmanager'):
+                continue
+            seen_adapters.add(id(adapter))
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                host = f"{pool.scheme}://{pool.host}:{pool.port}"
+                opened = pool.num_connections
+                sent = pool.num_requests
+                stats["hosts"][host] = {
+                    "requests": sent,
+                    "connections_opened": opened,
+                    "connections_reused": max(sent - opened, 0)
+                }
+                stats["requests"] += sent
+                stats["connections_opened"] += opened
+        stats["connections_reused"] = max(stats["requests"] - stats["connections_opened"], 0)
+        return stats
+    
+    @property
+    def circuit_breaker(self):
+        """The process-wide circuit breaker guarding this backend URL"""
+        return get_circuit_breaker(self.base_url, self.session)
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the circuit breaker and retry policy
+        
+        Connection errors, timeouts and 5xx responses count as failures;
+        while the circuit is open this raises CircuitOpenError immediately.
+        Transient failures of idempotent requests are retried with jittered
+        backoff as long as the process-wide retry budget allows it.
+        """
+        breaker = self.circuit_breaker
+        retry_budget.record_request()
+        attempt = 0
+        while True:
+            breaker.before_request()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                breaker.record_failure()
+                if not (self.retry_policy.should_retry(method, attempt) and retry_budget.try_acquire()):
+                    raise
+                delay = self.retry_policy.backoff(attempt)
+            else:
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if not (self.retry_policy.should_retry(method, attempt, response) and retry_budget.try_acquire()):
+                    return response
+                delay = self.retry_policy.backoff(attempt, response)
+                response.close()
+            
+            print(f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt + 2}/{self.retry_policy.max_attempts})")
+            time.sleep(delay)
+            attempt += 1
+    
+    def _send_read(self, url: str, path: str, **kwargs) -> requests.Response:
+        """Send an idempotent GET, hedging it against tail latency if hedging is enabled"""
+        if self.hedge_policy is None:
+            return self._send('GET', url, **kwargs)
+        return send_hedged(self.hedge_policy, path, lambda: self._send('GET', url, **kwargs))
+    
+    def get_hedge_stats(self) -> Dict:
+        """Get hedged request counters (empty when hedging is disabled)"""
+        return self.hedge_policy.get_stats() if self.hedge_policy is not None else {}
+    
+    def get_retry_stats(self) -> Dict:
+        """Get process-wide retry counters and budget usage"""
+        return retry_budget.get_stats()
+    
+    def get_transfer_stats(self) -> Dict:
+        """Get process-wide bytes on the wire versus decoded bytes per endpoint"""
+        return transfer_stats.get_stats()
+    
+    def get_coalescing_stats(self) -> Dict:
+        """Get process-wide counts of GETs sent versus GETs that joined an identical in-flight request"""
+        return request_group.get_stats()
+    
+    @staticmethod
+    def _raise_for_status(response: requests.Response, endpoint: str):
+        """Raise BackendAPIError (BackendUnavailableError for 5xx) with the backend's error detail for non-2xx responses"""
+        if response.status_code < 400:
+            return
+        error_msg = f"Request to {endpoint} failed with status {response.status_code}"
+        try:
+            error_detail = response.json()
+            error_msg += f": {error_detail}"
+        except:
+            error_msg += f": {response.text}"
+        if response.status_code >= 500:
+            raise BackendUnavailableError(error_msg)
+        raise BackendAPIError(error_msg)
+    
+    @staticmethod
+    def _decode_json(response: requests.Response):
+        """Parse a JSON response body, falling back to the raw text"""
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            return {"data": response.text, "status_code": response.status_code}
+    
+    def _get(self, endpoint: str, params: Dict = None, decoder=None, timeout: int = 10):
+        """
+        GET an endpoint through the response cache
+        
+        Fresh entries are returned without touching the network; stale ones are
+        revalidated with a conditional request so an unchanged resource costs a 304.
+        Identical GETs already in flight anywhere in the process are joined
+        instead of being sent again. If the backend is unreachable, answers with
+        a 5xx or the circuit breaker is open, the last good response is returned
+        marked as stale.
+        
+        Args:
+            endpoint (str): API endpoint, optionally with a query string
+            params (Dict): Query parameters
+            decoder: Callable turning the streamed response into data (defaults to JSON)
+            timeout (int): Request timeout in seconds
+            
+        Raises:
+            BackendAPIError: If the backend answers with an error status
+            requests.exceptions.RequestException: On network failures
+        """
+        decoder = decoder or self._decode_json
+        url = f"{self.base_url}{endpoint}"
+        path = endpoint.split('?')[0]
+        query = '&'.join(f"{key}={value}" for key, value in sorted((params or {}).items()))
+        cache_key = f"{decoder.__name__} {endpoint}?{query}"
+        
+        entry = self.response_cache.get(cache_key)
+        if entry is not None and entry.is_fresh():
+            self.response_cache.record_hit()
+            return entry.data
+        
+        headers = dict(self.headers)
+        if entry is not None:
+            headers.update(entry.validators())
+        
+        def fetch():
+            with self._send_read(url, path, params=params, headers=headers, timeout=timeout, stream=True) as response:
+                if response.status_code == 304 and entry is not None:
+                    return self.response_cache.revalidated(cache_key, entry, response.headers)
+                self._raise_for_status(response, path)
+                self.response_cache.record_miss()
+                data = decoder(response)
+                if decoder is self._decode_json:
+                    # Streaming decoders count their own chunks
+                    transfer_stats.record_response(path, response)
+                return self.response_cache.store(cache_key, path, data, response.headers)
+        
+        try:
+            return request_group.do(f"{decoder.__name__} {url}?{query}", fetch)
+        except (CircuitOpenError, BackendUnavailableError,
+                requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if entry is None:
+                raise
+            print(f"Serving last good response for {path} (backend unavailable)")
+            return mark_stale(entry.data, entry.fetched_at)
     
     def _make_request(self, method: str, endpoint: str, data: Dict = None, files: Dict = None) -> Dict:
         """
         Make HTTP request to the backend API
         
+        GET requests are served through the response cache.
+        
         Args:
             method (str): HTTP method (GET, POST, PUT, DELETE)
             endpoint (str): API endpoint
@@ -36,18 +284,18 @@ class BackendAPIService:
         
         try:
             if method.upper() == 'GET':
-                response = requests.get(url, headers=self.headers, timeout=10)
+                return self._get(endpoint)
             elif method.upper() == 'POST':
                 if files:
                     # For file uploads, don't set Content-Type header (let requests handle it)
                     headers = {k: v for k, v in self.headers.items() if k != 'Content-Type'}
-                    response = requests.post(url, data=data, files=files, headers=headers, timeout=30)
+                    response = self._send('POST', url, data=data, files=files, headers=headers, timeout=30)
                 else:
-                    response = requests.post(url, json=data, headers=self.headers, timeout=10)
+                    response = self._send('POST', url, json=data, headers=self.headers, timeout=10)
             elif method.upper() == 'PUT':
-                response = requests.put(url, json=data, headers=self.headers, timeout=10)
+                response = self._send('PUT', url, json=data, headers=self.headers, timeout=10)
             elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=self.headers, timeout=10)
+                response = self._send('DELETE', url, headers=self.headers, timeout=10)
             else:
                 return {"error": f"Unsupported HTTP method: {method}"}
             
@@ -55,11 +303,12 @@ class BackendAPIService:
             response.raise_for_status()
             
             # Try to parse JSON response
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                return {"data": response.text, "status_code": response.status_code}
+            result = self._decode_json(response)
+            transfer_stats.record_response(endpoint.split('?')[0], response)
+            return result
                 
+        except (BackendAPIError, CircuitOpenError) as e:
+            return {"error": str(e)}
         except requests.exceptions.ConnectionError:
             return {"error": f"Could not connect to backend at {url}. Please check if the backend is running."}
         except requests.exceptions.Timeout:
@@ -70,10 +319,22 @@ class BackendAPIService:
     # === JOB MANAGEMENT ENDPOINTS ===
     
     def get_jobs(self, skip: int = 0, limit: int = 100) -> Dict:
-        """Get all job postings from backend with pagination"""
+        """Get one page of job postings from backend"""
         params = f"?skip={skip}&limit={limit}"
         return self._make_request('GET', f'/jobs/{params}')
     
+    def get_all_jobs(self, page_size: int = DEFAULT_PAGE_SIZE, max_workers: int = DEFAULT_PAGE_WORKERS):
+        """Get every job posting across all pages, in backend order"""
+        try:
+            pages = dict(self._iter_pages(self._fetch_jobs_page, page_size, max_workers))
+            jobs = [job for skip in sorted(pages) for job in pages[skip]]
+            stale_pages = [page for page in pages.values() if is_stale(page)]
+            if stale_pages:
+                return mark_stale(jobs, min(page.stale_as_of for page in stale_pages))
+            return jobs
+        except BackendAPIError as e:
+            return {"error": str(e)}
+    
     def create_job(self, job_data: Dict) -> Dict:
         """Create a new job posting"""
         # Format data according to backend API specification
@@ -84,7 +345,10 @@ class BackendAPIService:
             "requirements": "\n".join(job_data.get("requirements", [])) if isinstance(job_data.get("requirements"), list) else job_data.get("requirements", "")
         }
         
-        return self._make_request('POST', '/jobs/', data=formatted_data)
+        result = self._make_request('POST', '/jobs/', data=formatted_data)
+        if "error" not in result:
+            self.response_cache.invalidate('/jobs/', '/api/jobs/', '/metrics/')
+        return result
     
     def get_job_details(self, job_id: str) -> Dict:
         """Get details for a specific job"""
@@ -92,11 +356,17 @@ class BackendAPIService:
     
     def update_job(self, job_id: str, job_data: Dict) -> Dict:
         """Update a job posting"""
-        return self._make_request('PUT', f'/api/jobs/{job_id}', data=job_data)
+        result = self._make_request('PUT', f'/api/jobs/{job_id}', data=job_data)
+        if "error" not in result:
+            self.response_cache.invalidate('/jobs/', '/api/jobs/', '/applications/')
+        return result
     
     def delete_job(self, job_id: str) -> Dict:
         """Delete a job posting"""
-        return self._make_request('DELETE', f'/api/jobs/{job_id}')
+        result = self._make_request('DELETE', f'/api/jobs/{job_id}')
+        if "error" not in result:
+            self.response_cache.invalidate('/jobs/', '/api/jobs/', '/applications/', '/metrics/')
+        return result
     
     def parse_job_document(self, job_doc_file) -> Dict:
         """Parse job description document to extract job details"""
@@ -132,51 +402,227 @@ class BackendAPIService:
     
     # === CANDIDATE MANAGEMENT ENDPOINTS ===
     
-    def get_candidates(self, skip: int = 0, limit: int = 100) -> Dict:
-        """Get all candidate applications with their scores and job details"""
+    def _stream_applications(self, skip: int, limit: int) -> Iterator[Dict]:
+        """
+        Stream raw applications straight off the socket, one element at a time
+        
+        The response body is decoded incrementally, so neither the raw body nor
+        the full parsed list is ever held in memory.
+        
+        Raises:
+            BackendAPIError: If the backend answers with a non-200 status
+        """
+        url = f"{self.base_url}/applications/"
+        params = {
+            'skip': skip,
+            'limit': limit
+        }
+        print(f"Getting applications from: {url} with params: {params}")
+        
+        with self._send_read(url, '/applications/', params=params, headers=self.headers, timeout=30,
+                             stream=True) as response:
+            self._raise_for_status(response, '/applications/')
+            
+            count = 0
+            chunks = transfer_stats.count_chunks('/applications/', response,
+                                                 response.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+            for app in iter_json_array(chunks):
+                count += 1
+                yield app
+            print(f"Retrieved {count} applications")
+    
+    def _decode_candidates(self, response: requests.Response) -> List[Dict]:
+        """Decode an /applications/ body element by element, transforming each application as it arrives"""
+        chunks = transfer_stats.count_chunks('/applications/', response,
+                                             response.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+        candidates = [ingest_application(app) for app in iter_json_array(chunks)]
+        print(f"Retrieved {len(candidates)} applications")
+        return candidates
+    
+    def _fetch_candidates_page(self, skip: int, limit: int) -> List[Dict]:
+        """Fetch one page of transformed applications through the response cache"""
+        params = {
+            'skip': skip,
+            'limit': limit
+        }
+        print(f"Getting applications from: {self.base_url}/applications/ with params: {params}")
+        return self._get('/applications/', params=params, decoder=self._decode_candidates, timeout=30)
+    
+    def _fetch_jobs_page(self, skip: int, limit: int) -> List[Dict]:
+        """
+        Fetch one raw page of job postings
+        
+        Raises:
+            BackendAPIError: If the backend returns an error
+        """
+        result = self.get_jobs(skip=skip, limit=limit)
+        if isinstance(result, dict):
+            if "error" in result:
+                raise BackendAPIError(result["error"])
+            return result.get("jobs", [])
+        return result
+    
+    def _iter_pages(self, fetch_page, page_size: int, max_workers: int) -> Iterator[Tuple[int, List[Dict]]]:
+        """
+        Fetch pages concurrently with a bounded worker pool
+        
+        The first page is fetched on its own, so data that fits in one page
+        costs one request. Only if it comes back full are up to max_workers
+        further page requests kept in flight; (skip, records) is yielded for
+        each page as soon as it arrives, so pages may come back out of order.
+        No new pages are requested once a short page marks the end of the data.
+        """
+        records = fetch_page(0, page_size)
+        yield 0, records
+        if len(records) < page_size:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+        next_skip = page_size
+        end_reached = False
         try:
-            url = f"{self.base_url}/applications/"
-            params = {
-                'skip': skip,
-                'limit': limit
-            }
-            print(f"Getting applications from: {url} with params: {params}")
+            for _ in range(max_workers):
+                pending[executor.submit(fetch_page, next_skip, page_size)] = next_skip
+                next_skip += page_size
             
-            response = requests.get(url, params=params, timeout=30)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    skip = pending.pop(future)
+                    records = future.result()
+                    if len(records) < page_size:
+                        end_reached = True
+                    elif not end_reached:
+                        pending[executor.submit(fetch_page, next_skip, page_size)] = next_skip
+                        next_skip += page_size
+                    yield skip, records
+        finally:
+            # Consumer stopped early or a page failed - drop anything not yet started
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def iter_candidates(self, page_size: int = DEFAULT_PAGE_SIZE, max_workers: int = DEFAULT_PAGE_WORKERS) -> Iterator[Dict]:
+        """
+        Stream all candidate applications page by page
+        
+        Records are yielded as each page arrives, without building the full list first.
+        
+        Raises:
+            BackendAPIError: If a page cannot be fetched
+        """
+        for _, candidates in self._iter_pages(self._fetch_candidates_page, page_size, max_workers):
+            yield from candidates
+    
+    def iter_jobs(self, page_size: int = DEFAULT_PAGE_SIZE, max_workers: int = DEFAULT_PAGE_WORKERS) -> Iterator[Dict]:
+        """
+        Stream all job postings page by page
+        
+        Raises:
+            BackendAPIError: If a page cannot be fetched
+        """
+        for _, jobs in self._iter_pages(self._fetch_jobs_page, page_size, max_workers):
+            yield from jobs
+    
+    def stream_candidates(self, skip: int = 0, limit: int = 100) -> Iterator[Dict]:
+        """
+        Stream candidate applications from a single request
+        
+        Each application is transformed as soon as it is parsed from the socket,
+        keeping memory flat for very large skip/limit windows.
+        
+        Raises:
+            BackendAPIError: If the backend returns an error
+        """
+        for app in self._stream_applications(skip, limit):
+            yield ingest_application(app)
+    
+    def get_candidates(self, skip: int = 0, limit: int = 100) -> Dict:
+        """Get one page of candidate applications with their scores and job details"""
+        try:
+            candidates = self._fetch_candidates_page(skip, limit)
+            result = {"candidates": candidates, "total": len(candidates)}
+            if is_stale(candidates):
+                result.update(stale=True, stale_as_of=candidates.stale_as_of)
+            return result
+        
+        except BackendAPIError as e:
+            error_msg = str(e)
+            print(error_msg)
+            return {"error": error_msg}
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Network error getting applications: {str(e)}"
+            print(error_msg)
+            return {"error": error_msg}
+        except Exception as e:
+            error_msg = f"Error getting applications: {str(e)}"
+            print(error_msg)
+            return {"error": error_msg}
+    
+    def get_all_candidates(self, page_size: int = DEFAULT_PAGE_SIZE, max_workers: int = DEFAULT_PAGE_WORKERS) -> Dict:
+        """Get every candidate application across all pages, in backend order"""
+        try:
+            pages = dict(self._iter_pages(self._fetch_candidates_page, page_size, max_workers))
+            candidates = [candidate for skip in sorted(pages) for candidate in pages[skip]]
+            result = {"candidates": candidates, "total": len(candidates)}
+            stale_pages = [page for page in pages.values() if is_stale(page)]
+            if stale_pages:
+                result.update(stale=True, stale_as_of=min(page.stale_as_of for page in stale_pages))
+            return result
+        
+        except BackendAPIError as e:
+            error_msg = str(e)
+            print(error_msg)
+            return {"error": error_msg}
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Network error getting applications: {str(e)}"
+            print(error_msg)
+            return {"error": error_msg}
+        except Exception as e:
+            error_msg = f"Error getting applications: {str(e)}"
+            print(error_msg)
+            return {"error": error_msg}
+    
+    def get_candidates_after(self, after_id: int, known_count: int, newest_first: bool = False,
+                             page_size: int = DEFAULT_PAGE_SIZE) -> Dict:
+        """
+        Get only the applications with an id above a high-water mark
+        
+        The backend has no "since" filter, so this stops early on its ordered
+        pages: oldest-first lists are read from the known count onwards,
+        newest-first lists from the start until the first already-known record.
+        
+        Args:
+            after_id (int): Highest application id already synced
+            known_count (int): Number of applications already synced
+            newest_first (bool): Whether the backend lists the newest applications first
+            page_size (int): Applications per request
+        """
+        try:
+            new_candidates = []
+            stale_pages = []
+            skip = 0 if newest_first else known_count
+            while True:
+                page = self._fetch_candidates_page(skip, page_size)
+                if is_stale(page):
+                    stale_pages.append(page)
+                newer = [candidate for candidate in page if (candidate.get('id') or 0) > after_id]
+                new_candidates.extend(newer)
+                if len(page) < page_size or (newest_first and len(newer) < len(page)):
+                    break
+                skip += page_size
             
-            if response.status_code == 200:
-                applications = response.json()
-                print(f"Retrieved {len(applications)} applications")
-                
-                # Transform the data to match frontend expectations if needed
-                candidates = []
-                for app in applications:
-                    candidate = {
-                        'id': app.get('id'),
-                        'name': f"Candidate {app.get('id', 'Unknown')}",  # Backend doesn't have candidate names yet
-                        'job_role': app.get('job', {}).get('job_title', 'Unknown Position'),
-                        'job_id': app.get('job_id'),
-                        'score': app.get('relevance_score', 0),
-                        'verdict': app.get('verdict', 'Medium'),
-                        'missing_skills': app.get('missing_skills', []),
-                        'feedback': app.get('feedback', ''),
-                        'resume_file': app.get('resume_filename', 'resume.pdf'),
-                        'application_date': app.get('application_date'),
-                        'application_id': app.get('id')
-                    }
-                    candidates.append(candidate)
-                
-                return {"candidates": candidates, "total": len(candidates)}
-            else:
-                error_msg = f"Failed to get applications with status {response.status_code}"
-                try:
-                    error_detail = response.json()
-                    error_msg += f": {error_detail}"
-                except:
-                    error_msg += f": {response.text}"
-                print(error_msg)
-                return {"error": error_msg}
-                
+            print(f"Incremental sync found {len(new_candidates)} new applications after id {after_id}")
+            result = {"candidates": new_candidates, "total": len(new_candidates)}
+            if stale_pages:
+                result.update(stale=True, stale_as_of=min(page.stale_as_of for page in stale_pages))
+            return result
+        
+        except BackendAPIError as e:
+            error_msg = str(e)
+            print(error_msg)
+            return {"error": error_msg}
         except requests.exceptions.RequestException as e:
             error_msg = f"Network error getting applications: {str(e)}"
             print(error_msg)
@@ -203,11 +649,13 @@ class BackendAPIService:
             url = f"{self.base_url}/jobs/{job_id}/apply"
             print(f"Applying to job {job_id} at: {url}")
             
-            response = requests.post(url, files=files, timeout=30)
+            response = self._send('POST', url, files=files, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
+                transfer_stats.record_response(f'/jobs/{job_id}/apply', response)
                 print(f"Application successful! Relevance score: {result.get('relevance_score', 'N/A')}")
+                self.response_cache.invalidate('/applications/', '/metrics/')
                 return result
             else:
                 error_msg = f"Application failed with status {response.status_code}"
@@ -283,17 +731,21 @@ class BackendAPIService:
 
     def health_check(self) -> Dict:
         """Check if backend API is healthy"""
+        breaker_state = self.circuit_breaker.get_state()
+        if breaker_state["state"] != "closed":
+            return {"error": f"Backend unavailable: circuit breaker is {breaker_state['state']} "
+                             f"after {breaker_state['consecutive_failures']} consecutive failures"}
+        
         # Only try GET-compatible endpoints
         endpoints_to_try = ['/jobs/', '/']
         
         last_error = None
         for endpoint in endpoints_to_try:
             try:
-                result = self._make_request('GET', endpoint)
-                if "error" not in result:
-                    return {"status": "healthy", "endpoint": endpoint}
-                else:
-                    last_error = result["error"]
+                # Sent past the response cache and request coalescing: only a live answer proves health
+                with self._send('GET', f"{self.base_url}{endpoint}", headers=self.headers, timeout=10) as response:
+                    self._raise_for_status(response, endpoint)
+                return {"status": "healthy", "endpoint": endpoint}
             except Exception as e:
                 last_error = str(e)
                 continue
@@ -304,16 +756,28 @@ class BackendAPIService:
 
 # === STREAMLIT INTEGRATION HELPERS ===
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@st.cache_resource(show_spinner=False)
+def get_backend_client(backend_url: str) -> BackendAPIService:
+    """
+    Get the shared client for a backend URL
+    
+    One long-lived client per URL is kept for the whole process and shared by
+    every session, together with its connection pool, response cache and stats.
+    Clients for other URLs stay alive when a session switches backends.
+    """
+    print(f"Creating shared API client for {backend_url}")
+    return BackendAPIService(backend_url)
+
+
 def get_api_service() -> BackendAPIService:
     """
-    Get cached API service instance
+    Get the shared API service for this session's backend
     Uses session state backend URL instead of secrets
     """
     # Use session state backend URL (set in app.py initialization)
-    backend_url = st.session_state.get("backend_url", "https://innomaticshackathonbackend-production.up.railway.app")
+    backend_url = st.session_state.get("backend_url", DEFAULT_BACKEND_URL)
     
-    return BackendAPIService(backend_url)
+    return get_backend_client(backend_url.rstrip('/'))
 
 
 def test_backend_connection(api_service: BackendAPIService) -> bool:
@@ -344,6 +808,25 @@ def handle_api_error(result: Dict, default_message: str = "An error occurred", s
     return False
 
 
+def show_stale_notice(*results):
+    """Warn when any of the results was served from the last good response"""
+    stale_times = []
+    for result in results:
+        if is_stale(result):
+            as_of = result.get("stale_as_of") if isinstance(result, dict) else result.stale_as_of
+            if as_of:
+                stale_times.append(as_of)
+    if stale_times:
+        as_of_text = datetime.fromtimestamp(min(stale_times)).strftime('%H:%M:%S')
+        st.warning(f"⚠️ Backend unavailable - showing last known data as of {as_of_text}")
+
+
+def show_as_of(label: str, as_of: Optional[float]):
+    """Caption telling how old a piece of shared data is"""
+    if as_of:
+        st.caption(f"{label} as of {datetime.fromtimestamp(as_of).strftime('%H:%M:%S')}")
+
+
 def show_backend_config():
     """Show backend configuration UI"""
     st.sidebar.markdown("---")
@@ -357,13 +840,24 @@ def show_backend_config():
     )
     
     if st.sidebar.button("Update Backend URL"):
-        st.session_state.backend_url = new_url
+        st.session_state.backend_url = new_url.rstrip('/')
+        get_backend_client(st.session_state.backend_url)  # Get or create the shared client for this URL
         st.sidebar.success("✅ Backend URL updated!")
         st.rerun()
     
+    # Circuit breaker status
+    api_service = get_api_service()
+    breaker_state = api_service.circuit_breaker.get_state()
+    if breaker_state["state"] == "open":
+        st.sidebar.error("🔴 Circuit breaker open - failing fast and serving last known data")
+    elif breaker_state["state"] == "half_open":
+        st.sidebar.warning("🟡 Circuit breaker half-open - probing backend")
+    else:
+        st.sidebar.caption(f"🟢 Circuit breaker closed "
+                           f"({breaker_state['consecutive_failures']}/{breaker_state['failure_threshold']} failures)")
+    
     # Test connection
     if st.sidebar.button("🔍 Test Connection"):
-        api_service = get_api_service()
         if test_backend_connection(api_service):
             st.sidebar.success("✅ Backend connection successful!")
         else:
@@ -0,0 +1,92 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+from services.api_service import BackendAPIService
+
+# Datasets a page can ask for in a single fan-out call
+PAGE_DATASETS = ("metrics", "candidates", "jobs")
+
+
+class AsyncBackendAPIService:
+    """Asyncio front-end for BackendAPIService so pages can fan out requests concurrently"""
+
+    def __init__(self, api_service: BackendAPIService):
+        """
+        Wrap an existing API service
+
+        Args:
+            api_service (BackendAPIService): Service whose pooled session is shared by all calls
+        """
+        self.api_service = api_service
+
+    async def _call(self, func, *args, **kwargs):
+        """Run a blocking service call on a worker thread"""
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def get_jobs(self, skip: int = 0, limit: int = 100) -> Dict:
+        """Get job postings without blocking the event loop"""
+        return await self._call(self.api_service.get_jobs, skip, limit)
+
+    async def get_candidates(self, skip: int = 0, limit: int = 100) -> Dict:
+        """Get candidate applications without blocking the event loop"""
+        return await self._call(self.api_service.get_candidates, skip, limit)
+
+    async def get_all_jobs(self):
+        """Get every job posting across all pages without blocking the event loop"""
+        return await self._call(self.api_service.get_all_jobs)
+
+    async def get_all_candidates(self) -> Dict:
+        """Get every candidate application across all pages without blocking the event loop"""
+        return await self._call(self.api_service.get_all_candidates)
+
+    async def get_metrics(self) -> Dict:
+        """Get dashboard metrics without blocking the event loop"""
+        return await self._call(self.api_service.get_metrics)
+
+    async def get_page_data(self, include: Iterable[str] = PAGE_DATASETS,
+                            candidate_limit: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Fetch several datasets concurrently
+
+        Args:
+            include: Names of the datasets to load ("metrics", "candidates", "jobs")
+            candidate_limit (int): Only fetch the first page of this size; None fetches every page
+
+        Returns:
+            Dict: Result per dataset name; failed loads carry an "error" key like any other API result
+        """
+        loaders = {
+            "metrics": lambda: self.get_metrics(),
+            "candidates": lambda: (self.get_all_candidates() if candidate_limit is None
+                                   else self.get_candidates(limit=candidate_limit)),
+            "jobs": lambda: self.get_all_jobs(),
+        }
+        names = [name for name in include if name in loaders]
+        results = await asyncio.gather(*(loaders[name]() for name in names), return_exceptions=True)
+
+        page_data = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                page_data[name] = {"error": f"Failed to load {name}: {str(result)}"}
+            else:
+                page_data[name] = result
+        return page_data
+
+
+def fetch_page_data(api_service: BackendAPIService, include: Iterable[str] = PAGE_DATASETS,
+                    candidate_limit: Optional[int] = None) -> Dict[str, Dict]:
+    """
+    Load page datasets concurrently from synchronous Streamlit code
+
+    Page latency becomes the slowest request instead of the sum of all of them.
+    """
+    coroutine = AsyncBackendAPIService(api_service).get_page_data(tuple(include), candidate_limit)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    # Already inside an event loop (e.g. notebooks) - run the fan-out on a helper thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
@@ -0,0 +1,95 @@
+from typing import Dict, List, Optional
+
+from services.ingestion import Verdict
+
+
+class CandidateStore:
+    """
+    Jobs and applications keyed by id, with secondary indexes
+
+    Built once per data snapshot and shared read-only by every page:
+    job_id -> application ids, verdict -> application ids and
+    title -> job ids. Lookups are dict reads instead of scans over every
+    candidate, and jobs with the same title no longer overwrite each other.
+    """
+
+    def __init__(self, jobs: List[Dict], candidates: List[Dict]):
+        """
+        Args:
+            jobs: Raw backend job records
+            candidates: Application records (services.ingestion.ApplicationRecord)
+        """
+        self.jobs = {}
+        self.applications = {}
+        self.application_ids_by_job = {}
+        self.application_ids_by_verdict = {verdict: [] for verdict in Verdict}
+        self.job_ids_by_title = {}
+
+        for job in jobs:
+            job_id = job.get("id")
+            if job_id is None or job_id in self.jobs:
+                continue
+            self.jobs[job_id] = job
+            self.job_ids_by_title.setdefault(job.get("job_title", "Unknown Job"), []).append(job_id)
+
+        for candidate in candidates:
+            application_id = candidate.get("id")
+            if application_id is None:
+                continue
+            if application_id in self.applications:
+                self._unindex(self.applications[application_id])
+            self.applications[application_id] = candidate
+            self.application_ids_by_job.setdefault(candidate.get("job_id"), []).append(application_id)
+            self.application_ids_by_verdict[Verdict.parse(candidate.get("verdict"))].append(application_id)
+
+    def _unindex(self, candidate: Dict):
+        """Drop a superseded duplicate from the secondary indexes"""
+        application_id = candidate.get("id")
+        self.application_ids_by_job[candidate.get("job_id")].remove(application_id)
+        self.application_ids_by_verdict[Verdict.parse(candidate.get("verdict"))].remove(application_id)
+
+    @classmethod
+    def from_results(cls, jobs_result, candidates_result) -> 'CandidateStore':
+        """Build a store from get_all_jobs / get_all_candidates shaped results, treating errors as empty"""
+        jobs = jobs_result if isinstance(jobs_result, list) else (jobs_result or {}).get("jobs", [])
+        if isinstance(candidates_result, list):
+            candidates = candidates_result
+        else:
+            candidates = (candidates_result or {}).get("candidates", [])
+        return cls(jobs, candidates)
+
+    # === LOOKUPS ===
+
+    def get_jobs(self) -> List[Dict]:
+        """Every job, in backend order"""
+        return list(self.jobs.values())
+
+    def get_job(self, job_id) -> Optional[Dict]:
+        return self.jobs.get(job_id)
+
+    def jobs_titled(self, title: str) -> List[Dict]:
+        """Every job posted under a title"""
+        return [self.jobs[job_id] for job_id in self.job_ids_by_title.get(title, [])]
+
+    def get_candidates(self) -> List[Dict]:
+        """Every application, in backend order"""
+        return list(self.applications.values())
+
+    def applications_for_job(self, job_id) -> List[Dict]:
+        return [self.applications[app_id] for app_id in self.application_ids_by_job.get(job_id, [])]
+
+    def applications_for_title(self, title: str) -> List[Dict]:
+        """Applications to every job posted under a title"""
+        return [app for job_id in self.job_ids_by_title.get(title, []) for app in self.applications_for_job(job_id)]
+
+    def applications_with_verdict(self, verdict: str) -> List[Dict]:
+        return [self.applications[app_id] for app_id in self.application_ids_by_verdict.get(verdict, [])]
+
+    def count_for_job(self, job_id) -> int:
+        return len(self.application_ids_by_job.get(job_id, ()))
+
+    def count_with_verdict(self, verdict: str) -> int:
+        return len(self.application_ids_by_verdict.get(verdict, ()))
+
+
+EMPTY_STORE = CandidateStore([], [])
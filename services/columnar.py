@@ -0,0 +1,105 @@
+from datetime import timezone
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from services.ingestion import Verdict, record_from_dict
+
+# Verdict code stored per application; also the column order of job_verdict_counts()
+VERDICT_ORDER = (Verdict.HIGH, Verdict.MEDIUM, Verdict.LOW)
+_VERDICT_CODES = {verdict: code for code, verdict in enumerate(VERDICT_ORDER)}
+
+
+class ApplicationColumns:
+    """
+    Applications of one data snapshot as NumPy columns
+
+    Holds score, verdict code, job index and application time per
+    application, so reports and dashboards compute counts, means and
+    histograms with vectorized group-bys (np.bincount) instead of one list
+    scan per job or verdict. Built once per snapshot; read-only afterwards.
+    """
+
+    __slots__ = ('job_ids', 'job_index', 'score', 'verdict', 'applied_at', '_positions')
+
+    def __init__(self, candidates: Sequence, job_ids: Iterable = ()):
+        """
+        Args:
+            candidates: ApplicationRecords (plain candidate dicts are decoded first)
+            job_ids: Known job ids, in display order; job ids only seen on applications are appended
+        """
+        positions = {job_id: position for position, job_id in enumerate(dict.fromkeys(job_ids))}
+        job_index, score, verdict, applied_at = [], [], [], []
+
+        for candidate in candidates:
+            record = record_from_dict(candidate)
+            position = positions.get(record.job_id)
+            if position is None:
+                position = positions[record.job_id] = len(positions)
+            job_index.append(position)
+            score.append(record.score or 0)
+            verdict.append(_VERDICT_CODES[record.verdict])
+            moment = record.applied_at
+            if moment is None:
+                applied_at.append(np.nan)
+            else:
+                applied_at.append((moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)).timestamp())
+
+        timestamps = np.array(applied_at, dtype=np.float64)
+        missing = np.isnan(timestamps)
+        applied_at = np.where(missing, 0, timestamps).astype('datetime64[s]')
+        applied_at[missing] = np.datetime64('NaT')
+
+        self.job_ids = list(positions)
+        self.job_index = np.array(job_index, dtype=np.int32)
+        self.score = np.array(score, dtype=np.float64)
+        self.verdict = np.array(verdict, dtype=np.int8)
+        self.applied_at = applied_at  # UTC, NaT where the backend sent no date
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+    def job_code(self, job_id) -> int:
+        """Value of job_index for a job's applications (-1 if it has none)"""
+        return self._positions.get(job_id, -1)
+
+    @staticmethod
+    def verdict_code(verdict) -> int:
+        """Value of the verdict column for "High", "Medium" or "Low" (-1 for anything else)"""
+        return _VERDICT_CODES.get(verdict, -1)
+
+    def job_positions(self, job_ids: Iterable) -> List[int]:
+        """Row positions of job ids in the per-job arrays (unknown ids are skipped)"""
+        return [self._positions[job_id] for job_id in job_ids if job_id in self._positions]
+
+    # === AGGREGATES ===
+
+    def verdict_counts(self) -> Dict[Verdict, int]:
+        """Applications per verdict"""
+        counts = np.bincount(self.verdict, minlength=len(VERDICT_ORDER))
+        return {verdict: int(counts[code]) for code, verdict in enumerate(VERDICT_ORDER)}
+
+    def mean_score(self) -> float:
+        return float(self.score.mean()) if len(self.score) else 0.0
+
+    def job_counts(self) -> np.ndarray:
+        """Applications per job, aligned with job_ids"""
+        return np.bincount(self.job_index, minlength=len(self.job_ids))
+
+    def job_score_sums(self) -> np.ndarray:
+        """Sum of scores per job, aligned with job_ids"""
+        return np.bincount(self.job_index, weights=self.score, minlength=len(self.job_ids))
+
+    def job_verdict_counts(self) -> np.ndarray:
+        """Applications per job and verdict, shape (len(job_ids), 3) in VERDICT_ORDER"""
+        width = len(VERDICT_ORDER)
+        keys = self.job_index.astype(np.int64) * width + self.verdict
+        return np.bincount(keys, minlength=len(self.job_ids) * width).reshape(-1, width)
+
+    def score_histogram(self, bins: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """Applications per score band over 0-100, as (counts, bin edges)"""
+        return np.histogram(self.score, bins=bins, range=(0, 100))
+
+
+EMPTY_COLUMNS = ApplicationColumns([])
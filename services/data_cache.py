@@ -0,0 +1,274 @@
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import streamlit as st
+
+from services.api_service import BackendAPIService, get_backend_client
+from services.async_api_service import PAGE_DATASETS, fetch_page_data
+from services.ingestion import ingest_application
+from services.resilience import is_stale
+
+# Seconds a loaded dataset is shared by all sessions before it is fetched again
+DEFAULT_DATASET_TTLS = {
+    "jobs": 60,
+    "candidates": 30,
+    "metrics": 15,
+}
+FULL_RECONCILE_INTERVAL = 600  # Seconds between full reloads of incrementally synced candidates
+
+
+def normalize_job(job: Dict) -> Dict:
+    """Convert a backend job record to the frontend format used by st.session_state.jobs_data"""
+    requirements = job.get("requirements", "")
+    return {
+        "title": job.get("job_title", "Unknown Job"),
+        "department": job.get("department", "Engineering"),
+        "description": job.get("description", ""),
+        "requirements": requirements.split('\n') if isinstance(requirements, str) else [],
+        "applicants": 0,  # Backend doesn't provide this yet
+        "avg_score": 0,   # Backend doesn't provide this yet
+        "id": job.get("id"),
+        "posted_date": job.get("posted_date"),
+        "is_active": job.get("is_active", True)
+    }
+
+
+def jobs_by_id(normalized_jobs: List[Dict]) -> Dict[int, Dict]:
+    """Key normalized jobs by id, copying them so a session can edit its own jobs_data"""
+    return {job["id"]: {**job, "requirements": list(job["requirements"])} for job in normalized_jobs}
+
+
+def candidate_watermark(candidates: List[Dict]) -> Dict:
+    """High-water mark of a synced candidate list: highest id, record count and list order"""
+    ids = [candidate.get("id") for candidate in candidates if isinstance(candidate.get("id"), int)]
+    return {
+        "id": max(ids, default=0),
+        "count": len(candidates),
+        "newest_first": len(ids) > 1 and ids[0] > ids[-1]
+    }
+
+
+def is_cacheable(result) -> bool:
+    """Errors and stale fallbacks are served but never cached"""
+    return not (isinstance(result, dict) and "error" in result) and not is_stale(result)
+
+
+class Dataset:
+    """A loaded dataset plus its normalized form (read-only once stored)"""
+
+    __slots__ = ('data', 'normalized', 'loaded_at', 'fetched_at', 'watermark', 'reconciled_at')
+
+    def __init__(self, data, normalized=None):
+        self.data = data
+        self.normalized = normalized
+        self.loaded_at = time.monotonic()
+        self.fetched_at = time.time()  # Wall-clock load time shown as "as of"
+        self.watermark = None          # Candidates only: where the next incremental sync starts
+        self.reconciled_at = self.loaded_at  # Last full load
+
+    def copy(self) -> 'Dataset':
+        """A new Dataset with the same data and timestamps, to change before it is stored"""
+        dataset = Dataset(self.data, self.normalized)
+        for name in self.__slots__:
+            setattr(dataset, name, getattr(self, name))
+        return dataset
+
+
+class DataCache:
+    """
+    Process-wide cache of the jobs, candidates and metrics datasets for one backend
+
+    Every session and page reads the same loaded and normalized data instead of
+    pulling and transforming it on each rerun. Writes made through this app
+    are applied write-through, so they show up without another full fetch.
+    Cached data is shared between sessions and must be treated as read-only.
+
+    Candidates are append-mostly, so after the first load only applications
+    above the high-water mark are fetched and merged in; a full reload every
+    full_reconcile_interval seconds picks up edits and deletes.
+    """
+
+    def __init__(self, api_service: BackendAPIService, ttls: Optional[Dict[str, float]] = None,
+                 full_reconcile_interval: float = FULL_RECONCILE_INTERVAL):
+        self.api_service = api_service
+        self.ttls = dict(DEFAULT_DATASET_TTLS if ttls is None else ttls)
+        self.full_reconcile_interval = full_reconcile_interval
+        self._datasets = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+        self.incremental_syncs = 0
+        self.write_throughs = 0
+
+    def _fresh(self, name: str) -> Optional[Dataset]:
+        """Get a dataset that is still within its TTL (lock held)"""
+        dataset = self._datasets.get(name)
+        if dataset is not None and time.monotonic() - dataset.loaded_at < self.ttls.get(name, 0):
+            return dataset
+        return None
+
+    def _store(self, name: str, result):
+        normalized = None
+        if name == "jobs":
+            jobs = result if isinstance(result, list) else result.get("jobs", [])
+            normalized = [normalize_job(job) for job in jobs]
+        dataset = Dataset(result, normalized)
+        if name == "candidates":
+            dataset.watermark = candidate_watermark(result.get("candidates", []))
+        with self._lock:
+            self._datasets[name] = dataset
+            self.loads += 1
+
+    def _incremental_base(self) -> Optional[Dataset]:
+        """The candidates dataset to extend incrementally, or None when a full reload is due"""
+        with self._lock:
+            dataset = self._datasets.get("candidates")
+            if dataset is None or dataset.watermark is None:
+                return None
+            if time.monotonic() - dataset.reconciled_at >= self.full_reconcile_interval:
+                return None
+            return dataset
+
+    def _sync_candidates_incrementally(self, base: Dataset):
+        """Fetch applications above the watermark and merge them into the cached candidates"""
+        watermark = base.watermark
+        result = self.api_service.get_candidates_after(watermark["id"], watermark["count"], watermark["newest_first"])
+        if not is_cacheable(result):
+            return result
+
+        with self._lock:
+            self.incremental_syncs += 1
+            current = self._datasets.get("candidates") or base  # May include write-throughs made meanwhile
+            if not result["candidates"]:
+                # Same data, new load time - stored as a new Dataset so the sync is published
+                refreshed = current.copy()
+                refreshed.loaded_at = time.monotonic()
+                refreshed.fetched_at = time.time()
+                self._datasets["candidates"] = refreshed
+                return refreshed.data
+            new_ids = {candidate.get("id") for candidate in result["candidates"]}
+            kept = [candidate for candidate in current.data["candidates"] if candidate.get("id") not in new_ids]
+            merged = result["candidates"] + kept if watermark["newest_first"] else kept + result["candidates"]
+            updated = Dataset({"candidates": merged, "total": len(merged)})
+            updated.watermark = candidate_watermark(merged)
+            updated.reconciled_at = current.reconciled_at
+            self._datasets["candidates"] = updated
+            return updated.data
+
+    def get_page_data(self, include: Iterable[str] = PAGE_DATASETS) -> Dict[str, Dict]:
+        """
+        Get several datasets, loading the expired ones concurrently
+
+        Args:
+            include: Names of the datasets to get ("metrics", "candidates", "jobs")
+
+        Returns:
+            Dict: Result per dataset name, shaped like the BackendAPIService results
+        """
+        names = tuple(include)
+        page_data = {}
+        with self._lock:
+            for name in names:
+                dataset = self._fresh(name)
+                if dataset is not None:
+                    page_data[name] = dataset.data
+                    self.hits += 1
+        missing = [name for name in names if name not in page_data]
+        incremental_base = self._incremental_base() if "candidates" in missing else None
+        if incremental_base is not None:
+            missing.remove("candidates")
+        if missing:
+            for name, result in fetch_page_data(self.api_service, include=missing).items():
+                if is_cacheable(result):
+                    self._store(name, result)
+                page_data[name] = result
+        if incremental_base is not None:
+            page_data["candidates"] = self._sync_candidates_incrementally(incremental_base)
+        return {name: page_data[name] for name in names}
+
+    def get(self, name: str):
+        """Get one dataset"""
+        return self.get_page_data((name,))[name]
+
+    def peek(self, name: str) -> Optional[Dataset]:
+        """Get the last good load of a dataset regardless of its age, without fetching"""
+        with self._lock:
+            return self._datasets.get(name)
+
+    def _expire(self, name: str):
+        """Mark a dataset as past its TTL but keep serving it until the reload lands (lock held)"""
+        dataset = self._datasets.get(name)
+        if dataset is not None:
+            expired = dataset.copy()
+            expired.loaded_at = float('-inf')
+            self._datasets[name] = expired
+
+    # === WRITE-THROUGH ===
+
+    def add_job(self, created_job: Dict):
+        """Apply a job created on the backend to the cached jobs"""
+        with self._lock:
+            self._expire("metrics")
+            dataset = self._datasets.get("jobs")
+            if dataset is None:
+                return
+            if not created_job.get("id") or not isinstance(dataset.data, list):
+                del self._datasets["jobs"]
+                return
+            # Copy on write - other sessions may be iterating the current list
+            updated = Dataset(dataset.data + [created_job], dataset.normalized + [normalize_job(created_job)])
+            updated.loaded_at = dataset.loaded_at
+            self._datasets["jobs"] = updated
+            self.write_throughs += 1
+
+    def add_application(self, job_id, application: Dict, resume_filename: str = None):
+        """Apply an application accepted by the backend to the cached candidates"""
+        with self._lock:
+            self._expire("metrics")
+            dataset = self._datasets.get("candidates")
+            if dataset is None:
+                return
+            if not application.get("id"):
+                del self._datasets["candidates"]
+                return
+            jobs = self._datasets.get("jobs")
+            job = next((job for job in (jobs.data if jobs is not None and isinstance(jobs.data, list) else [])
+                        if job.get("id") == job_id), {})
+            record = {
+                "job_id": job_id,
+                "job": {"job_title": job.get("job_title", "Unknown Position")},
+                "resume_filename": resume_filename or "resume.pdf",
+                **application
+            }
+            candidates = dataset.data["candidates"] + [ingest_application(record)]
+            updated = Dataset({**dataset.data, "candidates": candidates, "total": len(candidates)})
+            updated.loaded_at = dataset.loaded_at
+            # Keep the synced watermark so applications other users sent meanwhile are not skipped
+            updated.watermark = dataset.watermark
+            updated.reconciled_at = dataset.reconciled_at
+            self._datasets["candidates"] = updated
+            self.write_throughs += 1
+
+    def invalidate(self, *names: str):
+        """Drop datasets so the next read fetches them again (all of them if no names are given)"""
+        with self._lock:
+            for name in names or list(self._datasets):
+                self._datasets.pop(name, None)
+
+    def get_stats(self) -> Dict:
+        """Get hit and load counters for the dataset cache"""
+        with self._lock:
+            return {
+                "datasets": sorted(self._datasets),
+                "hits": self.hits,
+                "loads": self.loads,
+                "incremental_syncs": self.incremental_syncs,
+                "write_throughs": self.write_throughs
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def get_backend_data_cache(backend_url: str) -> DataCache:
+    """Get the shared dataset cache for a backend URL"""
+    return DataCache(get_backend_client(backend_url))
@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional
+
+# Hedging defaults
+DEFAULT_HEDGE_PERCENTILE = 95     # Send a hedge once the first attempt is slower than this percentile
+DEFAULT_MAX_HEDGE_RATIO = 0.05    # At most this fraction of requests may send a hedge
+DEFAULT_MIN_SAMPLES = 20          # Latency samples needed per endpoint before hedging starts
+DEFAULT_LATENCY_WINDOW = 200      # Recent latencies kept per endpoint
+MIN_HEDGE_DELAY = 0.05            # Never hedge sooner than this many seconds
+
+# Runs both attempts of a hedged request so the caller can take whichever answers first
+_hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='hedge')
+
+
+class HedgePolicy:
+    """
+    When to send a second, hedged attempt of a slow idempotent request
+
+    Latencies (time until response headers arrive) are tracked per endpoint.
+    Once an endpoint has enough samples, a request that has not answered
+    within the chosen percentile gets a second attempt; the first response
+    wins. Hedges are capped at max_hedge_ratio of all requests, which keeps
+    the extra backend load bounded.
+    """
+
+    def __init__(self, percentile: float = DEFAULT_HEDGE_PERCENTILE, max_hedge_ratio: float = DEFAULT_MAX_HEDGE_RATIO,
+                 min_samples: int = DEFAULT_MIN_SAMPLES, window: int = DEFAULT_LATENCY_WINDOW):
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self.window = window
+        self._latencies = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record_latency(self, path: str, seconds: float):
+        with self._lock:
+            samples = self._latencies.get(path)
+            if samples is None:
+                samples = self._latencies[path] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def hedge_delay(self, path: str) -> Optional[float]:
+        """Seconds to wait before hedging a request to path, or None if there is not enough history"""
+        with self._lock:
+            samples = sorted(self._latencies.get(path, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(int(len(samples) * self.percentile / 100), len(samples) - 1)
+        return max(samples[index], MIN_HEDGE_DELAY)
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def try_hedge(self) -> bool:
+        """Take a hedge from the rate cap, returning False if it is used up"""
+        with self._lock:
+            if self.hedges + 1 > self.max_hedge_ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def record_hedge_win(self):
+        with self._lock:
+            self.hedge_wins += 1
+
+    def get_stats(self) -> Dict:
+        """Get hedge counters and the current hedge delay per endpoint"""
+        with self._lock:
+            paths = list(self._latencies)
+            stats = {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "hedge_rate": round(self.hedges / self.requests, 3) if self.requests else 0.0
+            }
+        stats["hedge_delays"] = {path: self.hedge_delay(path) for path in paths}
+        return stats
+
+
+def _discard(future: Future):
+    """Close the response of an attempt that lost the race, releasing its connection"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    future.result().close()
+
+
+def send_hedged(policy: HedgePolicy, path: str, send: Callable[[], object]):
+    """
+    Call send(), hedging it with a second call if the first is slow
+
+    Args:
+        policy (HedgePolicy): Decides the hedge delay and enforces the hedge rate cap
+        path (str): Endpoint path used for latency tracking
+        send: Callable sending the request and returning a requests.Response
+
+    Returns:
+        The first response to arrive; the other attempt is cancelled if it has
+        not started yet, or its response is closed when it arrives.
+    """
+    def attempt():
+        started = time.monotonic()
+        response = send()
+        policy.record_latency(path, time.monotonic() - started)
+        return response
+
+    policy.record_request()
+    delay = policy.hedge_delay(path)
+    primary = _hedge_executor.submit(attempt)
+    if delay is None:
+        return primary.result()
+
+    done, _ = wait([primary], timeout=delay)
+    if done or not policy.try_hedge():
+        return primary.result()
+
+    print(f"Hedging slow request to {path} after {delay:.2f}s")
+    hedge = _hedge_executor.submit(attempt)
+    pending = {primary, hedge}
+    while True:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        winner = next((future for future in done if future.exception() is None), None)
+        if winner is not None or not pending:
+            break
+
+    for future in (primary, hedge):
+        if future is not winner and not future.cancel():
+            future.add_done_callback(_discard)
+    if winner is None:
+        return primary.result()  # Both attempts failed; raise the original error
+    if winner is hedge:
+        policy.record_hedge_win()
+    return winner.result()
@@ -0,0 +1,161 @@
+import os
+import re
+import sys
+from collections.abc import Mapping
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Optional
+
+# Keys an ApplicationRecord exposes, matching the frontend candidate dicts the pages use
+APPLICATION_FIELDS = (
+    'id', 'name', 'job_role', 'job_id', 'score', 'verdict', 'missing_skills',
+    'feedback', 'resume_file', 'application_date', 'application_id'
+)
+
+_FILENAME_NOISE = re.compile(r'(^|[\s_-])(resume|cv)$', re.IGNORECASE)
+_FILENAME_SEPARATORS = re.compile(r'[\s_-]+')
+
+
+class Verdict(str, Enum):
+    """Fit verdict; compares, hashes and formats like its plain string value"""
+
+    HIGH = "High"
+    MEDIUM = "Medium"
+    LOW = "Low"
+
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+    @classmethod
+    def parse(cls, raw) -> 'Verdict':
+        """Map backend verdicts like "High Fit" / "Low suitability" to a Verdict (Medium if unknown)"""
+        if isinstance(raw, cls):
+            return raw
+        raw = raw if isinstance(raw, str) else ""
+        for verdict in cls:
+            if verdict.value in raw:
+                return verdict
+        return cls.MEDIUM
+
+
+def parse_application_date(value) -> Optional[datetime]:
+    """Parse a backend ISO timestamp (with or without a trailing Z), or None if it is missing or invalid"""
+    if isinstance(value, datetime):
+        return value
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def name_from_filename(filename) -> Optional[str]:
+    """Derive a candidate name from a resume filename like "jane_smith_resume.pdf", or None"""
+    if not filename or not isinstance(filename, str):
+        return None
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    if stem.startswith('.'):
+        return None
+    stem = _FILENAME_NOISE.sub('', stem)
+    words = [word for word in _FILENAME_SEPARATORS.split(stem) if word]
+    return ' '.join(words).title() or None
+
+
+def _intern(value, default: str) -> str:
+    return sys.intern(value) if isinstance(value, str) else default
+
+
+class ApplicationRecord(Mapping):
+    """
+    Compact, read-only application decoded once from the backend
+
+    Verdicts are Verdict members, the application date is parsed once into
+    applied_at and repeated strings (job titles, skills) are interned. Records
+    are shared by every session, so they are never modified. They also behave
+    as read-only mappings with the usual candidate keys (record['name'],
+    record.get('verdict')), so code written against the old dicts keeps working.
+    """
+
+    __slots__ = ('id', 'name', 'job_role', 'job_id', 'score', 'verdict', 'missing_skills',
+                 'feedback', 'resume_file', 'application_date', 'applied_at')
+
+    def __init__(self, id, name: str, job_role: str, job_id, score, verdict: Verdict, missing_skills: tuple,
+                 feedback: str, resume_file: str, application_date: Optional[str]):
+        self.id = id
+        self.name = name
+        self.job_role = job_role
+        self.job_id = job_id
+        self.score = score
+        self.verdict = verdict
+        self.missing_skills = missing_skills
+        self.feedback = feedback
+        self.resume_file = resume_file
+        self.application_date = application_date
+        self.applied_at = parse_application_date(application_date)
+
+    @property
+    def application_id(self):
+        return self.id
+
+    def __getitem__(self, key: str):
+        if key not in APPLICATION_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(APPLICATION_FIELDS)
+
+    def __len__(self) -> int:
+        return len(APPLICATION_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"ApplicationRecord(id={self.id!r}, name={self.name!r}, job_id={self.job_id!r}, verdict={self.verdict})"
+
+    def to_dict(self) -> Dict:
+        """Plain, JSON-serializable dict in the frontend candidate format"""
+        return {key: (list(self[key]) if key == 'missing_skills' else self[key]) for key in APPLICATION_FIELDS}
+
+
+def _build_record(app: Dict, name, job_role, score, resume_file) -> ApplicationRecord:
+    application_id = app.get('id')
+    skills = app.get('missing_skills') or ()
+    return ApplicationRecord(
+        id=application_id,
+        name=(app.get('candidate_name') or app.get('applicant_name') or name
+              or name_from_filename(resume_file) or f"Candidate {app.get('id', 'Unknown')}"),
+        job_role=_intern(job_role, 'Unknown Position'),
+        job_id=app.get('job_id'),
+        score=score if score is not None else 0,
+        verdict=Verdict.parse(app.get('verdict')),
+        missing_skills=tuple(_intern(skill, str(skill)) for skill in skills),
+        feedback=app.get('feedback') or '',
+        resume_file=_intern(resume_file, 'resume.pdf') if resume_file else 'resume.pdf',
+        application_date=app.get('application_date')
+    )
+
+
+def ingest_application(app: Dict) -> ApplicationRecord:
+    """
+    Decode one backend application record
+
+    Args:
+        app (Dict): Application as returned by /applications/ (relevance_score, job, resume_filename, ...)
+
+    Returns:
+        ApplicationRecord: The decoded record
+    """
+    job = app.get('job') if isinstance(app.get('job'), dict) else {}
+    return _build_record(app, app.get('name'), job.get('job_title') or app.get('job_title'),
+                         app.get('relevance_score'), app.get('resume_filename'))
+
+
+def record_from_dict(candidate: Mapping) -> ApplicationRecord:
+    """Rebuild a record from its frontend dict form (to_dict output, e.g. from the local mirror)"""
+    if isinstance(candidate, ApplicationRecord):
+        return candidate
+    name = candidate.get('name')
+    if isinstance(name, str) and name.startswith('Candidate '):
+        name = None  # Placeholder from before names were derived; derive it again
+    return _build_record(candidate, name, candidate.get('job_role'), candidate.get('score'),
+                         candidate.get('resume_file'))
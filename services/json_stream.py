@@ -0,0 +1,197 @@
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+# Characters JSON allows between tokens
+_WHITESPACE = ' \t\n\r'
+
+# Characters that can continue a number literal ("-1" may still become "-1.5e3")
+_NUMBER_CHARS = '0123456789.eE+-'
+
+# Next character that matters inside a string, outside a string, and after a bare number or literal
+_STRING_SPECIAL = re.compile(r'["\\]')
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_SCALAR_END = re.compile(r'[,\]}\s]')
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after pos"""
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+class _ElementScanner:
+    """
+    Finds where one JSON value ends without decoding it
+
+    Tracks bracket depth and string/escape state, and resumes where it stopped
+    when more text arrives, so every character of an element is scanned once
+    however many chunks it is split across.
+    """
+
+    __slots__ = ('offset', 'depth', 'in_string', 'escaped')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.offset = 0  # Characters of the current element already scanned
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def scan(self, text: str, start: int) -> int:
+        """Return the end index of the value starting at text[start], or -1 if it continues past the text"""
+        i = start + self.offset
+        container = text[start] in '{["'
+        while i < len(text):
+            if self.escaped:
+                self.escaped = False
+                i += 1
+                continue
+            if self.in_string:
+                match = _STRING_SPECIAL.search(text, i)
+                if match is None:
+                    i = len(text)
+                    break
+                i = match.start()
+                if text[i] == '\\':
+                    self.escaped = True
+                else:
+                    self.in_string = False
+                    if self.depth == 0:
+                        return i + 1
+                i += 1
+                continue
+            if not container:
+                match = _SCALAR_END.search(text, i)
+                if match is None:
+                    i = len(text)
+                    break
+                return match.start()
+            match = _STRUCTURAL.search(text, i)
+            if match is None:
+                i = len(text)
+                break
+            i = match.start()
+            char = text[i]
+            if char == '"':
+                self.in_string = True
+            elif char in '{[':
+                self.depth += 1
+            else:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+            i += 1
+        self.offset = i - start
+        return -1
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = 'utf-8') -> Iterator[Any]:
+    """
+    Incrementally decode a top-level JSON array from a stream of byte chunks
+
+    Each element is yielded as soon as it has been fully received, and the text
+    buffer only ever holds the element currently being decoded, so memory stays
+    flat no matter how long the array is. An element is decoded straight away
+    when it arrived whole; one split across chunks is scanned for its end as
+    text arrives (each character once) and decoded once, when complete.
+
+    Args:
+        chunks: Byte chunks, e.g. response.iter_content(chunk_size=65536)
+        encoding (str): Text encoding of the stream
+
+    Raises:
+        ValueError: If the stream is not a well-formed JSON array
+    """
+    decoder = json.JSONDecoder()
+    scanner = _ElementScanner()
+    scanning = False  # Whether the current element is being scanned for its end
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buffer = ''
+    pos = 0
+    exhausted = False
+    started = False
+    expect_separator = False
+
+    def read_more() -> bool:
+        nonlocal buffer, pos, exhausted
+        if exhausted:
+            return False
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            exhausted = True
+            buffer = buffer[pos:] + text_decoder.decode(b'', final=True)
+            pos = 0
+            return True
+        # Drop everything already consumed before growing the buffer
+        buffer = buffer[pos:] + text_decoder.decode(chunk)
+        pos = 0
+        return True
+
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos >= len(buffer):
+            if read_more():
+                continue
+            raise ValueError("Unexpected end of JSON stream")
+
+        char = buffer[pos]
+        if not started:
+            if char != '[':
+                raise ValueError(f"Expected a JSON array, got {char!r}")
+            started = True
+            pos += 1
+            continue
+
+        if char == ']':
+            return
+
+        if expect_separator:
+            if char != ',':
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+            expect_separator = False
+            pos += 1
+            continue
+
+        if not scanning:
+            # Fast path: most elements arrive whole within one chunk
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                value, end = None, None
+            if end is not None and (exhausted or (end < len(buffer) and not (
+                    isinstance(value, (int, float)) and not buffer[end:].strip(_NUMBER_CHARS)))):
+                yield value
+                pos = end
+                expect_separator = True
+                continue
+            # Incomplete, or a bare number or literal that may continue in the next chunk
+            scanning = True
+
+        end = scanner.scan(buffer, pos)
+        if end < 0:
+            # Element not complete yet - wait for more bytes
+            if read_more():
+                continue
+            if scanner.depth or scanner.in_string:
+                raise ValueError("Truncated element at end of JSON stream")
+            end = len(buffer)  # A bare number or literal ends with the stream
+
+        try:
+            value, decoded_end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Malformed element in JSON stream: {e}")
+        if decoded_end != end:
+            raise ValueError(f"Malformed element in JSON stream at {buffer[pos:end]!r}")
+
+        yield value
+        pos = end
+        scanner.reset()
+        scanning = False
+        expect_separator = True
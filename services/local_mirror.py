@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.ingestion import record_from_dict
+
+# Where the per-backend SQLite mirrors live (override with RESUME_APP_MIRROR_DIR)
+MIRROR_DIR = os.environ.get("RESUME_APP_MIRROR_DIR", ".local_mirror")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    job_id INTEGER,
+    verdict TEXT,
+    application_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications (job_id);
+CREATE INDEX IF NOT EXISTS idx_applications_verdict ON applications (verdict);
+CREATE INDEX IF NOT EXISTS idx_applications_date ON applications (application_date);
+CREATE TABLE IF NOT EXISTS metrics (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    dataset TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def mirror_path(base_url: str) -> str:
+    """Mirror file for a backend URL"""
+    digest = hashlib.sha1(base_url.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(MIRROR_DIR, f"mirror_{digest}.sqlite3")
+
+
+class LocalMirror:
+    """
+    SQLite copy of the last synced jobs, applications and metrics for one backend
+
+    Written by the sync worker after every successful load and read back on
+    startup, so a restarted server shows real data immediately and keeps
+    serving it (marked stale) while the backend is unreachable. Applications
+    are stored in their ApplicationRecord dict form, indexed by job_id,
+    verdict and application_date, and come back as ApplicationRecords.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ':memory:':
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def _set_synced_at(self, dataset: str, synced_at: float):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sync_state (dataset, synced_at) VALUES (?, ?)", (dataset, synced_at)
+        )
+
+    def save_dataset(self, name: str, result, synced_at: Optional[float] = None):
+        """
+        Replace a mirrored dataset with a freshly synced result
+
+        Args:
+            name (str): "jobs", "candidates" or "metrics"
+            result: The dataset in its BackendAPIService shape
+            synced_at (float): Wall-clock time the data was loaded
+        """
+        synced_at = synced_at or time.time()
+        with self._lock, self._conn:
+            if name == "jobs":
+                self._conn.execute("DELETE FROM jobs")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO jobs (id, position, data) VALUES (?, ?, ?)",
+                    [(job.get("id"), position, json.dumps(job)) for position, job in enumerate(result)]
+                )
+            elif name == "candidates":
+                self._conn.execute("DELETE FROM applications")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO applications (id, position, job_id, verdict, application_date, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(candidate.get("id"), position, candidate.get("job_id"), candidate.get("verdict"),
+                      candidate.get("application_date"), json.dumps(dict(candidate)))
+                     for position, candidate in enumerate(result.get("candidates", []))]
+                )
+            elif name == "metrics":
+                self._conn.execute("INSERT OR REPLACE INTO metrics (id, data) VALUES (1, ?)", (json.dumps(result),))
+            else:
+                return
+            self._set_synced_at(name, synced_at)
+
+    def append_applications(self, candidates: List[Dict], start_position: int, synced_at: Optional[float] = None):
+        """Merge applications from an incremental sync into the mirror without rewriting the table"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO applications (id, position, job_id, verdict, application_date, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(candidate.get("id"), start_position + offset, candidate.get("job_id"), candidate.get("verdict"),
+                  candidate.get("application_date"), json.dumps(dict(candidate)))
+                 for offset, candidate in enumerate(candidates)]
+            )
+            self._set_synced_at("candidates", synced_at or time.time())
+
+    def load_dataset(self, name: str) -> Optional[Tuple[Any, float]]:
+        """Get a mirrored dataset in its BackendAPIService shape with its sync time, or None if never mirrored"""
+        with self._lock:
+            row = self._conn.execute("SELECT synced_at FROM sync_state WHERE dataset = ?", (name,)).fetchone()
+            if row is None:
+                return None
+            synced_at = row[0]
+            if name == "jobs":
+                rows = self._conn.execute("SELECT data FROM jobs ORDER BY position").fetchall()
+                return [json.loads(data) for (data,) in rows], synced_at
+            if name == "candidates":
+                rows = self._conn.execute("SELECT data FROM applications ORDER BY position").fetchall()
+                candidates = [record_from_dict(json.loads(data)) for (data,) in rows]
+                return {"candidates": candidates, "total": len(candidates)}, synced_at
+            if name == "metrics":
+                row = self._conn.execute("SELECT data FROM metrics WHERE id = 1").fetchone()
+                return (json.loads(row[0]), synced_at) if row else None
+        return None
+
+    def get_applications(self, job_id=None, verdict: str = None, since: str = None) -> List[Dict]:
+        """
+        Query mirrored applications through the job_id / verdict / application_date indexes
+
+        Args:
+            job_id: Only applications for this job
+            verdict (str): Only applications with this verdict
+            since (str): Only applications dated on or after this ISO timestamp
+        """
+        clauses, params = [], []
+        if job_id is not None:
+            clauses.append("job_id = ?")
+            params.append(job_id)
+        if verdict is not None:
+            clauses.append("verdict = ?")
+            params.append(verdict)
+        if since is not None:
+            clauses.append("application_date >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT data FROM applications {where} ORDER BY position", params).fetchall()
+        return [record_from_dict(json.loads(data)) for (data,) in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,123 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence
+
+from services.search_index import tokenize
+
+DEFAULT_QUERY_CACHE_MAX_ENTRIES = 128
+
+# Sort keys accepted by QueryCache.candidates; None keeps snapshot order (best match first when searching)
+SORT_KEYS = {
+    "score": (lambda record: record.score or 0, True),
+    "name": (lambda record: record.name.lower(), False),
+    "newest": (lambda record: record.applied_at.timestamp() if record.applied_at else float("-inf"), True),
+}
+
+
+def run_candidate_query(snapshot, search: str = "", role: Optional[str] = None, verdict: Optional[str] = None,
+                        sort: Optional[str] = None, job_id=None) -> Sequence:
+    """
+    Filter and sort a snapshot's candidates
+
+    Args:
+        snapshot: DataSnapshot whose store and search index are queried
+        search: Search text; matches are ranked by the snapshot's search index
+        role: Only candidates who applied to a job posted under this title
+        verdict: Only candidates with this verdict ("High", "Medium" or "Low")
+        sort: One of SORT_KEYS, or None
+        job_id: Only candidates who applied to this job
+
+    Returns:
+        Tuple of ApplicationRecords, or a lazy SearchResults when only search,
+        job and verdict filters apply (records are built for the rows read)
+    """
+    # Start from the narrowest index, then filter the rest in one pass each
+    if search:
+        # The search index and the columnar table hold the store's candidates in the same order,
+        # so job and verdict filters run on the matched positions without building records
+        positions, columns = snapshot.search.search_positions(search), snapshot.columns
+        if job_id is not None:
+            positions, job_id = positions[columns.job_index[positions] == columns.job_code(job_id)], None
+        if verdict:
+            positions, verdict = positions[columns.verdict[positions] == columns.verdict_code(verdict)], None
+        records = snapshot.search.results(positions)
+        if not role and sort is None:
+            return records
+    elif job_id is not None:
+        records, job_id = snapshot.store.applications_for_job(job_id), None
+    elif verdict:
+        records, verdict = snapshot.store.applications_with_verdict(verdict), None
+    else:
+        records = snapshot.store.get_candidates()
+
+    if job_id is not None:
+        records = [record for record in records if record.job_id == job_id]
+    if role:
+        role_job_ids = set(snapshot.store.job_ids_by_title.get(role, ()))
+        records = [record for record in records if record.job_role == role or record.job_id in role_job_ids]
+    if verdict:
+        records = [record for record in records if record.verdict == verdict]
+    if sort is not None:
+        key, reverse = SORT_KEYS[sort]
+        records = sorted(records, key=key, reverse=reverse)
+    return tuple(records)
+
+
+class QueryCache:
+    """
+    Size-bounded LRU cache of filtered, sorted candidate lists
+
+    Keyed by snapshot version and the filter tuple (search, role, verdict,
+    sort, job), so reruns that do not change the filters (opening a modal,
+    selecting a row, coming back to a page) reuse the previous result, and
+    a newly published snapshot never sees an older version's results.
+    Results are read-only sequences shared between sessions.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_QUERY_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def candidates(self, snapshot, search: str = "", role: Optional[str] = None, verdict: Optional[str] = None,
+                   sort: Optional[str] = None, job_id=None) -> Sequence:
+        """Get the candidates matching the filters (see run_candidate_query), computing them on a miss"""
+        search = " ".join(tokenize(search))  # "John  Doe" and "john doe" share an entry
+        key = (snapshot.version, search, role or None, verdict or None, sort, job_id)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        result = run_candidate_query(snapshot, search, role, verdict, sort, job_id)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def clear(self):
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters for the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
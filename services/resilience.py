@@ -0,0 +1,313 @@
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+import requests
+
+# Circuit breaker defaults
+DEFAULT_FAILURE_THRESHOLD = 5    # Consecutive failures before the circuit opens
+DEFAULT_RESET_TIMEOUT = 30       # Seconds to wait before probing an open circuit
+PROBE_TIMEOUT = 5                # Seconds allowed for a background probe request
+
+# Retry policy defaults
+DEFAULT_MAX_ATTEMPTS = 3          # Total attempts including the first one
+DEFAULT_BASE_DELAY = 0.2          # Seconds; backoff ceiling doubles every attempt
+DEFAULT_MAX_DELAY = 5.0           # Seconds; longest backoff or Retry-After we are willing to wait
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+# Retry budget defaults
+DEFAULT_RETRY_RATIO = 0.2         # Retries allowed as a fraction of requests
+DEFAULT_MIN_RETRIES = 5           # Retries always allowed per window, so low traffic can still retry
+DEFAULT_BUDGET_WINDOW = 10.0      # Seconds of history the budget looks at
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of sending a request while the circuit breaker is open"""
+
+
+class StaleList(list):
+    """A list result served from the last good response while the backend is unavailable"""
+
+    stale = True
+    stale_as_of = None
+
+
+def mark_stale(data, as_of: float):
+    """
+    Mark a last-good response as stale without changing its shape
+
+    Dicts get "stale" and "stale_as_of" keys; lists become a StaleList carrying
+    the same attributes, so existing isinstance(result, list) checks still work.
+    """
+    if isinstance(data, dict):
+        return {**data, "stale": True, "stale_as_of": as_of}
+    if isinstance(data, list):
+        stale = StaleList(data)
+        stale.stale_as_of = as_of
+        return stale
+    return data
+
+
+def is_stale(result) -> bool:
+    """Whether an API result was served from the last good response"""
+    if isinstance(result, dict):
+        return bool(result.get("stale"))
+    return bool(getattr(result, "stale", False))
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one backend
+
+    Closed: requests flow normally. After failure_threshold consecutive failures
+    the circuit opens and every request fails fast with CircuitOpenError. While
+    open, a background thread probes the backend every reset_timeout seconds
+    (half-open); the first successful probe closes the circuit again.
+    """
+
+    def __init__(self, probe: Callable[[], bool], failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT, name: str = "backend"):
+        """
+        Args:
+            probe: Callable returning True when the backend looks healthy again
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds between background probes while open
+            name (str): Label used in error messages
+        """
+        self.probe = probe
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._probe_thread = None
+
+    def before_request(self):
+        """Fail fast if the circuit is not closed"""
+        with self._lock:
+            if self.state == CIRCUIT_CLOSED:
+                return
+            self.rejected += 1
+        raise CircuitOpenError(
+            f"Backend at {self.name} is unavailable; failing fast while the circuit breaker is open. "
+            f"Retrying automatically in the background."
+        )
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state != CIRCUIT_CLOSED or self.consecutive_failures < self.failure_threshold:
+                return
+            self._open()
+
+    def _open(self):
+        """Open the circuit and start background probing (lock held)"""
+        self.state = CIRCUIT_OPEN
+        self.opened_at = time.time()
+        self.times_opened += 1
+        print(f"Circuit breaker opened for {self.name} after {self.consecutive_failures} consecutive failures")
+        if self._probe_thread is None or not self._probe_thread.is_alive():
+            self._probe_thread = threading.Thread(target=self._probe_loop, name=f"circuit-probe-{self.name}", daemon=True)
+            self._probe_thread.start()
+
+    def _probe_loop(self):
+        """Probe the backend in the background until it recovers"""
+        while True:
+            time.sleep(self.reset_timeout)
+            with self._lock:
+                self.state = CIRCUIT_HALF_OPEN
+            try:
+                healthy = self.probe()
+            except Exception:
+                healthy = False
+            with self._lock:
+                if healthy:
+                    self.state = CIRCUIT_CLOSED
+                    self.consecutive_failures = 0
+                    self.opened_at = None
+                    print(f"Circuit breaker closed for {self.name}: backend recovered")
+                    return
+                self.state = CIRCUIT_OPEN
+
+    def get_state(self) -> Dict:
+        """Get the breaker state for display"""
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "opened_at": self.opened_at,
+                "times_opened": self.times_opened,
+                "rejected_requests": self.rejected
+            }
+
+
+_breakers = {}
+_probe_sessions = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(base_url: str, session: Optional[requests.Session] = None) -> CircuitBreaker:
+    """
+    Get the process-wide circuit breaker for a backend URL
+
+    The half-open probe is sent through the most recent session passed in,
+    so it reuses the client's pooled connections and session headers.
+    """
+    with _breakers_lock:
+        if session is not None:
+            _probe_sessions[base_url] = session
+        breaker = _breakers.get(base_url)
+        if breaker is None:
+            def probe() -> bool:
+                client = _probe_sessions.get(base_url, requests)
+                return client.get(f"{base_url}/", timeout=PROBE_TIMEOUT).status_code < 500
+            breaker = CircuitBreaker(probe, name=base_url)
+            _breakers[base_url] = breaker
+        return breaker
+
+
+def parse_retry_after(response: requests.Response) -> Optional[float]:
+    """Get the Retry-After delay in seconds from a response, if present"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Which failures to retry and how long to wait between attempts
+
+    Only idempotent methods are retried, on connection errors, timeouts and
+    the statuses in retry_statuses. Backoff uses full jitter: a random delay
+    between 0 and min(max_delay, base_delay * 2 ** attempt). A Retry-After
+    header overrides the backoff; if it asks for longer than max_delay the
+    request is not retried at all.
+    """
+
+    def __init__(self, max_attempts: int = DEFAULT_MAX_ATTEMPTS, base_delay: float = DEFAULT_BASE_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY, retry_statuses=RETRYABLE_STATUSES,
+                 methods=IDEMPOTENT_METHODS):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def should_retry(self, method: str, attempt: int, response: Optional[requests.Response] = None) -> bool:
+        """
+        Whether a failed attempt may be retried
+
+        Args:
+            method (str): HTTP method of the request
+            attempt (int): Zero-based number of the attempt that just failed
+            response: The response, or None if the attempt raised a connection error or timeout
+        """
+        if method.upper() not in self.methods or attempt + 1 >= self.max_attempts:
+            return False
+        if response is None:
+            return True
+        if response.status_code not in self.retry_statuses:
+            return False
+        retry_after = parse_retry_after(response)
+        return retry_after is None or retry_after <= self.max_delay
+
+    def backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds to wait before the next attempt"""
+        if response is not None:
+            retry_after = parse_retry_after(response)
+            if retry_after is not None:
+                return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class RetryBudget:
+    """
+    Process-wide cap on retries as a fraction of recent requests
+
+    Within a sliding window, retries are allowed while they stay below
+    max(min_retries, ratio * requests). During an outage most requests fail,
+    the budget runs dry and retries stop, so they cannot multiply the load
+    on a backend that is already struggling.
+    """
+
+    def __init__(self, ratio: float = DEFAULT_RETRY_RATIO, min_retries: int = DEFAULT_MIN_RETRIES,
+                 window: float = DEFAULT_BUDGET_WINDOW):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests = deque()
+        self._retries = deque()
+        self._lock = threading.Lock()
+        self.total_requests = 0
+        self.total_retries = 0
+        self.denied_retries = 0
+
+    def _prune(self, now: float):
+        cutoff = now - self.window
+        while self._requests and self._requests[0] < cutoff:
+            self._requests.popleft()
+        while self._retries and self._retries[0] < cutoff:
+            self._retries.popleft()
+
+    def record_request(self):
+        """Count an original (non-retry) request"""
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._requests.append(now)
+            self.total_requests += 1
+
+    def try_acquire(self) -> bool:
+        """Take one retry from the budget, returning False if it is exhausted"""
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            allowed = max(self.min_retries, self.ratio * len(self._requests))
+            if len(self._retries) >= allowed:
+                self.denied_retries += 1
+                return False
+            self._retries.append(now)
+            self.total_retries += 1
+            return True
+
+    def get_stats(self) -> Dict:
+        """Get retry counters for display"""
+        with self._lock:
+            self._prune(time.monotonic())
+            return {
+                "requests": self.total_requests,
+                "retries": self.total_retries,
+                "denied_retries": self.denied_retries,
+                "window_requests": len(self._requests),
+                "window_retries": len(self._retries),
+                "ratio": self.ratio
+            }
+
+
+# Shared by every API service in the process
+retry_budget = RetryBudget()
@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Seconds a cached GET response is served without contacting the backend.
+# Endpoints are matched by path prefix; anything unlisted is always revalidated.
+DEFAULT_CACHE_TTLS = {
+    '/jobs/': 60,
+    '/applications/': 30,
+    '/metrics/': 15,
+}
+DEFAULT_CACHE_MAX_ENTRIES = 256
+
+
+class CacheEntry:
+    """A cached GET response together with its revalidation headers"""
+
+    __slots__ = ('path', 'data', 'etag', 'last_modified', 'stored_at', 'fetched_at', 'ttl')
+
+    def __init__(self, path: str, data: Any, etag: Optional[str], last_modified: Optional[str], ttl: float):
+        self.path = path
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = time.monotonic()
+        self.fetched_at = time.time()  # Wall-clock time of the last successful fetch or revalidation
+        self.ttl = ttl
+
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without asking the backend"""
+        return time.monotonic() - self.stored_at < self.ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of decoded GET responses
+
+    Entries are fresh for a per-endpoint TTL; after that they are revalidated
+    with If-None-Match / If-Modified-Since so an unchanged resource only costs
+    a 304. Cached data is shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def ttl_for(self, path: str) -> float:
+        """Get the TTL for an endpoint path (longest matching prefix wins)"""
+        matches = [prefix for prefix in self.ttls if path.startswith(prefix)]
+        return self.ttls[max(matches, key=len)] if matches else 0
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Look up an entry and mark it as recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def revalidated(self, key: str, entry: CacheEntry, headers) -> Any:
+        """Refresh an entry after a 304 Not Modified and return its data"""
+        with self._lock:
+            self.revalidations += 1
+            entry.stored_at = time.monotonic()
+            entry.fetched_at = time.time()
+            entry.etag = headers.get('ETag', entry.etag)
+            entry.last_modified = headers.get('Last-Modified', entry.last_modified)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            return entry.data
+
+    def store(self, key: str, path: str, data: Any, headers) -> Any:
+        """Store a freshly fetched response, evicting the least recently used entries"""
+        entry = CacheEntry(path, data, headers.get('ETag'), headers.get('Last-Modified'), self.ttl_for(path))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return data
+
+    def invalidate(self, *path_prefixes: str):
+        """Drop every entry whose endpoint path starts with one of the prefixes"""
+        with self._lock:
+            stale_keys = [key for key, entry in self._entries.items()
+                          if any(entry.path.startswith(prefix) for prefix in path_prefixes)]
+            for key in stale_keys:
+                del self._entries[key]
+            self.invalidations += len(stale_keys)
+
+    def clear(self):
+        """Drop all cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters for the cache"""
+        with self._lock:
+            lookups = self.hits + self.revalidations + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": round((self.hits + self.revalidations) / lookups, 3) if lookups else 0.0
+            }
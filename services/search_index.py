@@ -0,0 +1,222 @@
+import os
+import re
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from services.ingestion import record_from_dict
+
+# Field weights: a name hit outranks a resume filename hit, which outranks a skill hit
+NAME_WEIGHT, FILE_WEIGHT, SKILL_WEIGHT = 3, 2, 1
+# Match weights per query token: whole token > token prefix > one-typo token
+EXACT_MATCH, PREFIX_MATCH, FUZZY_MATCH = 3, 2, 1
+FUZZY_MIN_LENGTH = 4  # Shorter query tokens are too ambiguous to correct
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text) -> List[str]:
+    """Lowercase alphanumeric tokens of a name, filename or skill"""
+    return _TOKEN_RE.findall(str(text).lower()) if text else []
+
+
+def _deletes(token: str) -> List[str]:
+    """Every variant of a token with one character removed"""
+    return [token[:i] + token[i + 1:] for i in range(len(token))]
+
+
+class SearchResults(Sequence):
+    """
+    Ranked matches that look their ApplicationRecords up only when read
+
+    Holds the matching positions; slicing out one page builds just that
+    page's records, so a broad query never materializes every match.
+    """
+
+    __slots__ = ('_candidates', 'positions')
+
+    def __init__(self, candidates: List, positions: np.ndarray):
+        self._candidates = candidates
+        self.positions = positions
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._candidates[position] for position in self.positions[index].tolist()]
+        return self._candidates[int(self.positions[index])]
+
+    def __iter__(self) -> Iterator:
+        return (self._candidates[position] for position in self.positions.tolist())
+
+
+class _Segment:
+    """
+    Inverted index over one contiguous run of candidates
+
+    The vocabulary is kept sorted and the postings (position within the run,
+    field weight) are stored in one flat array in vocabulary order, so every
+    token starting with a prefix is one contiguous slice found with two
+    bisects. Typos are matched with a one-deletion neighbourhood of the
+    vocabulary (edit distance 1 plus adjacent transpositions).
+    """
+
+    def __init__(self, candidates: Sequence):
+        self.size = len(candidates)
+
+        postings: Dict[str, Dict[int, int]] = {}
+        for position, record in enumerate(candidates):
+            resume_stem = os.path.splitext(record.resume_file)[0] if record.resume_file else None
+            fields = [(record.name, NAME_WEIGHT), (resume_stem, FILE_WEIGHT)]
+            fields += [(skill, SKILL_WEIGHT) for skill in record.missing_skills]
+            for text, weight in fields:
+                for token in tokenize(text):
+                    weights = postings.setdefault(token, {})
+                    if weights.get(position, 0) < weight:
+                        weights[position] = weight
+
+        self.vocabulary = sorted(postings)
+        offsets, positions, weights = [0], [], []
+        for token in self.vocabulary:
+            token_postings = postings[token]
+            positions.extend(token_postings)
+            weights.extend(token_postings.values())
+            offsets.append(len(positions))
+        self._offsets = offsets
+        self._positions = np.array(positions, dtype=np.int32)
+        self._weights = np.array(weights, dtype=np.int16)
+
+        self._vocabulary_ids = {token: i for i, token in enumerate(self.vocabulary)}
+        self._by_deletion: Dict[str, List[int]] = {}
+        for i, token in enumerate(self.vocabulary):
+            if len(token) >= FUZZY_MIN_LENGTH and not token.isdigit():
+                for variant in _deletes(token):
+                    self._by_deletion.setdefault(variant, []).append(i)
+
+    def token_scores(self, query_token: str) -> np.ndarray:
+        """Best match score of one query token for every candidate of the run (0 = no match)"""
+        scores = np.zeros(self.size, dtype=np.int16)
+        lo = bisect_left(self.vocabulary, query_token)
+        hi = bisect_left(self.vocabulary, query_token + "\uffff", lo)
+
+        matches = []  # (first vocabulary id, end vocabulary id, match weight), weakest first
+        if len(query_token) >= FUZZY_MIN_LENGTH and not query_token.isdigit():
+            similar = set(self._by_deletion.get(query_token, ()))
+            for variant in _deletes(query_token):
+                similar.update(self._by_deletion.get(variant, ()))
+                if variant in self._vocabulary_ids:
+                    similar.add(self._vocabulary_ids[variant])
+            matches += [(i, i + 1, FUZZY_MATCH) for i in similar if not lo <= i < hi]
+        matches.append((lo, hi, PREFIX_MATCH))
+        if lo < hi and self.vocabulary[lo] == query_token:
+            matches.append((lo, lo + 1, EXACT_MATCH))
+
+        for first, end, match_weight in matches:
+            start, stop = self._offsets[first], self._offsets[end]
+            if start == stop:
+                continue
+            positions = self._positions[start:stop]
+            np.maximum.at(scores, positions, self._weights[start:stop] * match_weight)
+        return scores
+
+
+class CandidateSearchIndex:
+    """
+    Inverted index over candidate names, resume filenames and missing skills
+
+    Built once per data snapshot. The candidates are split into runs, each
+    indexed by a _Segment. Candidates added at either end by an incremental
+    sync go through extended(), which indexes only the new run and merges
+    neighbouring runs of similar size, so a sync costs time proportional to
+    what it added and there are only O(log n) segments to query. Results
+    are ranked by how well and where every query token matched; ties keep
+    the snapshot order.
+    """
+
+    def __init__(self, candidates: Sequence):
+        self.candidates = [record_from_dict(candidate) for candidate in candidates]
+        self._segments = [_Segment(self.candidates)]
+
+    @classmethod
+    def _from_segments(cls, records: List, segments: List[_Segment]) -> 'CandidateSearchIndex':
+        index = cls.__new__(cls)
+        index.candidates = records
+        index._segments = segments
+        return index
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    @property
+    def vocabulary(self) -> List[str]:
+        """Every indexed token, sorted"""
+        return sorted(set().union(*(segment.vocabulary for segment in self._segments)))
+
+    def extended(self, candidates: Sequence, prepend: bool = False) -> 'CandidateSearchIndex':
+        """
+        A new index with candidates added after (or before) the indexed ones
+
+        Only the new candidates are tokenized. Runs are then merged from that
+        end while a run is no larger than the next one, like carries in a
+        binary counter, which keeps every candidate's reindexing cost O(log n).
+        """
+        records = [record_from_dict(candidate) for candidate in candidates]
+        if not records:
+            return self
+        all_records = records + self.candidates if prepend else self.candidates + records
+
+        # Work from the end that grows: runs[-1] is the new one
+        runs = [segment.size for segment in self._segments if segment.size]
+        segments = [segment for segment in self._segments if segment.size]
+        if prepend:
+            runs.reverse()
+            segments.reverse()
+        runs.append(len(records))
+        segments.append(None)
+        while len(runs) > 1 and runs[-2] <= runs[-1]:
+            runs[-2:] = [runs[-2] + runs[-1]]
+            segments[-2:] = [None]
+
+        # Index the runs that are new or merged
+        bounds = np.cumsum([0] + (runs[::-1] if prepend else runs)).tolist()
+        if prepend:
+            segments.reverse()
+        for i, segment in enumerate(segments):
+            if segment is None:
+                segments[i] = _Segment(all_records[bounds[i]:bounds[i + 1]])
+        return CandidateSearchIndex._from_segments(all_records, segments)
+
+    def _token_scores(self, query_token: str) -> np.ndarray:
+        """Best match score of one query token for every candidate (0 = no match)"""
+        if len(self._segments) == 1:
+            return self._segments[0].token_scores(query_token)
+        return np.concatenate([segment.token_scores(query_token) for segment in self._segments])
+
+    def search_positions(self, query: str) -> np.ndarray:
+        """Positions of the candidates matching every query token, best match first"""
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens:
+            return np.arange(len(self.candidates))
+
+        total = None
+        for query_token in query_tokens:
+            scores = self._token_scores(query_token)
+            if total is None:
+                total = scores
+            else:
+                total = np.where((total > 0) & (scores > 0), total + scores, 0)
+        matched = np.flatnonzero(total > 0)
+        return matched[np.argsort(-total[matched], kind="stable")]
+
+    def results(self, positions: np.ndarray) -> SearchResults:
+        """Lazy ApplicationRecords at positions of this index"""
+        return SearchResults(self.candidates, positions)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List:
+        """ApplicationRecords matching every query token, best match first"""
+        return self.results(self.search_positions(query))[:limit]
+
+
+EMPTY_SEARCH_INDEX = CandidateSearchIndex([])
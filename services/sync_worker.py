@@ -0,0 +1,309 @@
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+import streamlit as st
+
+from services.api_service import DEFAULT_BACKEND_URL
+from services.aggregates import EMPTY_AGGREGATES, JobAggregates
+from services.async_api_service import PAGE_DATASETS
+from services.candidate_store import EMPTY_STORE, CandidateStore
+from services.columnar import EMPTY_COLUMNS, ApplicationColumns
+from services.data_cache import DataCache, get_backend_data_cache, is_cacheable, normalize_job
+from services.local_mirror import LocalMirror, mirror_path
+from services.query_cache import QueryCache
+from services.search_index import EMPTY_SEARCH_INDEX, CandidateSearchIndex
+from services.resilience import is_stale, mark_stale
+
+# Seconds between sync passes; each pass only reloads datasets whose DataCache TTL expired
+DEFAULT_SYNC_INTERVAL = 5
+FIRST_SYNC_TIMEOUT = 60  # Seconds a page waits for the very first snapshot
+
+
+class DataSnapshot(NamedTuple):
+    """
+    Immutable, versioned view of every dataset for one backend
+
+    Results keep the BackendAPIService shapes (lists, {"candidates": ...},
+    metrics dicts, {"error": ...}). A dataset whose latest sync failed carries
+    its last good data marked as stale. Nothing in a published snapshot is
+    ever modified; changes are published as a new version. The datasets and
+    synced_at mappings are published as read-only views.
+    """
+
+    version: int
+    datasets: Mapping[str, Any]
+    normalized_jobs: Any
+    synced_at: Mapping[str, float]  # Wall-clock load time per dataset
+    store: CandidateStore = EMPTY_STORE  # Jobs and candidates indexed by id, job, verdict and title
+    columns: ApplicationColumns = EMPTY_COLUMNS  # The store's applications as NumPy columns for aggregates
+    aggregates: JobAggregates = EMPTY_AGGREGATES  # Applicant count, average score and verdict counts per job
+    search: CandidateSearchIndex = EMPTY_SEARCH_INDEX  # Ranked name, resume filename and skill search
+
+    def get(self, name: str):
+        """Get one dataset result"""
+        return self.datasets.get(name, {"error": f"{name} not loaded yet"})
+
+    def page_data(self, include: Iterable[str] = PAGE_DATASETS) -> Dict[str, Any]:
+        """Get several dataset results keyed by name"""
+        return {name: self.get(name) for name in include}
+
+
+EMPTY_SNAPSHOT = DataSnapshot(0, MappingProxyType({}), {"error": "jobs not loaded yet"}, MappingProxyType({}))
+
+
+def _index(jobs_result, candidates_result, search: CandidateSearchIndex = EMPTY_SEARCH_INDEX
+           ) -> Tuple[CandidateStore, ApplicationColumns, JobAggregates, CandidateSearchIndex]:
+    """
+    Build the store, columnar table, per-job aggregates and search index of a snapshot's jobs and candidates
+
+    The previous snapshot's search index is extended rather than rebuilt when
+    candidates were only added before or after the ones it already indexes.
+    """
+    store = CandidateStore.from_results(jobs_result, candidates_result)
+    candidates = store.get_candidates()
+    columns = ApplicationColumns(candidates, store.jobs)
+    return store, columns, JobAggregates(store, columns), _search_index(search, candidates)
+
+
+def _search_index(search: CandidateSearchIndex, candidates: List) -> CandidateSearchIndex:
+    """Reuse a search index for candidates that only gained records at either end"""
+    indexed = search.candidates
+    added = len(candidates) - len(indexed)
+    if indexed and added >= 0:
+        if all(a is b for a, b in zip(indexed, candidates)):
+            return search.extended(candidates[len(indexed):])
+        if all(a is b for a, b in zip(indexed, candidates[added:])):
+            return search.extended(candidates[:added], prepend=True)
+    return CandidateSearchIndex(candidates)
+
+
+def _appended_candidates(before, after) -> Optional[List[Dict]]:
+    """The records added at the end of a candidates result, or None if it changed any other way"""
+    if not isinstance(before, dict) or is_stale(before) or "candidates" not in before:
+        return None
+    old, new = before["candidates"], after["candidates"]
+    if len(new) < len(old) or any(a is not b for a, b in zip(old, new)):
+        return None
+    return new[len(old):]
+
+
+class SyncWorker:
+    """
+    Background worker keeping one backend's datasets in sync
+
+    A daemon thread polls the DataCache on a schedule, so the backend is hit
+    once per dataset TTL no matter how many sessions are open, and publishes
+    a new DataSnapshot whenever something changed. Pages only read
+    worker.snapshot, which is a plain attribute read.
+
+    With a LocalMirror, the first snapshot is the mirrored data (marked stale)
+    and every freshly synced dataset is written back to the mirror.
+    """
+
+    def __init__(self, data_cache: DataCache, interval: float = DEFAULT_SYNC_INTERVAL,
+                 mirror: Optional[LocalMirror] = None):
+        self.data_cache = data_cache
+        self.interval = interval
+        self.mirror = mirror
+        self.snapshot = self._warm_start() if mirror is not None else EMPTY_SNAPSHOT
+        self.queries = QueryCache()  # Filtered candidate lists, keyed by snapshot version
+        self.syncs = 0
+        self._start_lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+        self._first_sync = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def _warm_start(self) -> DataSnapshot:
+        """Build the first snapshot from the local mirror"""
+        datasets, synced_at = {}, {}
+        for name in PAGE_DATASETS:
+            try:
+                mirrored = self.mirror.load_dataset(name)
+            except Exception as e:
+                print(f"Could not read {name} from local mirror: {str(e)}")
+                mirrored = None
+            if mirrored is not None:
+                data, synced_at[name] = mirrored
+                datasets[name] = mark_stale(data, synced_at[name])
+        if not datasets:
+            return EMPTY_SNAPSHOT
+        print(f"Warm start from local mirror: {', '.join(sorted(datasets))}")
+        jobs = datasets.get("jobs")
+        normalized_jobs = [normalize_job(job) for job in jobs] if jobs is not None else EMPTY_SNAPSHOT.normalized_jobs
+        indexes = _index(jobs or [], datasets.get("candidates", {}))
+        return DataSnapshot(1, MappingProxyType(datasets), normalized_jobs, MappingProxyType(synced_at), *indexes)
+
+    def start(self) -> 'SyncWorker':
+        """Start the sync thread if it is not running"""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=f"sync-{self.data_cache.api_service.base_url}",
+                                                daemon=True)
+                self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"Background sync failed: {str(e)}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def sync(self):
+        """Reload expired datasets and publish a new snapshot if anything changed"""
+        results = self.data_cache.get_page_data(PAGE_DATASETS)
+        with self._publish_lock:
+            self.syncs += 1
+            self._publish(results)
+        self._first_sync.set()
+
+    def _publish(self, results: Optional[Dict[str, Any]] = None):
+        """Build the next snapshot from the cache (publish lock held)"""
+        results = results or {}
+        current = self.snapshot
+        datasets, synced_at = {}, {}
+        normalized_jobs = current.normalized_jobs
+        for name in PAGE_DATASETS:
+            dataset = self.data_cache.peek(name)
+            result = results.get(name)
+            previous = current.datasets.get(name)
+            if dataset is None:
+                if name in current.synced_at:
+                    # Dropped by a write - keep the last good data pages already see until it reloads
+                    datasets[name] = previous
+                    synced_at[name] = current.synced_at[name]
+                else:
+                    # Never loaded - publish the load error
+                    datasets[name] = result if result is not None else current.get(name)
+                    if name == "jobs":
+                        normalized_jobs = datasets[name]
+                continue
+            synced_at[name] = dataset.fetched_at
+            if name == "jobs":
+                normalized_jobs = dataset.normalized
+            if result is None or is_cacheable(result):
+                datasets[name] = dataset.data
+            elif is_stale(previous) and current.synced_at.get(name) == dataset.fetched_at:
+                datasets[name] = previous  # Still failing - no new version needed
+            else:
+                datasets[name] = mark_stale(dataset.data, dataset.fetched_at)
+
+        unchanged = all(datasets[name] is current.datasets.get(name) for name in PAGE_DATASETS)
+        if current.version and unchanged and normalized_jobs is current.normalized_jobs \
+                and synced_at == current.synced_at:
+            return
+        # Indexes and aggregates only depend on jobs and candidates; carry them over otherwise
+        indexes = (current.store, current.columns, current.aggregates, current.search)
+        indexed = ("jobs", "candidates")
+        if not current.version or any(datasets[name] is not current.datasets.get(name) for name in indexed):
+            indexes = _index(datasets["jobs"], datasets["candidates"], current.search)
+        self.snapshot = DataSnapshot(current.version + 1, MappingProxyType(datasets), normalized_jobs,
+                                     MappingProxyType(synced_at), *indexes)
+        self._mirror_changes(current, self.snapshot)
+
+    def _mirror_changes(self, previous: DataSnapshot, snapshot: DataSnapshot):
+        """Write datasets that changed and are freshly synced to the local mirror (publish lock held)"""
+        if self.mirror is None:
+            return
+        for name, result in snapshot.datasets.items():
+            before = previous.datasets.get(name)
+            if result is before or not is_cacheable(result):
+                continue
+            try:
+                appended = _appended_candidates(before, result) if name == "candidates" else None
+                if appended is not None:
+                    self.mirror.append_applications(appended, result["total"] - len(appended),
+                                                    snapshot.synced_at.get(name))
+                else:
+                    self.mirror.save_dataset(name, result, snapshot.synced_at.get(name))
+            except Exception as e:
+                print(f"Could not write {name} to local mirror: {str(e)}")
+
+    def wait_for_first_sync(self, timeout: float = FIRST_SYNC_TIMEOUT) -> DataSnapshot:
+        """Get the current snapshot, blocking on a cold start (no mirror data) until the first sync has finished"""
+        if self.snapshot.version == 0:
+            self._first_sync.wait(timeout)
+        return self.snapshot
+
+    # === WRITE-THROUGH ===
+
+    def add_job(self, created_job: Dict):
+        """Apply a created job and publish it right away"""
+        self.data_cache.add_job(created_job)
+        self._republish()
+
+    def add_application(self, job_id, application: Dict, resume_filename: str = None):
+        """Apply a submitted application and publish it right away"""
+        self.data_cache.add_application(job_id, application, resume_filename)
+        self._republish()
+
+    def _republish(self):
+        with self._publish_lock:
+            self._publish()
+        self._wake.set()  # Reload expired metrics and any dataset the write dropped
+
+    # === WINDOWED READS ===
+
+    def candidate_window(self, skip: int, limit: int) -> Dict:
+        """
+        Get one skip/limit window of candidates
+
+        Sliced from the snapshot when every candidate is synced; otherwise only
+        that window is fetched from the backend (through its response cache).
+
+        Returns:
+            Dict: {"candidates": [...], "total": full count or None if unknown, "has_more": bool},
+            or {"error": ...}
+        """
+        synced = self.snapshot.get("candidates")
+        if "error" not in synced:
+            records = synced["candidates"]
+            return {"candidates": records[skip:skip + limit], "total": len(records),
+                    "has_more": skip + limit < len(records)}
+
+        # One extra record tells whether a next page exists
+        result = self.data_cache.api_service.get_candidates(skip=skip, limit=limit + 1)
+        if "error" in result:
+            return result
+        window = {"candidates": result["candidates"][:limit], "total": None,
+                  "has_more": len(result["candidates"]) > limit}
+        if is_stale(result):
+            window.update(stale=True, stale_as_of=result["stale_as_of"])
+        return window
+
+    def get_stats(self) -> Dict:
+        """Get the snapshot version and sync counters"""
+        snapshot = self.snapshot
+        return {
+            "version": snapshot.version,
+            "syncs": self.syncs,
+            "synced_at": dict(snapshot.synced_at),
+            "running": self._thread is not None and self._thread.is_alive()
+        }
+
+
+@st.cache_resource(show_spinner=False)
+def get_backend_sync_worker(backend_url: str) -> SyncWorker:
+    """Get the shared, running sync worker for a backend URL"""
+    print(f"Starting background sync for {backend_url}")
+    try:
+        mirror = LocalMirror(mirror_path(backend_url))
+    except Exception as e:
+        print(f"Local mirror unavailable, continuing without it: {str(e)}")
+        mirror = None
+    return SyncWorker(get_backend_data_cache(backend_url), mirror=mirror).start()
+
+
+def get_sync_worker() -> SyncWorker:
+    """Get the sync worker for this session's backend"""
+    backend_url = st.session_state.get("backend_url", DEFAULT_BACKEND_URL)
+    return get_backend_sync_worker(backend_url.rstrip('/'))
+
+
+def get_snapshot() -> DataSnapshot:
+    """Get the current data snapshot for this session's backend"""
+    return get_sync_worker().wait_for_first_sync()
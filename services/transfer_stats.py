@@ -0,0 +1,78 @@
+import threading
+from typing import Dict, Iterable, Iterator
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Every content coding urllib3 can decode in this environment: gzip and deflate,
+# plus br and zstd through the brotli / zstandard packages in requirements.txt
+SUPPORTED_ENCODINGS = ACCEPT_ENCODING
+
+
+class TransferStats:
+    """
+    Per-endpoint counters of bytes received on the wire versus bytes after decoding
+
+    "wire" bytes are what the socket delivered (compressed if the backend
+    compressed the response); "decoded" bytes are what reached the JSON decoder.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, path: str, wire_bytes: int, decoded_bytes: int, encoding: str = None):
+        """Add one response body to the counters for an endpoint path"""
+        with self._lock:
+            counters = self._endpoints.setdefault(path, {
+                "responses": 0, "compressed_responses": 0, "wire_bytes": 0, "decoded_bytes": 0
+            })
+            counters["responses"] += 1
+            if encoding and encoding != 'identity':
+                counters["compressed_responses"] += 1
+            counters["wire_bytes"] += wire_bytes
+            counters["decoded_bytes"] += decoded_bytes
+
+    def count_chunks(self, path: str, response, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Pass decoded body chunks through, recording the transfer once the body is consumed
+
+        Args:
+            path (str): Endpoint path the counters are kept under
+            response: The streamed requests.Response the chunks come from
+            chunks: Decoded chunks, e.g. response.iter_content(chunk_size=65536)
+        """
+        decoded_bytes = 0
+        try:
+            for chunk in chunks:
+                decoded_bytes += len(chunk)
+                yield chunk
+        finally:
+            self.record_response(path, response, decoded_bytes)
+
+    def record_response(self, path: str, response, decoded_bytes: int = None):
+        """Record a response whose body has been read (decoded size defaults to len(response.content))"""
+        if decoded_bytes is None:
+            decoded_bytes = len(response.content or b'')
+        raw = getattr(response, 'raw', None)
+        try:
+            wire_bytes = raw.tell()
+        except (AttributeError, OSError):
+            wire_bytes = decoded_bytes
+        self.record(path, wire_bytes, decoded_bytes, response.headers.get('Content-Encoding'))
+
+    def get_stats(self) -> Dict:
+        """Get byte counters and bandwidth saved per endpoint"""
+        with self._lock:
+            endpoints = {path: dict(counters) for path, counters in self._endpoints.items()}
+        for counters in endpoints.values():
+            decoded = counters["decoded_bytes"]
+            counters["saved_ratio"] = round(1 - counters["wire_bytes"] / decoded, 3) if decoded else 0.0
+        return {"accept_encoding": SUPPORTED_ENCODINGS, "endpoints": endpoints}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+# Shared by every API service in the process
+transfer_stats = TransferStats()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Test the per-job aggregate table shared by the pages
+"""
+
+from services.aggregates import JobAggregates
+from services.candidate_store import CandidateStore
+from services.columnar import ApplicationColumns
+from services.ingestion import ingest_application
+
+
+def test_aggregates_by_job_and_title():
+    jobs = [{"id": 1, "job_title": "Backend Developer"}, {"id": 2, "job_title": "Backend Developer"},
+            {"id": 3, "job_title": "Data Analyst"}]
+    applications = [ingest_application(app) for app in [
+        {"id": 10, "job_id": 1, "relevance_score": 90, "verdict": "High"},
+        {"id": 11, "job_id": 1, "relevance_score": 61, "verdict": "Medium"},
+        {"id": 12, "job_id": 2, "relevance_score": 30, "verdict": "Low"},
+    ]]
+    store = CandidateStore(jobs, applications)
+    aggregates = JobAggregates(store, ApplicationColumns(store.get_candidates(), store.jobs))
+
+    job = aggregates.for_job(1)
+    assert (job.applicants, job.avg_score, job.high_fit, job.medium_fit, job.low_fit) == (2, 76, 1, 1, 0)
+    title = aggregates.for_title("Backend Developer")
+    assert (title.applicants, title.avg_score, title.low_fit) == (3, 60, 1)
+    assert aggregates.for_job(3).applicants == 0
+    assert aggregates.find(job_id=3, title="Backend Developer").applicants == 0, "job id wins over title"
+    assert aggregates.find(title="Data Analyst").applicants == 0
+    assert aggregates.find(job_id=42, title="Unknown") is None
+
+
+if __name__ == "__main__":
+    test_aggregates_by_job_and_title()
+    print("✅ Job aggregate tests passed")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test the id-keyed candidate store and its secondary indexes
+"""
+
+from services.candidate_store import CandidateStore
+
+JOBS = [
+    {"id": 1, "job_title": "Backend Developer"},
+    {"id": 2, "job_title": "Data Analyst"},
+    {"id": 3, "job_title": "Backend Developer"},
+]
+CANDIDATES = [
+    {"id": 10, "job_id": 1, "verdict": "High Fit", "score": 90},
+    {"id": 11, "job_id": 2, "verdict": "Low suitability", "score": 30},
+    {"id": 12, "job_id": 3, "verdict": "Medium", "score": 60},
+    {"id": 13, "job_id": 1, "verdict": None, "score": 50},
+]
+
+
+def test_indexes():
+    store = CandidateStore(JOBS, CANDIDATES)
+    assert [c["id"] for c in store.applications_for_job(1)] == [10, 13]
+    assert store.count_for_job(4) == 0
+    assert [c["id"] for c in store.applications_with_verdict("Medium")] == [12, 13]
+    assert store.count_with_verdict("High") == 1
+    assert store.job_ids_by_title["Backend Developer"] == [1, 3]
+    assert sorted(c["id"] for c in store.applications_for_title("Backend Developer")) == [10, 12, 13]
+
+
+def test_duplicate_application_replaces_the_old_record():
+    store = CandidateStore(JOBS, CANDIDATES + [{"id": 11, "job_id": 1, "verdict": "High", "score": 95}])
+    assert store.count_for_job(2) == 0
+    assert store.count_with_verdict("Low") == 0
+    assert [c["id"] for c in store.applications_for_job(1)] == [10, 13, 11]
+    assert len(store.get_candidates()) == 4
+
+
+def test_error_results_give_an_empty_store():
+    store = CandidateStore.from_results({"error": "down"}, {"error": "down"})
+    assert store.get_jobs() == [] and store.get_candidates() == []
+
+
+if __name__ == "__main__":
+    test_indexes()
+    test_duplicate_application_replaces_the_old_record()
+    test_error_results_give_an_empty_store()
+    print("✅ Candidate store tests passed")
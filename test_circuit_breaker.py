@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test the circuit breaker and the last-good fallback of the API service
+"""
+
+import time
+
+from services.resilience import CIRCUIT_CLOSED, CIRCUIT_OPEN, CircuitBreaker, CircuitOpenError, is_stale
+from test_response_cache import FakeBackend, make_service
+
+
+def test_breaker_opens_at_the_threshold_and_fails_fast():
+    breaker = CircuitBreaker(probe=lambda: False, failure_threshold=3, reset_timeout=60, name="test")
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()  # Only consecutive failures count
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.before_request()
+    assert breaker.state == CIRCUIT_CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+    for _ in range(2):
+        try:
+            breaker.before_request()
+            assert False, "expected CircuitOpenError"
+        except CircuitOpenError:
+            pass
+    assert breaker.get_state()["rejected_requests"] == 2 and breaker.times_opened == 1
+
+
+def test_successful_probe_closes_the_breaker():
+    probes = []
+    breaker = CircuitBreaker(probe=lambda: probes.append(1) or len(probes) >= 2, failure_threshold=1,
+                             reset_timeout=0.02, name="test")
+    breaker.record_failure()
+    deadline = time.monotonic() + 5
+    while breaker.state != CIRCUIT_CLOSED and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert breaker.state == CIRCUIT_CLOSED and len(probes) == 2
+    breaker.before_request()
+
+
+def test_service_serves_last_good_data_and_stops_calling_a_failing_backend():
+    backend = FakeBackend()
+    service = make_service(backend, jobs_ttl=0)  # Every read goes to the backend
+    try:
+        assert service.get_jobs() == backend.body
+
+        backend.status = 503
+        for _ in range(service.circuit_breaker.failure_threshold):
+            result = service.get_jobs()
+            assert is_stale(result) and list(result) == [{"id": 1, "job_title": "Backend Developer"}]
+        assert service.circuit_breaker.state != CIRCUIT_CLOSED
+
+        sent = len(backend.requests)
+        assert is_stale(service.get_jobs())
+        assert len(backend.requests) == sent, "an open circuit must not reach the backend"
+    finally:
+        service.close()
+        backend.close()
+
+
+if __name__ == "__main__":
+    test_breaker_opens_at_the_threshold_and_fails_fast()
+    test_successful_probe_closes_the_breaker()
+    test_service_serves_last_good_data_and_stops_calling_a_failing_backend()
+    print("✅ Circuit breaker tests passed")
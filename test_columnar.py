@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test the columnar application table used for report aggregates
+"""
+
+from services.columnar import ApplicationColumns
+from services.ingestion import Verdict, ingest_application
+
+
+def make_applications():
+    raw = [
+        {"id": 1, "job_id": 10, "relevance_score": 90, "verdict": "High", "application_date": "2025-09-01T10:00:00Z"},
+        {"id": 2, "job_id": 20, "relevance_score": 40, "verdict": "Low"},
+        {"id": 3, "job_id": 10, "relevance_score": 70, "verdict": "Medium suitability"},
+        {"id": 4, "job_id": 99, "relevance_score": 55, "verdict": None},
+    ]
+    return [ingest_application(app) for app in raw]
+
+
+def test_group_bys_match_list_scans():
+    applications = make_applications()
+    columns = ApplicationColumns(applications, job_ids=[10, 20, 30])
+
+    assert columns.job_ids == [10, 20, 30, 99], "jobs only seen on applications are appended"
+    assert columns.job_counts().tolist() == [2, 1, 0, 1]
+    assert columns.job_score_sums().tolist() == [160, 40, 0, 55]
+    assert columns.job_verdict_counts().tolist() == [[1, 1, 0], [0, 0, 1], [0, 0, 0], [0, 1, 0]]
+    assert columns.verdict_counts() == {Verdict.HIGH: 1, Verdict.MEDIUM: 2, Verdict.LOW: 1}
+    assert columns.mean_score() == sum(app.score for app in applications) / len(applications)
+    assert columns.job_positions([20, 42, 10]) == [1, 0]
+
+
+def test_histogram_and_dates():
+    columns = ApplicationColumns(make_applications())
+    counts, edges = columns.score_histogram(bins=10)
+    assert counts.sum() == 4 and counts[9] == 1 and edges[0] == 0 and edges[-1] == 100
+    assert str(columns.applied_at[0]) == "2025-09-01T10:00:00"
+    assert str(columns.applied_at[1]) == "NaT"
+
+
+def test_empty_table():
+    columns = ApplicationColumns([])
+    assert len(columns) == 0
+    assert columns.mean_score() == 0.0
+    assert columns.verdict_counts() == {Verdict.HIGH: 0, Verdict.MEDIUM: 0, Verdict.LOW: 0}
+
+
+if __name__ == "__main__":
+    test_group_bys_match_list_scans()
+    test_histogram_and_dates()
+    test_empty_table()
+    print("✅ Columnar table tests passed")
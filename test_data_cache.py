@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test incremental candidate syncs and write-through in the shared data cache
+"""
+
+from services.data_cache import DataCache
+from services.ingestion import ingest_application
+
+
+def application(app_id: int, job_id: int = 1):
+    return ingest_application({"id": app_id, "job_id": job_id, "relevance_score": 70, "verdict": "Medium",
+                               "resume_filename": f"candidate_{app_id}_resume.pdf"})
+
+
+class FakeAPIService:
+    """Backend whose application list can grow; records which loads were asked for"""
+
+    base_url = "http://fake-backend"
+
+    def __init__(self, ids, newest_first: bool = False):
+        self.ids = list(ids)
+        self.newest_first = newest_first
+        self.calls = []
+
+    def _listed(self):
+        return sorted(self.ids, reverse=self.newest_first)
+
+    def get_all_candidates(self):
+        self.calls.append("full")
+        candidates = [application(app_id) for app_id in self._listed()]
+        return {"candidates": candidates, "total": len(candidates)}
+
+    def get_candidates_after(self, after_id, known_count, newest_first=False):
+        self.calls.append(("after", after_id))
+        candidates = [application(app_id) for app_id in self._listed() if app_id > after_id]
+        return {"candidates": candidates, "total": len(candidates)}
+
+    def get_all_jobs(self):
+        return [{"id": 1, "job_title": "Backend Developer"}]
+
+    def get_metrics(self):
+        return {"total_applications": len(self.ids)}
+
+
+def ids(result):
+    return [candidate.id for candidate in result["candidates"]]
+
+
+def make_cache(api: FakeAPIService, ttl: float = 0) -> DataCache:
+    return DataCache(api, ttls={"candidates": ttl, "jobs": 60, "metrics": 60})
+
+
+def test_fresh_datasets_are_not_reloaded():
+    api = FakeAPIService([1, 2])
+    cache = make_cache(api, ttl=60)
+    first = cache.get("candidates")
+    assert cache.get("candidates") is first
+    assert api.calls == ["full"] and cache.hits == 1
+
+
+def test_incremental_sync_merges_above_the_watermark_without_duplicates():
+    api = FakeAPIService([1, 2, 3])
+    cache = make_cache(api)
+    assert ids(cache.get("candidates")) == [1, 2, 3]
+
+    # Our own application shows up right away; the backend then also lists it
+    cache.add_application(1, {"id": 4, "relevance_score": 80, "verdict": "High"}, "new_resume.pdf")
+    assert ids(cache.peek("candidates").data) == [1, 2, 3, 4]
+    api.ids += [4, 5]
+    result = cache.get("candidates")
+    assert ids(result) == [1, 2, 3, 4, 5]
+    assert result["total"] == 5
+    assert api.calls == ["full", ("after", 3)]
+    assert cache.peek("candidates").watermark == {"id": 5, "count": 5, "newest_first": False}
+
+
+def test_newest_first_lists_are_merged_at_the_front():
+    api = FakeAPIService([1, 2, 3], newest_first=True)
+    cache = make_cache(api)
+    assert ids(cache.get("candidates")) == [3, 2, 1]
+    api.ids += [4]
+    assert ids(cache.get("candidates")) == [4, 3, 2, 1]
+
+
+def test_sync_without_new_applications_stores_a_new_dataset():
+    api = FakeAPIService([1, 2])
+    cache = make_cache(api)
+    first = cache.get("candidates")
+    before = cache.peek("candidates")
+
+    assert cache.get("candidates") is first  # Same data...
+    after = cache.peek("candidates")
+    assert after is not before and after.fetched_at >= before.fetched_at  # ...under a new load time
+    assert before.loaded_at < after.loaded_at
+
+
+def test_full_reload_after_the_reconcile_interval():
+    api = FakeAPIService([1, 2])
+    cache = DataCache(api, ttls={"candidates": 0}, full_reconcile_interval=0)
+    cache.get("candidates")
+    api.ids.remove(1)  # Deletes are only seen by a full reload
+    assert ids(cache.get("candidates")) == [2]
+    assert api.calls == ["full", "full"]
+
+
+if __name__ == "__main__":
+    test_fresh_datasets_are_not_reloaded()
+    test_incremental_sync_merges_above_the_watermark_without_duplicates()
+    test_newest_first_lists_are_merged_at_the_front()
+    test_sync_without_new_applications_stores_a_new_dataset()
+    test_full_reload_after_the_reconcile_interval()
+    print("✅ Data cache tests passed")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test hedged requests against a slow first attempt
+"""
+
+import threading
+import time
+
+from services.hedging import HedgePolicy, send_hedged
+
+
+class FakeResponse:
+    def __init__(self, name: str):
+        self.name = name
+        self.closed = threading.Event()
+
+    def close(self):
+        self.closed.set()
+
+
+def make_policy(max_hedge_ratio: float = 1.0) -> HedgePolicy:
+    """A policy with enough fast history that anything slower than 50 ms gets hedged"""
+    policy = HedgePolicy(max_hedge_ratio=max_hedge_ratio, min_samples=3)
+    for _ in range(3):
+        policy.record_latency('/jobs/', 0.001)
+    return policy
+
+
+def slow_then_fast(slow_seconds: float = 0.5):
+    """A send() whose first call is slow and whose later calls answer at once"""
+    responses = []
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            attempt = len(responses)
+            response = FakeResponse("primary" if attempt == 0 else "hedge")
+            responses.append(response)
+        if attempt == 0:
+            time.sleep(slow_seconds)
+        return response
+
+    return send, responses
+
+
+def test_hedge_wins_against_a_slow_primary():
+    policy = make_policy()
+    send, responses = slow_then_fast()
+
+    started = time.monotonic()
+    response = send_hedged(policy, '/jobs/', send)
+    assert response.name == "hedge"
+    assert time.monotonic() - started < 0.4
+    assert policy.get_stats()["hedges"] == 1 and policy.get_stats()["hedge_wins"] == 1
+
+    # The losing primary's response is closed when it finally arrives
+    assert responses[0].closed.wait(2)
+    assert not response.closed.is_set()
+
+
+def test_no_hedge_without_latency_history_or_budget():
+    send, responses = slow_then_fast(slow_seconds=0.1)
+    assert send_hedged(HedgePolicy(min_samples=3), '/jobs/', send).name == "primary"
+    assert len(responses) == 1
+
+    policy = make_policy(max_hedge_ratio=0.0)
+    send, responses = slow_then_fast(slow_seconds=0.1)
+    assert send_hedged(policy, '/jobs/', send).name == "primary"
+    assert len(responses) == 1 and policy.get_stats()["hedges"] == 0
+
+
+if __name__ == "__main__":
+    test_hedge_wins_against_a_slow_primary()
+    test_no_hedge_without_latency_history_or_budget()
+    print("✅ Hedging tests passed")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test decoding backend applications into ApplicationRecords
+"""
+
+import json
+
+from services.ingestion import Verdict, ingest_application, name_from_filename, record_from_dict
+
+BACKEND_APPLICATION = {
+    "id": 124,
+    "job_id": 2,
+    "relevance_score": 72,
+    "verdict": "Medium suitability",
+    "missing_skills": ["React", "TypeScript"],
+    "feedback": "Good foundation but needs more frontend experience.",
+    "resume_filename": "jane_smith_resume.pdf",
+    "application_date": "2025-09-21T03:15:10.540Z",
+    "job": {"id": 2, "job_title": "Full Stack Developer"}
+}
+
+
+def test_backend_application_is_decoded_once():
+    record = ingest_application(BACKEND_APPLICATION)
+    assert record.name == "Jane Smith"
+    assert record.job_role == "Full Stack Developer"
+    assert record.score == 72
+    assert record.verdict is Verdict.MEDIUM and record.verdict == "Medium"
+    assert record.missing_skills == ("React", "TypeScript")
+    assert record.resume_file == "jane_smith_resume.pdf"
+    assert record.applied_at.year == 2025 and record.applied_at.tzinfo is not None
+    assert record["application_id"] == 124 and record.get("feedback").startswith("Good")
+    assert not hasattr(record, "__dict__")
+
+
+def test_name_fallback_chain():
+    assert ingest_application({"id": 1, "candidate_name": "Ann", "applicant_name": "Bob"}).name == "Ann"
+    assert ingest_application({"id": 1, "applicant_name": "Bob", "name": "Cy"}).name == "Bob"
+    assert ingest_application({"id": 1, "name": "Cy", "resume_filename": "dan_resume.pdf"}).name == "Cy"
+    assert ingest_application({"id": 1, "resume_filename": "dan_lee_resume.pdf"}).name == "Dan Lee"
+    assert ingest_application({"id": 7, "resume_filename": "resume.pdf"}).name == "Candidate 7"
+    assert name_from_filename(".pdf") is None
+
+
+def test_verdicts_and_bad_dates():
+    assert Verdict.parse("High Fit") is Verdict.HIGH
+    assert Verdict.parse("Low suitability") is Verdict.LOW
+    assert Verdict.parse(None) is Verdict.MEDIUM
+    assert f"{Verdict.HIGH} Fit" == "High Fit"
+    assert ingest_application({"id": 1, "application_date": "yesterday"}).applied_at is None
+
+
+def test_round_trip_through_json():
+    record = ingest_application(BACKEND_APPLICATION)
+    restored = record_from_dict(json.loads(json.dumps(dict(record))))
+    assert restored.to_dict() == record.to_dict()
+    assert restored.verdict is Verdict.MEDIUM
+
+
+if __name__ == "__main__":
+    test_backend_application_is_decoded_once()
+    test_name_fallback_chain()
+    test_verdicts_and_bad_dates()
+    test_round_trip_through_json()
+    print("✅ Ingestion tests passed")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test the incremental JSON array decoder used for streaming /applications/ responses
+"""
+
+import json
+
+from services.json_stream import iter_json_array
+
+
+def chunked(payload: bytes, size: int):
+    """Split a payload into fixed-size chunks like a socket would deliver it"""
+    return [payload[i:i + size] for i in range(0, len(payload), size)]
+
+
+def test_decodes_across_chunk_boundaries():
+    """Every chunk size must produce the same elements as json.loads"""
+    applications = [
+        {"id": 1, "verdict": "High", "feedback": "Strong ] candidate, \"really\"", "missing_skills": ["Next.js"]},
+        {"id": 2, "verdict": "Medium", "relevance_score": 72.5, "missing_skills": []},
+        12345, -1.5e3, True, None, "héllo ✓"
+    ]
+    payload = json.dumps(applications).encode('utf-8')
+
+    for size in range(1, 40):
+        assert list(iter_json_array(chunked(payload, size))) == applications
+
+
+def test_each_element_is_decoded_once():
+    """A large element split over many chunks is decoded at most twice (one early try, one when complete)"""
+    applications = [{"id": i, "feedback": "x \\ \"y\" " * 2000, "missing_skills": ["a]", "{b"]} for i in range(3)]
+    payload = json.dumps(applications).encode('utf-8')
+
+    calls = []
+    raw_decode = json.JSONDecoder.raw_decode
+    def counting_raw_decode(self, text, idx=0):
+        calls.append(idx)
+        return raw_decode(self, text, idx)
+
+    json.JSONDecoder.raw_decode = counting_raw_decode
+    try:
+        assert list(iter_json_array(chunked(payload, 64))) == applications
+    finally:
+        json.JSONDecoder.raw_decode = raw_decode
+    assert len(calls) <= 2 * len(applications)
+
+
+def test_empty_and_whitespace_arrays():
+    assert list(iter_json_array([b'[]'])) == []
+    assert list(iter_json_array([b' [ 1 ,', b' 2 ] \n'])) == [1, 2]
+
+
+def test_rejects_truncated_or_non_array_payloads():
+    for payload in (b'[{"id": 1}, {"id"', b'{"error": "boom"}'):
+        try:
+            list(iter_json_array([payload]))
+        except ValueError as e:
+            print(f"Rejected {payload!r}: {e}")
+        else:
+            raise AssertionError(f"Expected ValueError for {payload!r}")
+
+
+if __name__ == "__main__":
+    test_decodes_across_chunk_boundaries()
+    test_each_element_is_decoded_once()
+    test_empty_and_whitespace_arrays()
+    test_rejects_truncated_or_non_array_payloads()
+    print("✅ Streaming JSON decoder tests passed")
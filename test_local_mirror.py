@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite mirror used for warm starts and outages
+"""
+
+from services.ingestion import ApplicationRecord, ingest_application
+from services.local_mirror import LocalMirror
+from services.resilience import is_stale
+from services.sync_worker import SyncWorker
+
+
+def application(app_id: int, job_id: int, verdict: str, date: str):
+    return ingest_application({"id": app_id, "job_id": job_id, "relevance_score": 70, "verdict": verdict,
+                               "resume_filename": f"candidate_{app_id}_resume.pdf", "application_date": date})
+
+
+def make_mirror() -> LocalMirror:
+    mirror = LocalMirror(':memory:')
+    mirror.save_dataset("jobs", [{"id": 1, "job_title": "Backend Developer"}], synced_at=100.0)
+    mirror.save_dataset("candidates", {"candidates": [
+        application(1, 1, "High", "2025-09-01T10:00:00Z"),
+        application(2, 2, "Low", "2025-09-02T10:00:00Z"),
+    ], "total": 2}, synced_at=100.0)
+    return mirror
+
+
+def test_datasets_round_trip():
+    mirror = make_mirror()
+    jobs, synced_at = mirror.load_dataset("jobs")
+    assert jobs == [{"id": 1, "job_title": "Backend Developer"}] and synced_at == 100.0
+
+    candidates, _ = mirror.load_dataset("candidates")
+    assert [c.id for c in candidates["candidates"]] == [1, 2] and candidates["total"] == 2
+    assert all(isinstance(c, ApplicationRecord) for c in candidates["candidates"])
+    assert mirror.load_dataset("metrics") is None
+
+
+def test_appended_applications_replace_by_id():
+    mirror = make_mirror()
+    mirror.append_applications([application(2, 2, "High", "2025-09-02T10:00:00Z"),
+                                application(3, 1, "Medium", "2025-09-03T10:00:00Z")], 1, synced_at=200.0)
+    candidates, synced_at = mirror.load_dataset("candidates")
+    assert [(c.id, c.verdict) for c in candidates["candidates"]] == [(1, "High"), (2, "High"), (3, "Medium")]
+    assert synced_at == 200.0
+
+    assert [c.id for c in mirror.get_applications(job_id=1)] == [1, 3]
+    assert [c.id for c in mirror.get_applications(verdict="High", since="2025-09-02")] == [2]
+
+
+def test_sync_worker_warm_starts_from_the_mirror():
+    worker = SyncWorker(data_cache=None, mirror=make_mirror())
+    snapshot = worker.snapshot
+    assert snapshot.version == 1 and snapshot.synced_at["candidates"] == 100.0
+    assert is_stale(snapshot.get("candidates")) and is_stale(snapshot.get("jobs"))
+    assert [c.id for c in snapshot.store.applications_for_job(1)] == [1]
+
+
+if __name__ == "__main__":
+    test_datasets_round_trip()
+    test_appended_applications_replace_by_id()
+    test_sync_worker_warm_starts_from_the_mirror()
+    print("✅ Local mirror tests passed")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test skip/limit candidate windows served by the sync worker
+"""
+
+import threading
+
+from services.api_service import BackendAPIService
+from services.sync_worker import DataSnapshot, SyncWorker
+
+
+class FakeAPIService:
+    """Backend with 7 applications that records every window it is asked for"""
+
+    def __init__(self):
+        self.requests = []
+
+    def get_candidates(self, skip=0, limit=100):
+        self.requests.append((skip, limit))
+        candidates = [{"id": i} for i in range(7)][skip:skip + limit]
+        return {"candidates": candidates, "total": len(candidates)}
+
+
+class FakeDataCache:
+    def __init__(self):
+        self.api_service = FakeAPIService()
+
+
+def test_window_is_fetched_when_candidates_are_not_synced():
+    worker = SyncWorker(FakeDataCache())
+
+    window = worker.candidate_window(skip=0, limit=5)
+    assert [c["id"] for c in window["candidates"]] == [0, 1, 2, 3, 4]
+    assert window["total"] is None and window["has_more"]
+
+    window = worker.candidate_window(skip=5, limit=5)
+    assert [c["id"] for c in window["candidates"]] == [5, 6]
+    assert not window["has_more"]
+    assert worker.data_cache.api_service.requests == [(0, 6), (5, 6)]
+
+
+def test_window_is_sliced_from_a_synced_snapshot():
+    worker = SyncWorker(FakeDataCache())
+    candidates = {"candidates": [{"id": i} for i in range(7)], "total": 7}
+    worker.snapshot = DataSnapshot(1, {"candidates": candidates}, [], {})
+
+    window = worker.candidate_window(skip=5, limit=5)
+    assert [c["id"] for c in window["candidates"]] == [5, 6]
+    assert window["total"] == 7 and not window["has_more"]
+    assert worker.data_cache.api_service.requests == []
+
+
+def paged_fetcher(total: int):
+    """fetch_page over total records that logs every skip it is asked for"""
+    requested, lock = [], threading.Lock()
+
+    def fetch_page(skip, limit):
+        with lock:
+            requested.append(skip)
+        return list(range(total))[skip:skip + limit]
+
+    return fetch_page, requested
+
+
+def test_backend_pages_fan_out_only_after_a_full_first_page():
+    service = BackendAPIService("http://127.0.0.1:9")  # Never contacted
+
+    fetch_page, requested = paged_fetcher(30)
+    assert list(service._iter_pages(fetch_page, 100, 4)) == [(0, list(range(30)))]
+    assert requested == [0]
+
+    fetch_page, requested = paged_fetcher(250)
+    pages = dict(service._iter_pages(fetch_page, 100, 4))
+    assert [record for skip in sorted(pages) for record in pages[skip]] == list(range(250))
+    # Pages past the end may be in flight before the short page arrives
+    assert requested[0] == 0 and {0, 100, 200} <= set(requested) <= {0, 100, 200, 300, 400, 500}
+
+
+if __name__ == "__main__":
+    test_window_is_fetched_when_candidates_are_not_synced()
+    test_window_is_sliced_from_a_synced_snapshot()
+    test_backend_pages_fan_out_only_after_a_full_first_page()
+    print("✅ Pagination tests passed")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test the memoized candidate query layer
+"""
+
+from services.ingestion import ingest_application
+from services.query_cache import QueryCache, run_candidate_query
+from services.search_index import SearchResults
+from services.sync_worker import DataSnapshot, _index
+
+JOBS = [
+    {"id": 1, "job_title": "Backend Developer"},
+    {"id": 2, "job_title": "Data Analyst"},
+]
+APPLICATIONS = [
+    {"id": 10, "job_id": 1, "job": {"job_title": "Backend Developer"}, "relevance_score": 70, "verdict": "Medium",
+     "resume_filename": "john_smith_resume.pdf", "application_date": "2025-09-02T10:00:00Z"},
+    {"id": 11, "job_id": 2, "job": {"job_title": "Data Analyst"}, "relevance_score": 90, "verdict": "High",
+     "resume_filename": "ana_lee_resume.pdf", "application_date": "2025-09-03T10:00:00Z"},
+    {"id": 12, "job_id": 1, "relevance_score": 85, "verdict": "High",
+     "resume_filename": "johanna_berg_resume.pdf"},
+]
+
+
+def make_snapshot(version=1):
+    candidates = {"candidates": [ingest_application(app) for app in APPLICATIONS], "total": len(APPLICATIONS)}
+    return DataSnapshot(version, {"jobs": JOBS, "candidates": candidates}, JOBS, {}, *_index(JOBS, candidates))
+
+
+def ids(records):
+    return [record.id for record in records]
+
+
+def test_filters_and_sorts():
+    snapshot = make_snapshot()
+    assert ids(run_candidate_query(snapshot)) == [10, 11, 12]
+    assert ids(run_candidate_query(snapshot, verdict="High")) == [11, 12]
+    assert ids(run_candidate_query(snapshot, job_id=1, sort="score")) == [12, 10]
+    # A title also matches applications that only carry the job id
+    assert ids(run_candidate_query(snapshot, role="Backend Developer")) == [10, 12]
+    assert ids(run_candidate_query(snapshot, search="joh", verdict="High")) == [12]
+    assert ids(run_candidate_query(snapshot, search="joh", job_id=1)) == [10, 12]
+    assert ids(run_candidate_query(snapshot, search="joh", job_id=2, verdict="High")) == []
+    assert ids(run_candidate_query(snapshot, sort="name")) == [11, 12, 10]
+    assert ids(run_candidate_query(snapshot, sort="newest")) == [11, 10, 12]
+
+
+def test_search_results_are_built_per_page():
+    snapshot = make_snapshot()
+    results = run_candidate_query(snapshot, search="resume")
+    assert isinstance(results, SearchResults) and len(results) == 3
+    assert ids(results[1:]) == [11, 12]
+    assert results[0].id == 10 and ids(results) == [10, 11, 12]
+
+
+def test_repeated_queries_hit_the_cache():
+    cache = QueryCache()
+    snapshot = make_snapshot()
+    first = cache.candidates(snapshot, search="John ", verdict="Medium")
+    assert cache.candidates(snapshot, search="  john", verdict="Medium") is first
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 1
+
+    # A new snapshot version never reuses older results
+    cache.candidates(make_snapshot(version=2), search="john", verdict="Medium")
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = QueryCache(max_entries=2)
+    snapshot = make_snapshot()
+    cache.candidates(snapshot, sort="score")
+    cache.candidates(snapshot, sort="name")
+    cache.candidates(snapshot, sort="score")
+    cache.candidates(snapshot, sort="newest")
+    assert cache.get_stats()["evictions"] == 1
+    cache.candidates(snapshot, sort="score")
+    assert cache.get_stats()["hits"] == 2
+
+
+if __name__ == "__main__":
+    test_filters_and_sorts()
+    test_search_results_are_built_per_page()
+    test_repeated_queries_hit_the_cache()
+    test_least_recently_used_entries_are_evicted()
+    print("✅ Query cache tests passed")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test the GET response cache and the health check against a local fake backend
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from services.api_service import BackendAPIService
+from services.resilience import RetryPolicy
+
+
+class FakeBackend:
+    """Local HTTP server answering every request with the current status and JSON body"""
+
+    def __init__(self):
+        self.status = 200
+        self.body = [{"id": 1, "job_title": "Backend Developer"}]
+        self.requests = []
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                backend.requests.append((self.command, self.path))
+                body = json.dumps(backend.body).encode()
+                self.send_response(backend.status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_GET
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_service(backend: FakeBackend, jobs_ttl: float = 60) -> BackendAPIService:
+    return BackendAPIService(backend.url, cache_ttls={'/jobs/': jobs_ttl}, retry_policy=RetryPolicy(max_attempts=1))
+
+
+def test_fresh_entries_are_served_until_the_ttl_expires():
+    backend = FakeBackend()
+    service = make_service(backend, jobs_ttl=0.2)
+    try:
+        assert service.get_jobs() == backend.body
+        assert service.get_jobs() == backend.body
+        assert len(backend.requests) == 1
+
+        time.sleep(0.25)
+        service.get_jobs()
+        assert len(backend.requests) == 2
+        assert service.response_cache.get_stats()["hits"] == 1
+    finally:
+        service.close()
+        backend.close()
+
+
+def test_writes_invalidate_cached_reads():
+    backend = FakeBackend()
+    service = make_service(backend)
+    try:
+        service.get_jobs()
+        backend.body = {"id": 2, "job_title": "Data Analyst"}
+        assert "error" not in service.create_job({"title": "Data Analyst", "requirements": []})
+
+        backend.body = [{"id": 1, "job_title": "Backend Developer"}, {"id": 2, "job_title": "Data Analyst"}]
+        assert service.get_jobs() == backend.body
+        assert [method for method, _ in backend.requests] == ['GET', 'POST', 'GET']
+    finally:
+        service.close()
+        backend.close()
+
+
+def test_health_check_is_not_served_from_the_cache():
+    backend = FakeBackend()
+    service = make_service(backend)
+    try:
+        service.get_jobs()  # Primes a fresh /jobs/ entry
+        assert service.health_check()["status"] == "healthy"
+
+        backend.status = 503
+        assert "error" in service.health_check()
+        assert service.get_jobs() == [{"id": 1, "job_title": "Backend Developer"}]  # Reads still use the cache
+    finally:
+        service.close()
+        backend.close()
+
+
+if __name__ == "__main__":
+    test_fresh_entries_are_served_until_the_ttl_expires()
+    test_writes_invalidate_cached_reads()
+    test_health_check_is_not_served_from_the_cache()
+    print("✅ Response cache tests passed")
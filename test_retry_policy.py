@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test the retry policy and process-wide retry budget
+"""
+
+import requests
+
+from services.resilience import RetryBudget, RetryPolicy
+
+
+def make_response(status_code: int, retry_after: str = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return response
+
+
+def test_only_idempotent_methods_are_retried():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry('GET', 0)
+    assert policy.should_retry('delete', 1, make_response(503))
+    assert not policy.should_retry('POST', 0)
+    assert not policy.should_retry('GET', 2), "max_attempts includes the first attempt"
+    assert not policy.should_retry('GET', 0, make_response(404))
+    assert not policy.should_retry('GET', 0, make_response(500))
+
+
+def test_backoff_uses_full_jitter_and_retry_after():
+    policy = RetryPolicy(base_delay=0.5, max_delay=3.0)
+    for attempt in range(6):
+        delay = policy.backoff(attempt)
+        assert 0 <= delay <= min(3.0, 0.5 * 2 ** attempt)
+
+    assert policy.backoff(0, make_response(429, '2')) == 2.0
+    assert not policy.should_retry('GET', 0, make_response(503, '120')), "Retry-After beyond max_delay gives up"
+    assert policy.should_retry('GET', 0, make_response(503, 'Wed, 21 Oct 2015 07:28:00 GMT'))
+    assert policy.backoff(0, make_response(503, 'Wed, 21 Oct 2015 07:28:00 GMT')) == 0.0
+
+
+def test_budget_caps_retries_to_a_fraction_of_requests():
+    budget = RetryBudget(ratio=0.1, min_retries=2, window=60)
+    for _ in range(50):
+        budget.record_request()
+
+    granted = sum(budget.try_acquire() for _ in range(20))
+    stats = budget.get_stats()
+    print(f"Retry budget stats: {stats}")
+    assert granted == 5
+    assert stats["denied_retries"] == 15
+
+
+if __name__ == "__main__":
+    test_only_idempotent_methods_are_retried()
+    test_backoff_uses_full_jitter_and_retry_after()
+    test_budget_caps_retries_to_a_fraction_of_requests()
+    print("✅ Retry policy tests passed")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test the ranked candidate search index
+"""
+
+from services.ingestion import ingest_application
+from services.search_index import CandidateSearchIndex, tokenize
+
+
+RAW = [
+    {"id": 1, "candidate_name": "John Smith", "resume_filename": "john_smith_cv.pdf", "missing_skills": ["Docker"]},
+    {"id": 2, "candidate_name": "Johnny Walker", "resume_filename": "jw_resume.pdf", "missing_skills": ["React"]},
+    {"id": 3, "candidate_name": "Maria Garcia", "resume_filename": "maria_garcia.docx",
+     "missing_skills": ["Kubernetes", "Node.js"]},
+    {"id": 4, "candidate_name": "Ana Smithers", "resume_filename": "ana_resume.pdf", "missing_skills": ["John"]},
+]
+
+
+def make_index():
+    return CandidateSearchIndex([ingest_application(app) for app in RAW])
+
+
+def ids(records):
+    return [record.id for record in records]
+
+
+def test_exact_and_prefix_matches_are_ranked():
+    index = make_index()
+    # Whole-token name hit first, then prefix name hit, then the skill hit
+    assert ids(index.search("john")) == [1, 2, 4]
+    assert ids(index.search("smi")) == [1, 4]
+    assert ids(index.search("SMITH")) == [1, 4]
+
+
+def test_every_query_token_must_match():
+    index = make_index()
+    assert ids(index.search("john smith")) == [1, 4]
+    assert ids(index.search("maria kub")) == [3]
+    assert index.search("john garcia") == []
+
+
+def test_resume_filename_and_skills_are_searchable():
+    index = make_index()
+    assert ids(index.search("jw")) == [2]
+    assert ids(index.search("node")) == [3]
+    assert ids(index.search("docker")) == [1]
+
+
+def test_typos():
+    index = make_index()
+    assert ids(index.search("jhon")) == [1, 4]  # Transposition
+    assert ids(index.search("garcya")) == [3]  # Substitution
+    assert ids(index.search("kubernets")) == [3]  # Deletion
+    assert index.search("jon") == []  # Too short to correct
+
+
+def test_empty_query_and_empty_index():
+    index = make_index()
+    assert ids(index.search("  ")) == [1, 2, 3, 4]
+    assert ids(index.search("", limit=2)) == [1, 2]
+    assert CandidateSearchIndex([]).search("john") == []
+    assert tokenize("Node.js / AWS") == ["node", "js", "aws"]
+
+
+def test_extended_index_matches_a_full_build():
+    records = [ingest_application(app) for app in RAW]
+    full = CandidateSearchIndex(records)
+
+    appended = CandidateSearchIndex(records[:1])
+    for record in records[1:]:
+        appended = appended.extended([record])
+    prepended = CandidateSearchIndex(records[3:]).extended(records[1:3], prepend=True).extended(records[:1], prepend=True)
+
+    for index in (appended, prepended):
+        assert index.candidates == full.candidates
+        for query in ("john", "smi", "jhon", "node", "", "john smith"):
+            assert ids(index.search(query)) == ids(full.search(query)), query
+    assert len(appended._segments) == 1  # Four one-record runs merge like a binary counter
+    assert appended.extended([]) is appended
+
+
+if __name__ == "__main__":
+    test_exact_and_prefix_matches_are_ranked()
+    test_every_query_token_must_match()
+    test_resume_filename_and_skills_are_searchable()
+    test_typos()
+    test_empty_query_and_empty_index()
+    test_extended_index_matches_a_full_build()
+    print("✅ Search index tests passed")
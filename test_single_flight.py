@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test coalescing of concurrent identical calls
+"""
+
+import threading
+import time
+
+from services.single_flight import SingleFlight
+
+
+def run_concurrently(group: SingleFlight, key: str, func, callers: int = 5):
+    """Start threads calling group.do; results and errors fill in as they finish"""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(group.do(key, func))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def wait_for_waiters(group: SingleFlight, key: str, waiters: int):
+    """Block until that many callers have joined the call in flight for key"""
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        with group._lock:
+            call = group._calls.get(key)
+            if call is not None and call.waiters == waiters:
+                return
+        time.sleep(0.001)
+    raise AssertionError(f"{waiters} callers never joined the call for {key}")
+
+
+def test_concurrent_calls_share_one_execution():
+    group = SingleFlight()
+    release = threading.Event()
+    executions = []
+
+    def fetch():
+        executions.append(1)
+        release.wait(5)
+        return {"jobs": [1, 2]}
+
+    threads, results, errors = run_concurrently(group, "GET /jobs/", fetch)
+    wait_for_waiters(group, "GET /jobs/", 4)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(executions) == 1 and not errors
+    assert len(results) == 5 and all(result is results[0] for result in results)
+    assert group.get_stats()["coalesced"] == 4 and group.get_stats()["in_flight"] == 0
+
+    # Once the call finished, the next one runs again
+    group.do("GET /jobs/", fetch)
+    assert len(executions) == 2
+
+
+def test_errors_reach_every_waiter():
+    group = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise ConnectionError("backend down")
+
+    threads, results, errors = run_concurrently(group, "GET /metrics/", fail, callers=3)
+    wait_for_waiters(group, "GET /metrics/", 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert not results and len(errors) == 3
+    assert all(isinstance(error, ConnectionError) for error in errors)
+
+
+def test_different_keys_do_not_wait_on_each_other():
+    group = SingleFlight()
+    assert group.do("GET /jobs/", lambda: 1) == 1
+    assert group.do("GET /metrics/", lambda: 2) == 2
+    assert group.get_stats()["executed"] == 2 and group.get_stats()["coalesced"] == 0
+
+
+if __name__ == "__main__":
+    test_concurrent_calls_share_one_execution()
+    test_errors_reach_every_waiter()
+    test_different_keys_do_not_wait_on_each_other()
+    print("✅ Single-flight tests passed")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test wire versus decoded byte counting for compressed responses
+"""
+
+import gzip
+import io
+import json
+
+import requests
+from urllib3.response import HTTPResponse
+
+from services.transfer_stats import SUPPORTED_ENCODINGS, TransferStats
+
+BODY = json.dumps([{"id": i, "feedback": "Strong Python background " * 4} for i in range(200)]).encode()
+
+
+def make_response(body: bytes, encoding: str = None) -> requests.Response:
+    """A streamed response whose raw body is decoded by urllib3, as the session would get it"""
+    headers = {'Content-Encoding': encoding} if encoding else {}
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers)
+    response.raw = HTTPResponse(body=io.BytesIO(body), headers=headers, preload_content=False, decode_content=True)
+    return response
+
+
+def test_compressed_chunks_are_counted_once_consumed():
+    stats = TransferStats()
+    response = make_response(gzip.compress(BODY), 'gzip')
+    chunks = stats.count_chunks('/applications/', response, response.iter_content(chunk_size=1024))
+    assert b''.join(chunks) == BODY
+
+    counters = stats.get_stats()["endpoints"]["/applications/"]
+    assert counters["responses"] == 1 and counters["compressed_responses"] == 1
+    assert counters["decoded_bytes"] == len(BODY)
+    assert counters["wire_bytes"] == len(gzip.compress(BODY))
+    assert counters["saved_ratio"] > 0.9
+
+
+def test_uncompressed_responses_save_nothing():
+    stats = TransferStats()
+    response = make_response(BODY)
+    assert response.json()[0]["id"] == 0
+    stats.record_response('/jobs/', response)
+    stats.record_response('/jobs/', response)
+
+    counters = stats.get_stats()["endpoints"]["/jobs/"]
+    assert counters["responses"] == 2 and counters["compressed_responses"] == 0
+    assert counters["wire_bytes"] == counters["decoded_bytes"] == 2 * len(BODY)
+    assert counters["saved_ratio"] == 0.0
+
+    stats.reset()
+    assert stats.get_stats()["endpoints"] == {}
+
+
+def test_supported_encodings_follow_installed_decoders():
+    assert 'gzip' in SUPPORTED_ENCODINGS
+    for encoding, module in (('br', 'brotli'), ('zstd', 'zstandard')):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        assert encoding in SUPPORTED_ENCODINGS
+
+
+if __name__ == "__main__":
+    test_compressed_chunks_are_counted_once_consumed()
+    test_uncompressed_responses_save_nothing()
+    test_supported_encodings_follow_installed_decoders()
+    print("✅ Transfer stats tests passed")